@@ -1,4 +1,5 @@
-from typing import Union
+from operator import mul
+from typing import Iterator, Union
 
 
 class Adler32:
@@ -7,6 +8,7 @@ class Adler32:
     """
 
     MOD_ADLER = 65521  # Largest prime number smaller than 2^16
+    NMAX = 5552  # Largest block whose sums stay below 2^32 before reducing (as in zlib)
 
     def __init__(self):
         """
@@ -15,22 +17,35 @@ class Adler32:
         self._a = 1
         self._b = 0
 
-    def update(self, data: Union[bytes, bytearray]) -> None:
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
         """
         Update the Adler-32 checksum with new data.
 
+        The data is processed in blocks of at most NMAX bytes. For a block of
+        n bytes, a grows by the byte sum and b by n * a plus the byte sum
+        weighted n, n - 1, ..., 1; both are reduced modulo 65521 once per
+        block instead of once per byte.
+
         Args:
-            data (Union[bytes, bytearray]): The input data to compute the checksum for.
+            data (Union[bytes, bytearray, memoryview]): The input data to compute the checksum for.
 
         Raises:
-            TypeError: If the input data is not of the type bytes or bytearray.
+            TypeError: If the input data is not of the type bytes, bytearray or memoryview.
         """
-        if not isinstance(data, (bytes, bytearray)):
-            raise TypeError("Input data must be of type bytes or bytearray.")
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Input data must be of type bytes, bytearray or memoryview.")
+
+        data = memoryview(data).cast("B")
+        a, b = self._a, self._b
+        mod, nmax = self.MOD_ADLER, self.NMAX
 
-        for byte in data:
-            self._a = (self._a + byte) % self.MOD_ADLER
-            self._b = (self._b + self._a) % self.MOD_ADLER
+        for start in range(0, len(data), nmax):
+            block = data[start : start + nmax]
+            n = len(block)
+            b = (b + n * a + sum(map(mul, block, range(n, 0, -1)))) % mod
+            a = (a + sum(block)) % mod
+
+        self._a, self._b = a, b
 
     def digest(self) -> int:
         """
@@ -56,3 +71,125 @@ class Adler32:
         """
         self._a = 1
         self._b = 0
+
+    @classmethod
+    def combine(cls, checksum1: int, checksum2: int, length2: int) -> int:
+        """
+        Combine the checksums of two segments into the checksum of both.
+
+        Lets segments of a large input be checksummed independently (e.g. in
+        parallel) and merged in order afterwards.
+
+        Args:
+            checksum1 (int): The Adler-32 checksum of the first segment.
+            checksum2 (int): The Adler-32 checksum of the second segment.
+            length2 (int): The length of the second segment in bytes.
+
+        Returns:
+            int: The Adler-32 checksum of the first segment followed by the second.
+
+        Raises:
+            ValueError: If length2 is negative.
+        """
+        if length2 < 0:
+            raise ValueError("length2 must not be negative.")
+
+        mod = cls.MOD_ADLER
+        a1, b1 = checksum1 & 0xFFFF, checksum1 >> 16
+        a2, b2 = checksum2 & 0xFFFF, checksum2 >> 16
+
+        a = (a1 + a2 - 1) % mod
+        b = (b1 + b2 + (length2 % mod) * (a1 - 1)) % mod
+        return (b << 16) | a
+
+
+class RollingAdler32:
+    """
+    An Adler-32 checksum over a fixed-size window that slides one byte at a time.
+
+    As in rsync, moving the window costs O(1): the outgoing byte is removed
+    from both sums and the incoming byte added, without rescanning the window.
+    """
+
+    MOD_ADLER = Adler32.MOD_ADLER
+
+    def __init__(self, window: Union[bytes, bytearray, memoryview]):
+        """
+        Initialize the rolling checksum with the first window.
+
+        Args:
+            window (Union[bytes, bytearray, memoryview]): The initial window contents;
+                its length fixes the window size.
+
+        Raises:
+            TypeError: If the window is not of the type bytes, bytearray or memoryview.
+        """
+        adler32 = Adler32()
+        adler32.update(window)
+        self._a = adler32._a
+        self._b = adler32._b
+        self.size = len(memoryview(window).cast("B"))
+
+    def roll(self, out_byte: int, in_byte: int) -> None:
+        """
+        Slide the window forward by one byte.
+
+        Args:
+            out_byte (int): The byte leaving the window (its first byte).
+            in_byte (int): The byte entering the window.
+        """
+        mod = self.MOD_ADLER
+        self._a = (self._a - out_byte + in_byte) % mod
+        self._b = (self._b - self.size * out_byte + self._a - 1) % mod
+
+    def digest(self) -> int:
+        """
+        Return the Adler-32 checksum of the current window as an integer.
+
+        Returns:
+            int: The Adler-32 checksum of the current window.
+        """
+        return (self._b << 16) | self._a
+
+    def hexdigest(self) -> str:
+        """
+        Return the Adler-32 checksum of the current window as a hexadecimal string.
+
+        Returns:
+            str: The Adler-32 checksum in hexadecimal format.
+        """
+        return f"{self.digest():08x}".upper()
+
+    @classmethod
+    def scan(
+        cls, data: Union[bytes, bytearray, memoryview], size: int
+    ) -> Iterator[int]:
+        """
+        Yield the Adler-32 checksum of every window of the given size in data.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): The data to scan.
+            size (int): The window size in bytes.
+
+        Yields:
+            int: The checksum of data[i:i + size], for i = 0, 1, ..., len(data) - size.
+
+        Raises:
+            ValueError: If the window size is not positive.
+        """
+        if size < 1:
+            raise ValueError("size must be positive.")
+
+        data = memoryview(data).cast("B")
+        if len(data) < size:
+            return
+
+        mod = cls.MOD_ADLER
+        rolling = cls(data[:size])
+        a, b = rolling._a, rolling._b
+        yield (b << 16) | a
+
+        for out_byte, in_byte in zip(data, data[size:]):
+            a = (a - out_byte + in_byte) % mod
+            b = (b - size * out_byte + a - 1) % mod
+            yield (b << 16) | a
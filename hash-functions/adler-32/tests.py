@@ -1,5 +1,6 @@
 import unittest
-from adler32 import Adler32
+import zlib
+from adler32 import Adler32, RollingAdler32
 
 
 class TestAdler32(unittest.TestCase):
@@ -97,6 +98,57 @@ class TestAdler32(unittest.TestCase):
             "Checksum for 'Hello, World!' should be 0x1F9E046A even with multiple updates",
         )
 
+    def test_block_boundaries(self):
+        """
+        Test inputs around the NMAX block size, where the sums are reduced.
+        """
+        for length in (Adler32.NMAX - 1, Adler32.NMAX, Adler32.NMAX + 1, 3 * Adler32.NMAX):
+            data = b"\xff" * length
+            adler32 = Adler32()
+            adler32.update(memoryview(data))
+            self.assertEqual(adler32.digest(), zlib.adler32(data))
+
+    def test_combine(self):
+        """
+        Test that combining segment checksums gives the checksum of the whole input.
+        """
+        data = bytes(range(256)) * 50
+        for split in (0, 1, 1000, len(data)):
+            first, second = Adler32(), Adler32()
+            first.update(data[:split])
+            second.update(data[split:])
+            self.assertEqual(
+                Adler32.combine(first.digest(), second.digest(), len(data) - split),
+                zlib.adler32(data),
+            )
+
+
+class TestRollingAdler32(unittest.TestCase):
+    """
+    A test suite for the RollingAdler32 class.
+    """
+
+    def test_roll(self):
+        """
+        Test that rolling the window matches checksumming each window afresh.
+        """
+        data = bytes(range(256)) * 4
+        rolling = RollingAdler32(data[:32])
+        for i in range(len(data) - 32):
+            rolling.roll(data[i], data[i + 32])
+            self.assertEqual(rolling.digest(), zlib.adler32(data[i + 1 : i + 33]))
+
+    def test_scan(self):
+        """
+        Test that scan() yields the checksum of every window in order.
+        """
+        data = b"The quick brown fox jumps over the lazy dog" * 20
+        expected = [zlib.adler32(data[i : i + 64]) for i in range(len(data) - 63)]
+        self.assertEqual(list(RollingAdler32.scan(data, 64)), expected)
+        self.assertEqual(list(RollingAdler32.scan(b"short", 64)), [])
+        with self.assertRaises(ValueError):
+            list(RollingAdler32.scan(data, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import argparse
+import time
+from typing import List, Tuple
+
+from bloom_filter import BloomFilter, CountingBloomFilter
+
+
+def benchmark_filter(
+    bloom: BloomFilter, keys: List[str], probes: List[str]
+) -> Tuple[float, float, float]:
+    """
+    Insert keys into a filter and probe it with keys that were never inserted.
+
+    Args:
+        bloom (BloomFilter): The empty filter.
+        keys (List[str]): The keys to insert.
+        probes (List[str]): Keys disjoint from keys.
+
+    Returns:
+        Tuple[float, float, float]: Inserts per second, queries per second and
+            the measured false-positive rate.
+    """
+    start = time.perf_counter()
+    bloom.add_many(keys)
+    insert_rate = len(keys) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    results = bloom.contains_many(probes)
+    query_rate = len(probes) / (time.perf_counter() - start)
+    return insert_rate, query_rate, sum(results) / len(probes)
+
+
+def main():
+    """
+    Compare the measured false-positive rate of the filters with their target.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Bloom filters.")
+    parser.add_argument(
+        "--capacity", type=int, default=100000, help="Number of keys inserted (default 100000)."
+    )
+    parser.add_argument(
+        "--probes", type=int, default=100000, help="Number of absent keys queried (default 100000)."
+    )
+    parser.add_argument(
+        "--error-rates",
+        type=float,
+        nargs="+",
+        default=[0.1, 0.01, 0.001],
+        help="Target false-positive rates (default 0.1 0.01 0.001).",
+    )
+    args = parser.parse_args()
+
+    keys = [f"key:{i}" for i in range(args.capacity)]
+    probes = [f"probe:{i}" for i in range(args.probes)]
+    print(
+        f"{'filter':>28} {'target':>8} {'measured':>9} {'cells/key':>9} {'k':>3}"
+        f" {'inserts/s':>11} {'queries/s':>11}"
+    )
+
+    for cls in (BloomFilter, CountingBloomFilter):
+        for vectorize in (False, True):
+            for error_rate in args.error_rates:
+                bloom = cls.for_capacity(args.capacity, error_rate, vectorize=vectorize)
+                insert_rate, query_rate, measured = benchmark_filter(bloom, keys, probes)
+                name = f"{cls.__name__}/{'numpy' if bloom.vectorize else 'python'}"
+                print(
+                    f"{name:>28} {error_rate:8.4f} {measured:9.4f}"
+                    f" {bloom.size / args.capacity:9.2f} {bloom.num_hashes:3}"
+                    f" {insert_rate:11.0f} {query_rate:11.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+import math
+import mmap
+import os
+import struct
+import sys
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized batch path needs it
+    np = None
+
+# The shared loader for modules in the other algorithm directories lives in
+# the hash-functions directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from siblings import load_module  # noqa: E402
+
+MurmurHash = load_module("murmur-hash", "murmur").MurmurHash
+# murmur_vectorized imports murmur by name, which the loader has registered
+VectorizedMurmurHash = (
+    load_module("murmur-hash", "murmur_vectorized").VectorizedMurmurHash
+    if np is not None
+    else None
+)
+
+# File header: magic, number of hash functions, number of cells, number of
+# insertions and the two MurmurHash seeds. It is 32 bytes long, so the cells
+# that follow it start 8-byte aligned.
+_HEADER = struct.Struct("<4sIQQII")
+
+
+def _encode(key: Union[str, bytes]) -> bytes:
+    """
+    Convert a key to bytes.
+
+    Args:
+        key (Union[str, bytes]): The key. Strings are encoded as UTF-8.
+
+    Returns:
+        bytes: The key as bytes.
+
+    Raises:
+        TypeError: If the key is not a string or bytes.
+    """
+    if isinstance(key, str):
+        return key.encode("utf-8")
+    if not isinstance(key, bytes):
+        raise TypeError("Key must be a string or bytes.")
+    return key
+
+
+class BloomFilter:
+    """
+    A Bloom filter backed by a bit array.
+
+    The k cell indices of a key are derived from two MurmurHash3 values
+    with Kirsch-Mitzenmacher double hashing, g_i = (h1 + i * h2) mod m,
+    so every key is hashed twice whatever k is.
+    """
+
+    MAGIC = b"BLMF"
+    # Default MurmurHash seeds for h1 and h2
+    SEEDS = (0, 0x9747B28C)
+    # Batches at least this long use the NumPy path
+    NUMPY_THRESHOLD = 256
+
+    def __init__(
+        self,
+        size: int,
+        num_hashes: int,
+        seeds: Tuple[int, int] = SEEDS,
+        vectorize: bool = True,
+    ) -> None:
+        """
+        Initialize an empty filter.
+
+        Args:
+            size (int): Number of cells (bits).
+            num_hashes (int): Number of cells set per key.
+            seeds (Tuple[int, int]): The MurmurHash seeds of h1 and h2.
+            vectorize (bool): Whether large batches may use the NumPy path. Default is True.
+
+        Raises:
+            ValueError: If size or num_hashes is not positive, or a seed is not an
+                unsigned 32-bit integer.
+        """
+        if size < 1 or num_hashes < 1:
+            raise ValueError("size and num_hashes must be positive.")
+        if len(seeds) != 2 or not all(0 <= seed <= 0xFFFFFFFF for seed in seeds):
+            raise ValueError("seeds must be two unsigned 32-bit integers.")
+
+        self.size = size
+        self.num_hashes = num_hashes
+        self.seeds = tuple(seeds)
+        self.vectorize = vectorize and np is not None
+        self.count = 0
+        self._cells: Union[bytearray, memoryview] = bytearray(self._cells_length(size))
+        self._mmap: Optional[mmap.mmap] = None
+        self._hash1 = MurmurHash(self.seeds[0]).hash
+        self._hash2 = MurmurHash(self.seeds[1]).hash
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.01, **kwargs) -> "BloomFilter":
+        """
+        Create a filter sized for a number of keys and a target false-positive rate.
+
+        Args:
+            capacity (int): Expected number of keys.
+            error_rate (float): Target false-positive rate. Default is 0.01.
+            **kwargs: Further arguments for the constructor.
+
+        Returns:
+            BloomFilter: The empty filter.
+
+        Raises:
+            ValueError: If capacity is not positive or error_rate is not in (0, 1).
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+
+        # m = -n ln(p) / ln(2)^2 and k = (m / n) ln(2)
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(size / capacity * math.log(2)))
+        return cls(size, num_hashes, **kwargs)
+
+    @staticmethod
+    def _cells_length(size: int) -> int:
+        """Number of bytes holding the given number of cells."""
+        return (size + 7) // 8
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, key: Union[str, bytes]) -> bool:
+        return self.contains(key)
+
+    def _indices(self, key: Union[str, bytes]) -> List[int]:
+        """
+        Compute the cell indices of a key.
+
+        Args:
+            key (Union[str, bytes]): The key.
+
+        Returns:
+            List[int]: The num_hashes cell indices.
+
+        Raises:
+            TypeError: If the key is not a string or bytes.
+        """
+        key = _encode(key)
+        h1, h2, size = self._hash1(key), self._hash2(key), self.size
+        return [(h1 + i * h2) % size for i in range(self.num_hashes)]
+
+    def _indices_many(self, keys: List[bytes]) -> "np.ndarray":
+        """
+        Compute the cell indices of many keys with NumPy.
+
+        Args:
+            keys (List[bytes]): The encoded keys.
+
+        Returns:
+            np.ndarray: An (N, num_hashes) uint64 array; row i holds the indices of key i.
+        """
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, keys), dtype=np.int64, count=len(keys)), out=offsets[1:])
+        data = b"".join(keys)
+
+        h1 = VectorizedMurmurHash(self.seeds[0]).hash_offsets(offsets, data).astype(np.uint64)
+        h2 = VectorizedMurmurHash(self.seeds[1]).hash_offsets(offsets, data).astype(np.uint64)
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        return (h1[:, None] + steps * h2[:, None]) % np.uint64(self.size)
+
+    def _use_numpy(self, keys: List[bytes]) -> bool:
+        """Whether a batch is large enough for the NumPy path."""
+        return self.vectorize and len(keys) >= self.NUMPY_THRESHOLD
+
+    def add(self, key: Union[str, bytes]) -> None:
+        """
+        Insert a key.
+
+        Args:
+            key (Union[str, bytes]): The key.
+
+        Raises:
+            TypeError: If the key is not a string or bytes.
+        """
+        cells = self._cells
+        for index in self._indices(key):
+            cells[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def contains(self, key: Union[str, bytes]) -> bool:
+        """
+        Test whether a key may have been inserted.
+
+        Args:
+            key (Union[str, bytes]): The key.
+
+        Returns:
+            bool: False if the key was certainly not inserted, True if it probably was.
+
+        Raises:
+            TypeError: If the key is not a string or bytes.
+        """
+        cells = self._cells
+        return all(cells[index >> 3] >> (index & 7) & 1 for index in self._indices(key))
+
+    def add_many(self, keys: Iterable[Union[str, bytes]]) -> None:
+        """
+        Insert many keys.
+
+        Args:
+            keys (Iterable[Union[str, bytes]]): The keys.
+
+        Raises:
+            TypeError: If a key is not a string or bytes.
+        """
+        keys = [_encode(key) for key in keys]
+        if self._use_numpy(keys):
+            indices = self._indices_many(keys).ravel()
+            cells = np.frombuffer(self._cells, dtype=np.uint8)
+            masks = np.left_shift(1, indices & np.uint64(7)).astype(np.uint8)
+            np.bitwise_or.at(cells, indices >> np.uint64(3), masks)
+            self.count += len(keys)
+        else:
+            for key in keys:
+                self.add(key)
+
+    def contains_many(self, keys: Iterable[Union[str, bytes]]) -> List[bool]:
+        """
+        Test many keys.
+
+        Args:
+            keys (Iterable[Union[str, bytes]]): The keys.
+
+        Returns:
+            List[bool]: The result of contains() for each key, in the order of the keys.
+
+        Raises:
+            TypeError: If a key is not a string or bytes.
+        """
+        keys = [_encode(key) for key in keys]
+        if self._use_numpy(keys):
+            indices = self._indices_many(keys)
+            cells = np.frombuffer(self._cells, dtype=np.uint8)
+            bits = (cells[indices >> np.uint64(3)] >> (indices & np.uint64(7)).astype(np.uint8)) & 1
+            return bits.all(axis=1).tolist()
+        return [self.contains(key) for key in keys]
+
+    def false_positive_rate(self) -> float:
+        """
+        Estimate the false-positive rate from the number of insertions.
+
+        Returns:
+            float: (1 - e^(-kn/m))^k.
+        """
+        k = self.num_hashes
+        return (1 - math.exp(-k * self.count / self.size)) ** k
+
+    def _header(self) -> bytes:
+        """Pack the file header."""
+        return _HEADER.pack(self.MAGIC, self.num_hashes, self.size, self.count, *self.seeds)
+
+    def save(self, path: str) -> None:
+        """
+        Write the filter to a file that load() can memory-map.
+
+        Args:
+            path (str): The file path.
+        """
+        header = self._header()
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(self._cells)
+
+    @classmethod
+    def load(
+        cls, path: str, mmap_mode: Optional[str] = None, vectorize: bool = True
+    ) -> "BloomFilter":
+        """
+        Read a filter written by save().
+
+        Args:
+            path (str): The file path.
+            mmap_mode (Optional[str]): None to read the cells into memory, "r" to
+                map the file read-only, or "r+" to map it so that insertions are
+                written back to the file. Default is None.
+            vectorize (bool): Whether large batches may use the NumPy path. Default is True.
+
+        Returns:
+            BloomFilter: The filter. Call close() on a mapped filter when done.
+
+        Raises:
+            ValueError: If the file is not a filter of this class or mmap_mode is unknown.
+        """
+        if mmap_mode not in (None, "r", "r+"):
+            raise ValueError("mmap_mode must be None, 'r' or 'r+'.")
+
+        with open(path, "rb" if mmap_mode != "r+" else "r+b") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError("File is too short for a filter header.")
+            magic, num_hashes, size, count, seed1, seed2 = _HEADER.unpack(header)
+            if magic != cls.MAGIC:
+                raise ValueError(f"Not a {cls.__name__} file.")
+
+            bloom = cls(1, num_hashes, (seed1, seed2), vectorize)
+            bloom.size, bloom.count = size, count
+            length = cls._cells_length(size)
+            if mmap_mode is None:
+                cells = bytearray(f.read(length))
+                if len(cells) != length:
+                    raise ValueError("File is truncated.")
+                bloom._cells = cells
+            else:
+                access = mmap.ACCESS_READ if mmap_mode == "r" else mmap.ACCESS_WRITE
+                mapped = mmap.mmap(f.fileno(), 0, access=access)
+                if len(mapped) < _HEADER.size + length:
+                    mapped.close()
+                    raise ValueError("File is truncated.")
+                bloom._mmap = mapped
+                bloom._cells = memoryview(mapped)[_HEADER.size : _HEADER.size + length]
+        return bloom
+
+    def flush(self) -> None:
+        """
+        Write the insertion count and cells of a filter mapped with "r+" back to its file.
+        """
+        if self._mmap is not None and not self._cells.readonly:
+            self._mmap[: _HEADER.size] = self._header()
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flush and unmap a filter loaded with mmap_mode; a no-op otherwise.
+        """
+        if self._mmap is None:
+            return
+        self.flush()
+        self._cells.release()
+        self._mmap.close()
+        self._cells = bytearray()
+        self._mmap = None
+
+    def __enter__(self) -> "BloomFilter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class CountingBloomFilter(BloomFilter):
+    """
+    A Bloom filter with an 8-bit counter per cell, so keys can be removed.
+
+    Counters saturate at 255; a saturated counter is never decremented, so
+    removals can't cause false negatives.
+    """
+
+    MAGIC = b"CBLM"
+    MAX_COUNT = 255
+
+    @staticmethod
+    def _cells_length(size: int) -> int:
+        """Number of bytes holding the given number of cells."""
+        return size
+
+    def add(self, key: Union[str, bytes]) -> None:
+        """
+        Insert a key.
+
+        Args:
+            key (Union[str, bytes]): The key.
+
+        Raises:
+            TypeError: If the key is not a string or bytes.
+        """
+        cells, max_count = self._cells, self.MAX_COUNT
+        for index in self._indices(key):
+            if cells[index] < max_count:
+                cells[index] += 1
+        self.count += 1
+
+    def contains(self, key: Union[str, bytes]) -> bool:
+        """
+        Test whether a key may have been inserted.
+
+        Args:
+            key (Union[str, bytes]): The key.
+
+        Returns:
+            bool: False if the key was certainly not inserted, True if it probably was.
+
+        Raises:
+            TypeError: If the key is not a string or bytes.
+        """
+        cells = self._cells
+        return all(cells[index] for index in self._indices(key))
+
+    def remove(self, key: Union[str, bytes]) -> None:
+        """
+        Remove a key that was inserted.
+
+        Args:
+            key (Union[str, bytes]): The key.
+
+        Raises:
+            TypeError: If the key is not a string or bytes.
+            KeyError: If the key is certainly not in the filter.
+        """
+        # Double hashing can repeat an index (when h2 is a multiple of the
+        # size), in which case add() incremented that counter more than once
+        repeats = Counter(self._indices(key))
+        cells, max_count = self._cells, self.MAX_COUNT
+        if any(cells[index] < times for index, times in repeats.items()):
+            raise KeyError(key)
+        for index, times in repeats.items():
+            if cells[index] < max_count:
+                cells[index] -= times
+        self.count -= 1
+
+    def add_many(self, keys: Iterable[Union[str, bytes]]) -> None:
+        """
+        Insert many keys.
+
+        Args:
+            keys (Iterable[Union[str, bytes]]): The keys.
+
+        Raises:
+            TypeError: If a key is not a string or bytes.
+        """
+        keys = [_encode(key) for key in keys]
+        if self._use_numpy(keys):
+            indices, counts = np.unique(self._indices_many(keys), return_counts=True)
+            cells = np.frombuffer(self._cells, dtype=np.uint8)
+            cells[indices] = np.minimum(cells[indices] + counts, self.MAX_COUNT)
+            self.count += len(keys)
+        else:
+            for key in keys:
+                self.add(key)
+
+    def contains_many(self, keys: Iterable[Union[str, bytes]]) -> List[bool]:
+        """
+        Test many keys.
+
+        Args:
+            keys (Iterable[Union[str, bytes]]): The keys.
+
+        Returns:
+            List[bool]: The result of contains() for each key, in the order of the keys.
+
+        Raises:
+            TypeError: If a key is not a string or bytes.
+        """
+        keys = [_encode(key) for key in keys]
+        if self._use_numpy(keys):
+            cells = np.frombuffer(self._cells, dtype=np.uint8)
+            return (cells[self._indices_many(keys)] != 0).all(axis=1).tolist()
+        return [self.contains(key) for key in keys]
@@ -0,0 +1,33 @@
+import os
+
+from bloom_filter import BloomFilter, CountingBloomFilter
+from utils import setup_argparser
+
+
+def main():
+    """
+    Main function to insert keys into a Bloom filter and query it.
+    """
+    parser = setup_argparser()
+    args = parser.parse_args()
+
+    try:
+        cls = CountingBloomFilter if args.counting else BloomFilter
+        if args.file and os.path.exists(args.file):
+            bloom = cls.load(args.file)
+        else:
+            bloom = cls.for_capacity(args.capacity, args.error_rate)
+
+        bloom.add_many(args.add)
+        if args.file and args.add:
+            bloom.save(args.file)
+
+        for key, found in zip(args.query, bloom.contains_many(args.query)):
+            print(f"{key}: {'probably present' if found else 'absent'}")
+        print(f"Keys: {len(bloom)}, estimated false-positive rate: {bloom.false_positive_rate():.6f}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
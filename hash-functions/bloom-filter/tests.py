@@ -0,0 +1,155 @@
+import os
+import tempfile
+import unittest
+
+from bloom_filter import BloomFilter, CountingBloomFilter, MurmurHash
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestBloomFilter(unittest.TestCase):
+    """
+    Test cases for the Bloom filter and counting Bloom filter.
+    """
+
+    def setUp(self):
+        self.keys = [f"key:{i}" for i in range(2000)]
+        self.absent = [f"absent:{i}" for i in range(5000)]
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "filter.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_sizing(self):
+        """
+        Test the size and hash count derived from the capacity and error rate.
+        """
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        self.assertEqual(bloom.size, 9586)
+        self.assertEqual(bloom.num_hashes, 7)
+        with self.assertRaises(ValueError):
+            BloomFilter.for_capacity(1000, 1.5)
+        with self.assertRaises(ValueError):
+            BloomFilter(0, 3)
+        with self.assertRaises(ValueError):
+            BloomFilter(100, 3, seeds=(-1, 2))
+        with self.assertRaises(ValueError):
+            BloomFilter(100, 3, seeds=(1, 1 << 32))
+
+    def test_double_hashing(self):
+        """
+        Test that the cell indices are (h1 + i * h2) mod m over two MurmurHash seeds.
+        """
+        bloom = BloomFilter(1000, 5, seeds=(1, 2))
+        h1, h2 = MurmurHash(1).hash("hello"), MurmurHash(2).hash("hello")
+        self.assertEqual(bloom._indices("hello"), [(h1 + i * h2) % 1000 for i in range(5)])
+        self.assertEqual(bloom._indices("hello"), bloom._indices(b"hello"))
+        with self.assertRaises(TypeError):
+            bloom.add(123)
+
+    def test_membership(self):
+        """
+        Test that there are no false negatives and the false-positive rate is near its target.
+        """
+        for cls in (BloomFilter, CountingBloomFilter):
+            bloom = cls.for_capacity(len(self.keys), 0.01, vectorize=False)
+            for key in self.keys:
+                bloom.add(key)
+            self.assertEqual(len(bloom), len(self.keys))
+            self.assertTrue(all(key in bloom for key in self.keys))
+            measured = sum(bloom.contains(key) for key in self.absent) / len(self.absent)
+            self.assertLess(measured, 0.03)
+            self.assertAlmostEqual(bloom.false_positive_rate(), 0.01, delta=0.002)
+
+    @unittest.skipIf(np is None, "NumPy is not installed.")
+    def test_numpy_path_agrees(self):
+        """
+        Test that the NumPy batch path builds and queries the same cells as the Python one.
+        """
+        for cls in (BloomFilter, CountingBloomFilter):
+            fast = cls.for_capacity(len(self.keys), 0.01)
+            slow = cls.for_capacity(len(self.keys), 0.01, vectorize=False)
+            fast.add_many(self.keys + self.keys[:10])
+            slow.add_many(self.keys + self.keys[:10])
+            self.assertEqual(bytes(fast._cells), bytes(slow._cells))
+            self.assertEqual(fast.contains_many(self.absent), slow.contains_many(self.absent))
+            self.assertTrue(all(fast.contains_many(self.keys)))
+
+    def test_counting_remove(self):
+        """
+        Test that removing keys from a counting filter keeps the other keys.
+        """
+        bloom = CountingBloomFilter.for_capacity(len(self.keys), 0.01)
+        bloom.add_many(self.keys)
+        for key in self.keys[:1000]:
+            bloom.remove(key)
+        self.assertEqual(len(bloom), 1000)
+        self.assertTrue(all(bloom.contains_many(self.keys[1000:])))
+        self.assertLess(sum(bloom.contains_many(self.keys[:1000])), 50)
+
+        bloom = CountingBloomFilter(100, 3)
+        with self.assertRaises(KeyError):
+            bloom.remove("missing")
+        for _ in range(300):
+            bloom.add("hot")
+        for _ in range(300):
+            bloom.remove("hot")
+        # Saturated counters are never decremented
+        self.assertIn("hot", bloom)
+
+    def test_counting_remove_repeated_indices(self):
+        """
+        Test removing a key whose double-hashing indices repeat.
+        """
+        bloom = CountingBloomFilter(7, 3)
+        self.assertEqual(bloom._indices("k0"), [4, 4, 4])
+        bloom.add("o2")
+        self.assertIn("k0", bloom)
+        # k0 would need counter 4 to be at least 3; o2 must not lose its cell
+        with self.assertRaises(KeyError):
+            bloom.remove("k0")
+        self.assertIn("o2", bloom)
+
+        bloom.add("k0")
+        bloom.remove("k0")
+        self.assertIn("o2", bloom)
+        bloom.remove("o2")
+        self.assertEqual(bytes(bloom._cells), bytes(7))
+
+    def test_save_and_load(self):
+        """
+        Test that a saved filter loads into memory and memory-maps with the same contents.
+        """
+        for cls in (BloomFilter, CountingBloomFilter):
+            bloom = cls.for_capacity(len(self.keys), 0.01, seeds=(7, 11))
+            bloom.add_many(self.keys)
+            expected = bloom.contains_many(self.absent)
+            bloom.save(self.path)
+
+            loaded = cls.load(self.path)
+            self.assertEqual(loaded.seeds, (7, 11))
+            self.assertEqual((loaded.size, loaded.num_hashes), (bloom.size, bloom.num_hashes))
+            self.assertEqual(loaded.contains_many(self.absent), expected)
+
+            with cls.load(self.path, mmap_mode="r") as mapped:
+                self.assertEqual(len(mapped), len(self.keys))
+                self.assertEqual(mapped.contains_many(self.absent), expected)
+                with self.assertRaises(TypeError):
+                    mapped.add("new")
+
+            with cls.load(self.path, mmap_mode="r+") as mapped:
+                mapped.add("new")
+            reloaded = cls.load(self.path)
+            self.assertIn("new", reloaded)
+            self.assertEqual(len(reloaded), len(self.keys) + 1)
+
+        with self.assertRaises(ValueError):
+            BloomFilter.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
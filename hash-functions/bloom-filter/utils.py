@@ -0,0 +1,35 @@
+import argparse
+
+
+def setup_argparser() -> argparse.ArgumentParser:
+    """
+    Sets command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: Argument parser
+    """
+    parser = argparse.ArgumentParser(description="Build and query a Bloom filter.")
+    parser.add_argument("--add", type=str, nargs="*", default=[], help="Keys to insert.")
+    parser.add_argument("--query", type=str, nargs="*", default=[], help="Keys to test.")
+    parser.add_argument(
+        "--capacity",
+        type=int,
+        default=1000,
+        help="Expected number of keys of a new filter. Default is 1000.",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.01,
+        help="Target false-positive rate of a new filter. Default is 0.01.",
+    )
+    parser.add_argument(
+        "--counting", action="store_true", help="Use a counting Bloom filter."
+    )
+    parser.add_argument(
+        "--file",
+        type=str,
+        default=None,
+        help="Filter file; it is loaded if it exists and saved after inserting.",
+    )
+    return parser
@@ -0,0 +1,102 @@
+import argparse
+import time
+from typing import List, Tuple
+
+from consistent_hashing import HASH_FUNCTIONS, HashRing, JumpHash, RendezvousHash
+
+PARTITIONERS = {"ring": HashRing, "jump": JumpHash, "rendezvous": RendezvousHash}
+
+
+def make_partitioner(strategy: str, nodes: List[str], hash_function: str, replicas: int):
+    """
+    Build a partitioner.
+
+    Args:
+        strategy (str): "ring", "jump" or "rendezvous".
+        nodes (List[str]): The node names.
+        hash_function (str): Name of the in-repo hash function.
+        replicas (int): Number of virtual nodes per node, for the ring.
+
+    Returns:
+        The partitioner.
+    """
+    if strategy == "ring":
+        return HashRing(nodes, replicas, hash_function)
+    return PARTITIONERS[strategy](nodes, hash_function)
+
+
+def benchmark_lookups(partitioner, keys: List[str], repeat: int) -> float:
+    """
+    Measure the lookup rate of a partitioner.
+
+    Args:
+        partitioner: The partitioner.
+        keys (List[str]): The keys to look up.
+        repeat (int): How many times to look the keys up; the best run is kept.
+
+    Returns:
+        float: Lookups per second.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        partitioner.get_nodes(keys)
+        best = min(best, time.perf_counter() - start)
+    return len(keys) / best
+
+
+def key_movement(partitioner, keys: List[str], node: str) -> Tuple[float, float]:
+    """
+    Measure the fraction of keys that move when a node is added, then removed again.
+
+    Args:
+        partitioner: The partitioner; it is left as it was.
+        keys (List[str]): The keys.
+        node (str): The node to add and remove.
+
+    Returns:
+        Tuple[float, float]: Fraction of keys moved on add and on remove.
+    """
+    before = partitioner.get_nodes(keys)
+    partitioner.add_node(node)
+    grown = partitioner.get_nodes(keys)
+    partitioner.remove_node(node)
+    after = partitioner.get_nodes(keys)
+
+    added = sum(a != b for a, b in zip(before, grown)) / len(keys)
+    removed = sum(a != b for a, b in zip(grown, after)) / len(keys)
+    return added, removed
+
+
+def main():
+    """
+    Compare the lookup rate and key movement of the partitioners.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the consistent hashing partitioners.")
+    parser.add_argument("--keys", type=int, default=20000, help="Number of keys (default 20000).")
+    parser.add_argument("--nodes", type=int, default=10, help="Number of nodes (default 10).")
+    parser.add_argument(
+        "--replicas", type=int, default=100, help="Virtual nodes per ring node (default 100)."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per partitioner (default 3)."
+    )
+    args = parser.parse_args()
+
+    keys = [f"key:{i}" for i in range(args.keys)]
+    nodes = [f"node-{i}" for i in range(args.nodes)]
+    ideal = 1 / (args.nodes + 1)
+    print(f"Ideal fraction of keys moved: {ideal:.4f}")
+    print(f"{'partitioner':>22} {'lookups/s':>12} {'moved (add)':>12} {'moved (remove)':>15}")
+
+    for strategy in PARTITIONERS:
+        for hash_function in HASH_FUNCTIONS:
+            partitioner = make_partitioner(strategy, nodes, hash_function, args.replicas)
+            rate = benchmark_lookups(partitioner, keys, args.repeat)
+            added, removed = key_movement(partitioner, keys, f"node-{args.nodes}")
+            name = f"{strategy}/{hash_function}"
+            print(f"{name:>22} {rate:12.0f} {added:12.4f} {removed:15.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+import os
+import sys
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List
+
+# The shared loader for modules in the other algorithm directories lives in
+# the hash-functions directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from siblings import load_module  # noqa: E402
+
+
+def _murmur(seed: int) -> Callable[[str], int]:
+    """MurmurHash3 x86_32."""
+    return load_module("murmur-hash", "murmur").MurmurHash(seed).hash
+
+
+def _djb2(seed: int) -> Callable[[str], int]:
+    """DJB2, truncated to 32 bits and finalized; the seed is prepended to the key."""
+    djb2_hash = load_module("bernsteins-hash", "djb2").DJB2Hash
+    fmix32 = load_module("murmur-hash", "murmur")._fmix32
+    prefix = f"{seed}:" if seed else ""
+
+    def hash_key(key: str) -> int:
+        djb2 = djb2_hash()
+        djb2.update(prefix + key)
+        return fmix32(djb2.digest() & 0xFFFFFFFF)
+
+    return hash_key
+
+
+def _elf(seed: int) -> Callable[[str], int]:
+    """Elf hash, finalized to 32 bits; the seed is prepended to the key."""
+    elf_hash = load_module("elf-hash", "elf").ElfHash()
+    fmix32 = load_module("murmur-hash", "murmur")._fmix32
+    prefix = f"{seed}:" if seed else ""
+
+    def hash_key(key: str) -> int:
+        key = prefix + key
+        # The Elf hash of the empty string is 0
+        return fmix32(elf_hash.compute_hash(key)) if key else 0
+
+    return hash_key
+
+
+def _pearson(seed: int) -> Callable[[str], int]:
+    """Pearson hashing widened to 32 bits from four differently-prefixed 8-bit hashes."""
+    pearson = load_module("pearson-hashing", "pearson").PearsonHashing()
+    prefixes = [chr((4 * seed + i) % 256) for i in range(4)]
+
+    def hash_key(key: str) -> int:
+        return (
+            pearson.hash(prefixes[0] + key)
+            | (pearson.hash(prefixes[1] + key) << 8)
+            | (pearson.hash(prefixes[2] + key) << 16)
+            | (pearson.hash(prefixes[3] + key) << 24)
+        )
+
+    return hash_key
+
+
+# Hash function factories, taking a seed and returning a str -> int function.
+# DJB2 and the Elf hash barely avalanche (keys differing in their last
+# character get nearby values), which would bunch virtual nodes together on
+# the ring, so their values go through the MurmurHash3 fmix32 finalizer.
+HASH_FUNCTIONS: Dict[str, Callable[[int], Callable[[str], int]]] = {
+    "murmur": _murmur,
+    "djb2": _djb2,
+    "elf": _elf,
+    "pearson": _pearson,
+}
+
+
+def get_hash_function(name: str, seed: int = 0) -> Callable[[str], int]:
+    """
+    Return one of the in-repo hash functions as a str -> int function.
+
+    Args:
+        name (str): "murmur", "djb2", "elf" or "pearson".
+        seed (int): A seed value for the hash function. Default is 0.
+
+    Returns:
+        Callable[[str], int]: The hash function.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if name not in HASH_FUNCTIONS:
+        raise ValueError(f"Unknown hash function: {name}. Choose from {sorted(HASH_FUNCTIONS)}.")
+    return HASH_FUNCTIONS[name](seed)
+
+
+def jump_hash(key: int, num_buckets: int) -> int:
+    """
+    Jump Consistent Hash (Lamping and Veach, 2014).
+
+    Maps a 64-bit key to one of num_buckets buckets with no stored state;
+    growing from n to n + 1 buckets moves only 1 / (n + 1) of the keys, all
+    of them into the new bucket.
+
+    Args:
+        key (int): The key, as an unsigned 64-bit integer.
+        num_buckets (int): The number of buckets.
+
+    Returns:
+        int: The bucket, from 0 to num_buckets - 1.
+
+    Raises:
+        ValueError: If num_buckets is not positive.
+    """
+    if num_buckets < 1:
+        raise ValueError("num_buckets must be positive.")
+
+    key &= 0xFFFFFFFFFFFFFFFF
+    bucket, j = -1, 0
+    while j < num_buckets:
+        bucket = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((bucket + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return bucket
+
+
+class HashRing:
+    """
+    A consistent-hash ring with virtual nodes.
+
+    Every node is placed on the ring at `replicas` points, and a key belongs
+    to the first point at or after its own hash, wrapping around. The points
+    are kept in a sorted array so a lookup is a single bisect.
+    """
+
+    def __init__(
+        self, nodes: Iterable[str] = (), replicas: int = 100, hash_function: str = "murmur"
+    ) -> None:
+        """
+        Initialize the ring.
+
+        Args:
+            nodes (Iterable[str]): The initial nodes.
+            replicas (int): Number of virtual nodes per node. Default is 100.
+            hash_function (str): Name of the in-repo hash function. Default is murmur.
+
+        Raises:
+            ValueError: If replicas is not positive, a node is repeated or the hash
+                function is unknown.
+        """
+        if replicas < 1:
+            raise ValueError("replicas must be positive.")
+
+        self.replicas = replicas
+        self.hash_function = hash_function
+        self._hash = get_hash_function(hash_function)
+        self._points: Dict[str, List[int]] = {}
+        for node in nodes:
+            if node in self._points:
+                raise ValueError(f"Node already on the ring: {node}")
+            self._points[node] = self._node_points(node)
+
+        # Sorted by (position, node); the two lists are kept in step
+        ring = sorted(
+            (position, node) for node, positions in self._points.items() for position in positions
+        )
+        self._positions: List[int] = [position for position, _ in ring]
+        self._owners: List[str] = [node for _, node in ring]
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._points
+
+    @property
+    def nodes(self) -> List[str]:
+        """
+        The nodes on the ring, sorted.
+
+        Returns:
+            List[str]: The node names.
+        """
+        return sorted(self._points)
+
+    def _node_points(self, node: str) -> List[int]:
+        """Hash the virtual nodes of a node to their ring positions."""
+        hash_key = self._hash
+        return [hash_key(f"{node}#{i}") for i in range(self.replicas)]
+
+    def _index(self, position: int, node: str) -> int:
+        """Index of the first (position, node) point at or after the given one."""
+        positions, owners = self._positions, self._owners
+        index = bisect_left(positions, position)
+        # Points sharing a position are ordered by node name
+        while index < len(positions) and positions[index] == position and owners[index] < node:
+            index += 1
+        return index
+
+    def add_node(self, node: str) -> None:
+        """
+        Add a node and its virtual nodes to the ring.
+
+        Args:
+            node (str): The node name.
+
+        Raises:
+            ValueError: If the node is already on the ring.
+        """
+        if node in self._points:
+            raise ValueError(f"Node already on the ring: {node}")
+
+        points = self._points[node] = self._node_points(node)
+        for position in points:
+            index = self._index(position, node)
+            self._positions.insert(index, position)
+            self._owners.insert(index, node)
+
+    def remove_node(self, node: str) -> None:
+        """
+        Remove a node and its virtual nodes from the ring.
+
+        Args:
+            node (str): The node name.
+
+        Raises:
+            KeyError: If the node is not on the ring.
+        """
+        for position in self._points.pop(node):
+            index = self._index(position, node)
+            del self._positions[index]
+            del self._owners[index]
+
+    def get_node(self, key: str) -> str:
+        """
+        Return the node a key belongs to.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            str: The node name.
+
+        Raises:
+            LookupError: If the ring is empty.
+        """
+        if not self._positions:
+            raise LookupError("The ring has no nodes.")
+
+        index = bisect_left(self._positions, self._hash(key))
+        return self._owners[index % len(self._owners)]
+
+    def get_nodes(self, keys: Iterable[str]) -> List[str]:
+        """
+        Return the nodes of many keys.
+
+        Args:
+            keys (Iterable[str]): The keys.
+
+        Returns:
+            List[str]: The node of each key, in the order of the keys.
+
+        Raises:
+            LookupError: If the ring is empty.
+        """
+        if not self._positions:
+            raise LookupError("The ring has no nodes.")
+
+        positions, owners, hash_key = self._positions, self._owners, self._hash
+        count = len(owners)
+        return [owners[bisect_left(positions, hash_key(key)) % count] for key in keys]
+
+
+class JumpHash:
+    """
+    A partitioner placing keys on an ordered list of nodes with Jump Consistent Hash.
+
+    Jump hash needs no lookup table, but buckets are numbered, so nodes can
+    only be added or removed at the end of the list.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), hash_function: str = "murmur") -> None:
+        """
+        Initialize the partitioner.
+
+        Args:
+            nodes (Iterable[str]): The initial nodes, in bucket order.
+            hash_function (str): Name of the in-repo hash function. Default is murmur.
+
+        Raises:
+            ValueError: If a node is repeated or the hash function is unknown.
+        """
+        self.hash_function = hash_function
+        self._hash = get_hash_function(hash_function)
+        self.nodes: List[str] = list(nodes)
+        if len(set(self.nodes)) != len(self.nodes):
+            raise ValueError("Nodes must be unique.")
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add_node(self, node: str) -> None:
+        """
+        Add a node as the new last bucket.
+
+        Args:
+            node (str): The node name.
+
+        Raises:
+            ValueError: If the node was already added.
+        """
+        if node in self.nodes:
+            raise ValueError(f"Node already added: {node}")
+        self.nodes.append(node)
+
+    def remove_node(self, node: str) -> None:
+        """
+        Remove the node in the last bucket.
+
+        Args:
+            node (str): The node name.
+
+        Raises:
+            ValueError: If the node is not the last one.
+        """
+        if not self.nodes or self.nodes[-1] != node:
+            raise ValueError("Jump hash can only remove the last node.")
+        self.nodes.pop()
+
+    def get_node(self, key: str) -> str:
+        """
+        Return the node a key belongs to.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            str: The node name.
+
+        Raises:
+            LookupError: If there are no nodes.
+        """
+        if not self.nodes:
+            raise LookupError("There are no nodes.")
+        return self.nodes[jump_hash(self._hash(key), len(self.nodes))]
+
+    def get_nodes(self, keys: Iterable[str]) -> List[str]:
+        """
+        Return the nodes of many keys.
+
+        Args:
+            keys (Iterable[str]): The keys.
+
+        Returns:
+            List[str]: The node of each key, in the order of the keys.
+
+        Raises:
+            LookupError: If there are no nodes.
+        """
+        if not self.nodes:
+            raise LookupError("There are no nodes.")
+
+        nodes, hash_key = self.nodes, self._hash
+        count = len(nodes)
+        return [nodes[jump_hash(hash_key(key), count)] for key in keys]
+
+
+class RendezvousHash:
+    """
+    Rendezvous (highest random weight) hashing.
+
+    A key belongs to the node with the highest hash of (node, key). Any node
+    can be added or removed, and only the keys of that node move, at the
+    cost of hashing the key once per node on every lookup.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), hash_function: str = "murmur") -> None:
+        """
+        Initialize the partitioner.
+
+        Args:
+            nodes (Iterable[str]): The initial nodes.
+            hash_function (str): Name of the in-repo hash function. Default is murmur.
+
+        Raises:
+            ValueError: If the hash function is unknown.
+        """
+        self.hash_function = hash_function
+        self._hash = get_hash_function(hash_function)
+        self._nodes: List[str] = []
+        for node in nodes:
+            self.add_node(node)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> List[str]:
+        """
+        The nodes, sorted.
+
+        Returns:
+            List[str]: The node names.
+        """
+        return list(self._nodes)
+
+    def add_node(self, node: str) -> None:
+        """
+        Add a node.
+
+        Args:
+            node (str): The node name.
+
+        Raises:
+            ValueError: If the node was already added.
+        """
+        if node in self._nodes:
+            raise ValueError(f"Node already added: {node}")
+        self._nodes.append(node)
+        self._nodes.sort()
+
+    def remove_node(self, node: str) -> None:
+        """
+        Remove a node.
+
+        Args:
+            node (str): The node name.
+
+        Raises:
+            ValueError: If the node was not added.
+        """
+        self._nodes.remove(node)
+
+    def get_node(self, key: str) -> str:
+        """
+        Return the node a key belongs to; ties go to the smallest node name.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            str: The node name.
+
+        Raises:
+            LookupError: If there are no nodes.
+        """
+        if not self._nodes:
+            raise LookupError("There are no nodes.")
+
+        hash_key = self._hash
+        best_node, best_weight = None, -1
+        for node in self._nodes:
+            weight = hash_key(f"{node}:{key}")
+            if weight > best_weight:
+                best_node, best_weight = node, weight
+        return best_node
+
+    def get_nodes(self, keys: Iterable[str]) -> List[str]:
+        """
+        Return the nodes of many keys.
+
+        Args:
+            keys (Iterable[str]): The keys.
+
+        Returns:
+            List[str]: The node of each key, in the order of the keys.
+
+        Raises:
+            LookupError: If there are no nodes.
+        """
+        return [self.get_node(key) for key in keys]
@@ -0,0 +1,27 @@
+from consistent_hashing import HashRing, JumpHash, RendezvousHash
+from utils import setup_argparser
+
+
+def main():
+    """
+    Main function to print the node each key is assigned to.
+    """
+    parser = setup_argparser()
+    args = parser.parse_args()
+
+    try:
+        if args.strategy == "ring":
+            partitioner = HashRing(args.nodes, args.replicas, args.hash)
+        elif args.strategy == "jump":
+            partitioner = JumpHash(args.nodes, args.hash)
+        else:
+            partitioner = RendezvousHash(args.nodes, args.hash)
+
+        for key, node in zip(args.keys, partitioner.get_nodes(args.keys)):
+            print(f"{key}: {node}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
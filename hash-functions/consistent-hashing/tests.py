@@ -0,0 +1,140 @@
+import unittest
+from collections import Counter
+
+from consistent_hashing import (
+    HASH_FUNCTIONS,
+    HashRing,
+    JumpHash,
+    RendezvousHash,
+    get_hash_function,
+    jump_hash,
+)
+
+
+class TestConsistentHashing(unittest.TestCase):
+    """
+    Test cases for the consistent hashing partitioners.
+    """
+
+    def setUp(self):
+        self.keys = [f"key:{i}" for i in range(5000)]
+        self.nodes = [f"node-{i}" for i in range(5)]
+
+    def _partitioners(self, nodes):
+        for hash_function in HASH_FUNCTIONS:
+            yield HashRing(nodes, 50, hash_function)
+            yield JumpHash(nodes, hash_function)
+            yield RendezvousHash(nodes, hash_function)
+
+    def test_hash_functions(self):
+        """
+        Test that every hash function is deterministic and depends on the seed.
+        """
+        for name in HASH_FUNCTIONS:
+            hash_key = get_hash_function(name)
+            self.assertEqual(hash_key("hello"), hash_key("hello"))
+            self.assertLess(hash_key("hello"), 1 << 32)
+            self.assertNotEqual(hash_key("hello"), get_hash_function(name, 1)("hello"))
+        self.assertEqual(get_hash_function("elf")(""), 0)
+        with self.assertRaises(ValueError):
+            get_hash_function("unknown")
+
+    def test_jump_hash(self):
+        """
+        Test that jump hash only moves keys into the new bucket.
+        """
+        for key in range(1000):
+            previous = 0
+            for buckets in range(1, 20):
+                bucket = jump_hash(key * 0x9E3779B97F4A7C15, buckets)
+                self.assertIn(bucket, (previous, buckets - 1))
+                previous = bucket
+        with self.assertRaises(ValueError):
+            jump_hash(1, 0)
+
+    def test_lookup(self):
+        """
+        Test that batch lookups match single lookups and spread keys over all nodes.
+        """
+        for partitioner in self._partitioners(self.nodes):
+            nodes = partitioner.get_nodes(self.keys)
+            self.assertEqual(nodes[:100], [partitioner.get_node(key) for key in self.keys[:100]])
+            self.assertEqual(set(Counter(nodes)), set(self.nodes))
+            self.assertGreater(min(Counter(nodes).values()), len(self.keys) / 10)
+
+    def test_add_and_remove_node(self):
+        """
+        Test that adding a node only moves keys onto it and removing it restores the mapping.
+        """
+        for partitioner in self._partitioners(self.nodes):
+            before = partitioner.get_nodes(self.keys)
+            partitioner.add_node("node-new")
+            after = partitioner.get_nodes(self.keys)
+            moved = [b for a, b in zip(before, after) if a != b]
+            self.assertTrue(moved)
+            self.assertEqual(set(moved), {"node-new"})
+            self.assertLess(len(moved), len(self.keys) / 3)
+
+            partitioner.remove_node("node-new")
+            self.assertEqual(partitioner.get_nodes(self.keys), before)
+
+    def test_remove_any_node(self):
+        """
+        Test that removing a ring or rendezvous node only moves the keys it owned.
+        """
+        for partitioner in (HashRing(self.nodes), RendezvousHash(self.nodes)):
+            before = partitioner.get_nodes(self.keys)
+            partitioner.remove_node("node-2")
+            after = partitioner.get_nodes(self.keys)
+            for a, b in zip(before, after):
+                if a != "node-2":
+                    self.assertEqual(a, b)
+            self.assertNotIn("node-2", after)
+
+        with self.assertRaises(ValueError):
+            JumpHash(self.nodes).remove_node("node-2")
+
+    def test_ring_updates_match_rebuild(self):
+        """
+        Test that adding and removing nodes keeps the ring sorted like building it anew.
+        """
+        ring = HashRing(self.nodes[:2], 50)
+        for node in self.nodes[2:]:
+            ring.add_node(node)
+        ring.remove_node("node-1")
+        rebuilt = HashRing([node for node in self.nodes if node != "node-1"], 50)
+        self.assertEqual(ring._positions, rebuilt._positions)
+        self.assertEqual(ring._owners, rebuilt._owners)
+        self.assertEqual(ring._positions, sorted(ring._positions))
+
+    def test_key_on_a_point(self):
+        """
+        Test that a key hashing exactly onto a virtual node belongs to that node.
+        """
+        ring = HashRing(self.nodes, 50)
+        for node in self.nodes:
+            for i in (0, 17, 49):
+                # Keys named like a virtual node hash onto that node's point
+                self.assertEqual(ring.get_node(f"{node}#{i}"), node)
+
+    def test_errors(self):
+        """
+        Test empty partitioners and duplicate nodes.
+        """
+        for partitioner in (HashRing(), JumpHash(), RendezvousHash()):
+            with self.assertRaises(LookupError):
+                partitioner.get_node("key")
+        with self.assertRaises(ValueError):
+            HashRing(["a", "a"])
+        with self.assertRaises(ValueError):
+            HashRing(replicas=0)
+        with self.assertRaises(ValueError):
+            RendezvousHash(["a", "a"])
+        with self.assertRaises(ValueError):
+            JumpHash(["a", "a"])
+        with self.assertRaises(ValueError):
+            JumpHash(["a"]).add_node("a")
+
+
+if __name__ == "__main__":
+    unittest.main()
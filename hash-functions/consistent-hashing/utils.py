@@ -0,0 +1,36 @@
+import argparse
+
+
+def setup_argparser() -> argparse.ArgumentParser:
+    """
+    Sets command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: Argument parser
+    """
+    parser = argparse.ArgumentParser(description="Assign keys to nodes with consistent hashing.")
+    parser.add_argument("keys", type=str, nargs="+", help="The keys to place.")
+    parser.add_argument(
+        "--nodes", type=str, nargs="+", required=True, help="The node names."
+    )
+    parser.add_argument(
+        "--strategy",
+        type=str,
+        choices=["ring", "jump", "rendezvous"],
+        default="ring",
+        help="Partitioning strategy. Default is ring.",
+    )
+    parser.add_argument(
+        "--hash",
+        type=str,
+        choices=["murmur", "djb2", "elf", "pearson"],
+        default="murmur",
+        help="Hash function. Default is murmur.",
+    )
+    parser.add_argument(
+        "--replicas",
+        type=int,
+        default=100,
+        help="Virtual nodes per node for the ring. Default is 100.",
+    )
+    return parser
@@ -0,0 +1,262 @@
+import os
+import sqlite3
+import stat
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby, repeat
+from typing import Dict, List, Optional, Tuple
+
+# The shared loader for modules in the other algorithm directories lives in
+# the hash-functions directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from siblings import load_module  # noqa: E402
+
+HASHERS = {
+    "md5": load_module("message-digest-5", "md5").MD5,
+    "sha256": load_module("sha-256", "sha256").SHA256,
+}
+
+
+def hash_file(path: str, algorithm: str = "sha256", buffer_size: int = 1 << 20) -> str:
+    """
+    Hash a file in fixed-size reads; also the task run by the worker processes.
+
+    Args:
+        path (str): Path of the file.
+        algorithm (str): "md5" or "sha256".
+        buffer_size (int): Size of the read buffer in bytes.
+
+    Returns:
+        str: The digest as a hexadecimal string.
+    """
+    hasher = HASHERS[algorithm]()
+    buffer = bytearray(buffer_size)
+    with open(path, "rb") as f, memoryview(buffer) as view:
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            hasher.update(view[:count])
+    return hasher.hexdigest()
+
+
+def _try_hash_file(path: str, algorithm: str) -> Optional[str]:
+    """
+    Hash a file for DedupIndex.scan(), reporting unreadable files instead of failing.
+
+    Args:
+        path (str): Path of the file.
+        algorithm (str): "md5" or "sha256".
+
+    Returns:
+        Optional[str]: The digest as a hexadecimal string, or None if the file
+            could not be read.
+    """
+    try:
+        return hash_file(path, algorithm)
+    except OSError:
+        return None
+
+
+class ScanStats:
+    """
+    Counters collected by one DedupIndex.scan() run.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize all counters to zero.
+        """
+        self.files_seen = 0
+        self.files_hashed = 0
+        self.files_skipped = 0
+        self.files_removed = 0
+        self.files_failed = 0
+        self.bytes_hashed = 0
+        # Paths of the files that could not be read
+        self.failed: List[str] = []
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Hashing throughput of the scan in MB/s.
+
+        Returns:
+            float: Bytes hashed per second, in millions.
+        """
+        return self.bytes_hashed / self.elapsed / 1e6 if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.files_seen} files seen, {self.files_hashed} hashed, "
+            f"{self.files_skipped} unchanged, {self.files_removed} removed, "
+            f"{self.files_failed} unreadable, "
+            f"{self.bytes_hashed} bytes in {self.elapsed:.2f}s "
+            f"({self.throughput:.2f} MB/s)"
+        )
+
+
+class DedupIndex:
+    """
+    A persistent, content-addressed index of the files below a directory.
+
+    Every file is stored with its size, modification time and digest in a
+    SQLite database, so later scans only hash files that are new or whose
+    size or modification time changed. Files with equal digests are
+    reported as duplicates.
+    """
+
+    def __init__(self, index_path: str, algorithm: str = "sha256") -> None:
+        """
+        Open (or create) an index.
+
+        Args:
+            index_path (str): Path of the SQLite database file.
+            algorithm (str): The digest algorithm, "md5" or "sha256". Default is sha256.
+
+        Raises:
+            ValueError: If the algorithm is not supported.
+        """
+        if algorithm not in HASHERS:
+            raise ValueError(
+                f"Unsupported algorithm: {algorithm}. Choose from {sorted(HASHERS)}."
+            )
+
+        self.algorithm = algorithm
+        self.connection = sqlite3.connect(index_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+            "algorithm TEXT NOT NULL, digest TEXT NOT NULL)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS files_digest ON files (algorithm, digest)"
+        )
+        self.connection.commit()
+
+    def __enter__(self) -> "DedupIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self.connection.close()
+
+    def _walk(self, root: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Collect the size and modification time of every regular file below root.
+
+        Args:
+            root (str): The directory to walk.
+
+        Returns:
+            Dict[str, Tuple[int, int]]: Maps each absolute path to (size, mtime_ns).
+        """
+        files = {}
+        for directory, _, names in os.walk(root):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    info = os.stat(path, follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISREG(info.st_mode):
+                    files[path] = (info.st_size, info.st_mtime_ns)
+        return files
+
+    def scan(self, root: str, workers: Optional[int] = None) -> ScanStats:
+        """
+        Bring the index up to date with the files below a directory.
+
+        Unchanged files (same size, modification time and algorithm) are
+        skipped; the others are hashed in parallel worker processes. Entries
+        for files that no longer exist below root are removed, and so are
+        those of files that can no longer be read, which are listed in the
+        returned stats instead of aborting the scan.
+
+        Args:
+            root (str): The directory to scan.
+            workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            ScanStats: Counters and throughput of this scan.
+        """
+        stats = ScanStats()
+        start = time.perf_counter()
+
+        root = os.path.abspath(root)
+        prefix = os.path.join(root, "")
+        files = self._walk(root)
+        stats.files_seen = len(files)
+
+        known = {
+            path: (size, mtime_ns, algorithm)
+            for path, size, mtime_ns, algorithm in self.connection.execute(
+                "SELECT path, size, mtime_ns, algorithm FROM files "
+                "WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+        }
+
+        removed = [(path,) for path in known if path not in files]
+        stale = [
+            path
+            for path, (size, mtime_ns) in files.items()
+            if known.get(path) != (size, mtime_ns, self.algorithm)
+        ]
+        stats.files_removed = len(removed)
+        stats.files_skipped = len(files) - len(stale)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(stale))
+        if workers <= 1:
+            digests = [_try_hash_file(path, self.algorithm) for path in stale]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                digests = list(executor.map(_try_hash_file, stale, repeat(self.algorithm)))
+
+        stats.failed = [path for path, digest in zip(stale, digests) if digest is None]
+        stats.files_failed = len(stats.failed)
+        removed.extend((path,) for path in stats.failed if path in known)
+        rows = [
+            (path, files[path][0], files[path][1], self.algorithm, digest)
+            for path, digest in zip(stale, digests)
+            if digest is not None
+        ]
+        with self.connection:
+            self.connection.executemany("DELETE FROM files WHERE path = ?", removed)
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, algorithm, digest) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        stats.files_hashed = len(rows)
+        stats.bytes_hashed = sum(row[1] for row in rows)
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    def duplicates(self) -> List[List[str]]:
+        """
+        Return the groups of indexed files that have identical content.
+
+        Returns:
+            List[List[str]]: Each group lists the paths sharing one digest, sorted.
+        """
+        rows = self.connection.execute(
+            "SELECT digest, path FROM files WHERE algorithm = ? AND digest IN ("
+            "SELECT digest FROM files WHERE algorithm = ? "
+            "GROUP BY digest HAVING COUNT(*) > 1) ORDER BY digest, path",
+            (self.algorithm, self.algorithm),
+        )
+        return [
+            [path for _, path in group]
+            for _, group in groupby(rows, key=lambda row: row[0])
+        ]
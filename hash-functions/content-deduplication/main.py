@@ -0,0 +1,28 @@
+from dedup import DedupIndex
+from utils import setup_argparser
+
+
+def main():
+    """
+    Main function to scan a directory and report duplicate files.
+    """
+    parser = setup_argparser()
+    args = parser.parse_args()
+
+    try:
+        with DedupIndex(args.index, args.algorithm) as index:
+            stats = index.scan(args.root, args.workers)
+            print(f"Scan: {stats}")
+            for path in stats.failed:
+                print(f"Unreadable: {path}")
+
+            for group in index.duplicates():
+                print(f"Duplicates ({len(group)}):")
+                for path in group:
+                    print(f"  {path}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import dedup
+from dedup import DedupIndex, hash_file
+
+
+class TestDedupIndex(unittest.TestCase):
+    """
+    Test cases for the content-addressed deduplication index.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp.name, "data")
+        os.makedirs(os.path.join(self.root, "sub"))
+        self.index_path = os.path.join(self.tmp.name, "index.sqlite")
+        self.files = {
+            "a.txt": b"hello world",
+            "b.txt": b"something else",
+            os.path.join("sub", "c.txt"): b"hello world",
+            "empty.txt": b"",
+        }
+        for name, data in self.files.items():
+            with open(os.path.join(self.root, name), "wb") as f:
+                f.write(data)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _path(self, name):
+        return os.path.join(os.path.abspath(self.root), name)
+
+    def test_hash_file(self):
+        """
+        Test that files are hashed like hashlib does.
+        """
+        data = bytes(range(256)) * 5000
+        path = self._path("large.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+        self.assertEqual(
+            hash_file(path, "sha256", buffer_size=1000), hashlib.sha256(data).hexdigest()
+        )
+        self.assertEqual(hash_file(path, "md5"), hashlib.md5(data).hexdigest())
+
+    def test_duplicates(self):
+        """
+        Test that files with identical content are grouped.
+        """
+        for algorithm in ("md5", "sha256"):
+            with DedupIndex(self.index_path, algorithm) as index:
+                stats = index.scan(self.root, workers=2)
+                self.assertEqual(stats.files_seen, 4)
+                self.assertEqual(stats.files_hashed, 4)
+                self.assertEqual(
+                    index.duplicates(),
+                    [[self._path("a.txt"), self._path(os.path.join("sub", "c.txt"))]],
+                )
+
+    def test_rescan_skips_unchanged_files(self):
+        """
+        Test that a second scan only hashes new and modified files.
+        """
+        with DedupIndex(self.index_path) as index:
+            index.scan(self.root, workers=1)
+
+        path = self._path("b.txt")
+        with open(path, "wb") as f:
+            f.write(b"hello world")
+        os.utime(path, ns=(0, 1))
+        os.remove(self._path("empty.txt"))
+
+        with DedupIndex(self.index_path) as index:
+            stats = index.scan(self.root, workers=1)
+            self.assertEqual(stats.files_hashed, 1)
+            self.assertEqual(stats.files_skipped, 2)
+            self.assertEqual(stats.files_removed, 1)
+            self.assertEqual(len(index.duplicates()[0]), 3)
+
+    def test_unreadable_file(self):
+        """
+        Test that an unreadable file is reported without aborting the scan.
+        """
+        unreadable = self._path("b.txt")
+        real_hash_file = dedup.hash_file
+
+        def failing_hash_file(path, algorithm="sha256"):
+            if path == unreadable:
+                raise PermissionError(path)
+            return real_hash_file(path, algorithm)
+
+        with DedupIndex(self.index_path) as index:
+            index.scan(self.root, workers=1)
+            os.utime(unreadable, ns=(0, 1))
+            with mock.patch.object(dedup, "hash_file", failing_hash_file):
+                stats = index.scan(self.root, workers=1)
+            self.assertEqual(stats.failed, [unreadable])
+            self.assertEqual(stats.files_failed, 1)
+            self.assertEqual(stats.files_hashed, 0)
+            self.assertIn("1 unreadable", str(stats))
+            paths = [row[0] for row in index.connection.execute("SELECT path FROM files")]
+            self.assertNotIn(unreadable, paths)
+            self.assertEqual(len(paths), 3)
+
+    def test_invalid_algorithm(self):
+        """
+        Test that an unsupported algorithm raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            DedupIndex(self.index_path, "sha1")
+
+
+if __name__ == "__main__":
+    unittest.main()
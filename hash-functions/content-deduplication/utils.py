@@ -0,0 +1,34 @@
+import argparse
+
+
+def setup_argparser() -> argparse.ArgumentParser:
+    """
+    Sets command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: Argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Find duplicate files below a directory using a persistent digest index."
+    )
+    parser.add_argument("root", type=str, help="The directory to scan.")
+    parser.add_argument(
+        "--index",
+        type=str,
+        default="dedup.sqlite",
+        help="Path of the SQLite index file. Default is dedup.sqlite.",
+    )
+    parser.add_argument(
+        "--algorithm",
+        type=str,
+        choices=["md5", "sha256"],
+        default="sha256",
+        help="Digest algorithm. Default is sha256.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. Default is the CPU count.",
+    )
+    return parser
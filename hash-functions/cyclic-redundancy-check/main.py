@@ -1,5 +1,7 @@
-from crc import CRC
-from utils import setup_argparser
+import sys
+
+from crc import CRC, CRCEngine
+from utils import checksum_stream, setup_argparser
 
 
 def main():
@@ -9,18 +11,41 @@ def main():
     parser = setup_argparser()
     args = parser.parse_args()
 
-    try:
-        polynomial = int(args.polynomial, 16)
-        initial_value = int(args.initial_value, 16)
-        final_xor_value = int(args.final_xor_value, 16)
-
-        crc_calculator = CRC(polynomial, initial_value, final_xor_value)
-        data_bytes = crc_calculator.hex_string_to_bytes(args.data)
-        crc_value = crc_calculator.calculate_crc(data_bytes)
+    if args.workers is not None and args.file is None:
+        parser.error("--workers can only be used with --file.")
 
-        print(f"CRC Value: 0x{crc_value:04X}")
+    explicit = [args.polynomial, args.initial_value, args.final_xor_value]
+    if args.model and any(value is not None for value in explicit):
+        parser.error(
+            "--model cannot be combined with --polynomial, --initial_value or --final_xor_value."
+        )
 
-    except ValueError as e:
+    try:
+        if args.model:
+            engine = CRCEngine.from_model(args.model)
+            label = engine.name
+        else:
+            polynomial = int(args.polynomial or "0x1021", 16)
+            initial_value = int(args.initial_value or "0xFFFF", 16)
+            final_xor_value = int(args.final_xor_value or "0x0000", 16)
+
+            crc_calculator = CRC(polynomial, initial_value, final_xor_value)
+            engine = crc_calculator.engine
+            label = "CRC Value"
+
+        if args.file:
+            crc_value = engine.checksum_file(args.file, args.workers)
+        elif args.stdin:
+            crc_value = checksum_stream(engine, sys.stdin.buffer)
+        elif args.model:
+            crc_value = engine.checksum(bytes.fromhex(args.data))
+        else:
+            data_bytes = crc_calculator.hex_string_to_bytes(args.data)
+            crc_value = crc_calculator.calculate_crc(data_bytes)
+
+        print(f"{label}: 0x{crc_value:0{(engine.width + 3) // 4}X}")
+
+    except (OSError, ValueError) as e:
         print(f"Error: {e}")
 
 
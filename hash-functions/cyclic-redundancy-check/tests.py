@@ -1,5 +1,10 @@
+import io
+import os
+import tempfile
 import unittest
-from crc import CRC
+import zlib
+from crc import CRC, MODELS, CRCEngine
+from utils import checksum_stream
 
 
 class TestCRC(unittest.TestCase):
@@ -79,5 +84,150 @@ class TestCRC(unittest.TestCase):
         self.assertEqual(crc_calculator.calculate_crc(data), expected_crc)
 
 
+class TestCRCEngine(unittest.TestCase):
+    """
+    Test cases for the table-driven CRCEngine.
+    """
+
+    CHECK = b"123456789"
+
+    def test_check_values(self):
+        """
+        Test the standard check values of reflected and non-reflected CRCs.
+        """
+        cases = [
+            ((16, 0x1021, 0xFFFF, False, False, 0x0000), 0x29B1),
+            ((16, 0x8005, 0x0000, True, True, 0x0000), 0xBB3D),
+            ((32, 0x04C11DB7, 0xFFFFFFFF, True, True, 0xFFFFFFFF), 0xCBF43926),
+            ((32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0x00000000), 0x0376E6E7),
+            ((64, 0x42F0E1EBA9EA3693, 0, False, False, 0), 0x6C40DF5F0B497347),
+        ]
+        for params, expected in cases:
+            for slices in CRCEngine.SLICES:
+                engine = CRCEngine(*params, slices=slices)
+                self.assertEqual(engine.checksum(self.CHECK), expected)
+
+    def test_slices_agree(self):
+        """
+        Test that all slicing variants agree on inputs of every tail length.
+        """
+        data = bytes(range(256)) * 2
+        for reflected in (False, True):
+            for length in range(0, 20):
+                results = {
+                    CRCEngine(24, 0x864CFB, 0xB704CE, reflected, reflected, 0, slices)
+                    .checksum(memoryview(data)[:length])
+                    for slices in CRCEngine.SLICES
+                }
+                self.assertEqual(len(results), 1)
+
+    def test_legacy_delegation(self):
+        """
+        Test that the legacy CRC class gives the same results as the engine.
+        """
+        data = [0x1A, 0x2B, 0x3C, 0x4D]
+        legacy = CRC(polynomial=0x8005, initial_value=0x1D0F, final_xor_value=0x00FF)
+        engine = CRCEngine(16, 0x8005, 0x1D0F, final_xor_value=0x00FF)
+        self.assertEqual(legacy.calculate_crc(data), engine.checksum(bytes(data)))
+        self.assertEqual(CRC(0x1021).calculate_crc(list(self.CHECK)), 0x29B1)
+        self.assertEqual(CRC(0x8005, 0x0000).calculate_crc(list(self.CHECK)), 0xFEE8)
+
+    def test_catalogue_check_values(self):
+        """
+        Test every catalogue model against its published check value.
+        """
+        for name, model in MODELS.items():
+            engine = CRCEngine.from_model(name)
+            self.assertEqual(engine.checksum(self.CHECK), model.check, name)
+            self.assertEqual(engine.name, name)
+
+    def test_catalogue_tables_are_shared(self):
+        """
+        Test that engines of one model share a single set of lookup tables.
+        """
+        first = CRCEngine.from_model("crc-32c")
+        second = CRCEngine.from_model("CRC-32C")
+        self.assertIs(first.tables, second.tables)
+        with self.assertRaises(ValueError):
+            CRCEngine.from_model("CRC-7/UNKNOWN")
+
+    def test_crc_combine(self):
+        """
+        Test that combining the CRCs of two blocks gives the CRC of both.
+        """
+        data = bytes(range(256)) * 3 + b"tail"
+        for name in MODELS:
+            engine = CRCEngine.from_model(name)
+            for split in (0, 1, 100, len(data)):
+                first, second = data[:split], data[split:]
+                combined = engine.crc_combine(
+                    engine.checksum(first), engine.checksum(second), len(second)
+                )
+                self.assertEqual(combined, engine.checksum(data), name)
+
+    def test_checksum_file_segments(self):
+        """
+        Test that segmented and parallel file checksums match the whole-file CRC.
+        """
+        data = bytes(range(256)) * 4000
+        engine = CRCEngine.from_model("CRC-32")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            for workers, segment_size in ((1, 100000), (2, 300000)):
+                self.assertEqual(
+                    engine.checksum_file(path, workers, segment_size), zlib.crc32(data)
+                )
+
+            empty = os.path.join(tmp, "empty.bin")
+            open(empty, "wb").close()
+            self.assertEqual(engine.checksum_file(empty), engine.checksum(b""))
+
+    def test_streaming_update(self):
+        """
+        Test that data fed in chunks gives the same CRC as one checksum() call.
+        """
+        data = bytes(range(256)) * 5
+        for name in ("CRC-16/X-25", "CRC-32/BZIP2", "CRC-64/XZ"):
+            engine = CRCEngine.from_model(name)
+            for start in range(0, len(data), 13):
+                engine.update(memoryview(data)[start : start + 13])
+            self.assertEqual(engine.value(), engine.checksum(data))
+
+            fork = engine.copy()
+            fork.update(b"more")
+            self.assertEqual(fork.value(), engine.checksum(data + b"more"))
+            self.assertEqual(engine.value(), engine.checksum(data))
+
+            engine.reset()
+            engine.update(self.CHECK)
+            self.assertEqual(engine.value(), MODELS[name].check)
+
+    def test_digest_and_stream(self):
+        """
+        Test the byte and hex digests and checksumming a binary stream.
+        """
+        engine = CRCEngine.from_model("CRC-32")
+        engine.update(self.CHECK)
+        self.assertEqual(engine.digest(), bytes.fromhex("cbf43926"))
+        self.assertEqual(engine.hexdigest(), "cbf43926")
+
+        data = bytes(range(256)) * 100
+        stream = io.BytesIO(data)
+        self.assertEqual(checksum_stream(engine, stream, buffer_size=1000), zlib.crc32(data))
+
+    def test_invalid_arguments(self):
+        """
+        Test that unsupported parameters and non-bytes input are rejected.
+        """
+        with self.assertRaises(ValueError):
+            CRCEngine(65, 0x1)
+        with self.assertRaises(ValueError):
+            CRCEngine(16, 0x1021, slices=2)
+        with self.assertRaises(TypeError):
+            CRCEngine(16, 0x1021).checksum("123456789")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,7 @@
 import argparse
+from typing import BinaryIO
+
+from crc import MODELS, CRCEngine
 
 
 def setup_argparser() -> argparse.ArgumentParser:
@@ -8,26 +11,79 @@ def setup_argparser() -> argparse.ArgumentParser:
     Returns:
         argparse.ArgumentParser: Argument parser
     """
-    parser = argparse.ArgumentParser(description="Calculate CRC for given data.")
-    parser.add_argument(
-        "data", type=str, help="Data in hexadecimal format to calculate CRC for."
+    parser = argparse.ArgumentParser(
+        description="Calculate CRC for given data, a file or standard input."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "data",
+        type=str,
+        nargs="?",
+        help="Data in hexadecimal format to calculate CRC for.",
+    )
+    source.add_argument("--file", type=str, help="Calculate the CRC of the file at this path.")
+    source.add_argument(
+        "--stdin", action="store_true", help="Calculate the CRC of standard input."
     )
     parser.add_argument(
         "--polynomial",
         type=str,
-        default="0x1021",
+        default=None,
         help="Polynomial for CRC calculation in hexadecimal format. Default is 0x1021.",
     )
     parser.add_argument(
         "--initial_value",
         type=str,
-        default="0xFFFF",
+        default=None,
         help="Initial value for CRC calculation in hexadecimal format. Default is 0xFFFF.",
     )
     parser.add_argument(
         "--final_xor_value",
         type=str,
-        default="0x0000",
+        default=None,
         help="Final XOR value for CRC calculation in hexadecimal format. Default is 0x0000.",
     )
+    parser.add_argument(
+        "--model",
+        type=str.upper,
+        choices=sorted(MODELS),
+        default=None,
+        help="Named CRC model, e.g. CRC-32. Cannot be combined with the polynomial, "
+        "initial and final XOR value options.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --file. Default is the CPU count.",
+    )
     return parser
+
+
+def checksum_stream(
+    engine: CRCEngine, stream: BinaryIO, buffer_size: int = 1 << 20
+) -> int:
+    """
+    Calculate the CRC value of a binary stream such as a pipe.
+
+    Data is read into one reusable buffer with readinto() and fed to the
+    engine as memoryview slices, so no per-byte conversion takes place.
+
+    Args:
+        engine (CRCEngine): The CRC engine; its running CRC is reset first.
+        stream (BinaryIO): The stream to read until end of file.
+        buffer_size (int): Size of the read buffer in bytes.
+
+    Returns:
+        int: The CRC value of the stream.
+    """
+    engine.reset()
+    buffer = bytearray(buffer_size)
+    with memoryview(buffer) as view:
+        while True:
+            count = stream.readinto(view)
+            if not count:
+                break
+            engine.update(view[:count])
+
+    return engine.value()
@@ -1,3 +1,13 @@
+import struct
+from operator import mul
+from typing import Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized path needs it
+    np = None
+
+
 class Fletcher:
     """
     A class to compute the Fletcher checksum for a given input string.
@@ -53,3 +63,177 @@ class Fletcher:
         fletcher = Fletcher(data)
         computed_checksum = fletcher.compute_checksum()
         return computed_checksum == checksum
+
+
+class FletcherChecksum:
+    """
+    Fletcher-16, Fletcher-32 and Fletcher-64 checksums over bytes.
+
+    Fletcher-N sums (N / 2)-bit little-endian words modulo 2^(N / 2) - 1;
+    a trailing partial word is padded with zero bytes. Words are processed
+    in blocks: for a block of n words the first sum grows by the word sum
+    and the second by n times the first sum plus the words weighted n, ...,
+    1, so both are reduced once per block instead of once per word. Large
+    buffers are summed with NumPy prefix sums when NumPy is installed.
+    """
+
+    WIDTHS = (16, 32, 64)
+
+    # Largest blocks whose sums fit the accumulators of the C reference code
+    BLOCK_WORDS = {16: 5802, 32: 360, 64: 92679}
+
+    # Largest blocks whose NumPy prefix sums stay below 2^64
+    NUMPY_BLOCK_WORDS = {16: 1 << 20, 32: 1 << 20, 64: 92679}
+
+    # Inputs of at least this many bytes use the NumPy path
+    NUMPY_THRESHOLD = 1 << 16
+
+    def __init__(self, width: int = 16, data: bytes = b"", vectorize: bool = True):
+        """
+        Initialize the Fletcher checksum.
+
+        Args:
+            width (int): The checksum width in bits: 16, 32 or 64. Default is 16.
+            data (bytes): Optional initial data to feed into the checksum.
+            vectorize (bool): Whether large inputs may use the NumPy path. Default is True.
+
+        Raises:
+            ValueError: If the width is not supported.
+        """
+        if width not in self.WIDTHS:
+            raise ValueError(f"width must be one of {self.WIDTHS}.")
+
+        self.width = width
+        self.word_size = width // 16
+        self.modulus = (1 << (width // 2)) - 1
+        self.vectorize = vectorize and np is not None
+
+        self._format = {1: "B", 2: "H", 4: "I"}[self.word_size]
+        self._block = struct.Struct(f"<{self.BLOCK_WORDS[width]}{self._format}")
+
+        self._sum1 = 0
+        self._sum2 = 0
+        # Partial word carried over between update() calls
+        self._pending = b""
+        if data:
+            self.update(data)
+
+    def _process_words(self, data: memoryview) -> None:
+        """
+        Add whole words to the sums.
+
+        Args:
+            data (memoryview): The data, a multiple of the word size long.
+        """
+        if self.vectorize and len(data) >= self.NUMPY_THRESHOLD:
+            self._process_words_numpy(data)
+            return
+
+        sum1, sum2 = self._sum1, self._sum2
+        modulus = self.modulus
+        block_size = self._block.size
+
+        for start in range(0, len(data), block_size):
+            chunk = data[start : start + block_size]
+            if self.word_size == 1:
+                words = chunk
+            elif len(chunk) == block_size:
+                words = self._block.unpack(chunk)
+            else:
+                words = struct.unpack(f"<{len(chunk) // self.word_size}{self._format}", chunk)
+
+            n = len(words)
+            sum2 = (sum2 + n * sum1 + sum(map(mul, words, range(n, 0, -1)))) % modulus
+            sum1 = (sum1 + sum(words)) % modulus
+
+        self._sum1, self._sum2 = sum1, sum2
+
+    def _process_words_numpy(self, data: memoryview) -> None:
+        """
+        Add whole words to the sums with NumPy.
+
+        The weighted word sum of a block equals the sum of its prefix sums.
+
+        Args:
+            data (memoryview): The data, a multiple of the word size long.
+        """
+        words = np.frombuffer(data, dtype=f"<u{self.word_size}")
+        sum1, sum2 = self._sum1, self._sum2
+        modulus = self.modulus
+        block_words = self.NUMPY_BLOCK_WORDS[self.width]
+
+        for start in range(0, len(words), block_words):
+            block = words[start : start + block_words].astype(np.uint64)
+            n = len(block)
+            prefix_sums = np.cumsum(block, dtype=np.uint64)
+            sum2 = (sum2 + n * sum1 + int(prefix_sums.sum(dtype=np.uint64))) % modulus
+            sum1 = (sum1 + int(prefix_sums[-1])) % modulus
+
+        self._sum1, self._sum2 = sum1, sum2
+
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Feed more data into the checksum.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): The data to append.
+
+        Raises:
+            TypeError: If the data is not a bytes-like object.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Input data must be of type bytes, bytearray or memoryview.")
+
+        data = memoryview(data).cast("B")
+
+        # Complete a previously buffered partial word first
+        if self._pending:
+            fill = self.word_size - len(self._pending)
+            self._pending += bytes(data[:fill])
+            data = data[fill:]
+            if len(self._pending) < self.word_size:
+                return
+            self._process_words(memoryview(self._pending))
+            self._pending = b""
+
+        end = len(data) - len(data) % self.word_size
+        self._process_words(data[:end])
+        self._pending = bytes(data[end:])
+
+    def copy(self) -> "FletcherChecksum":
+        """
+        Return a copy of the current checksum state.
+
+        Returns:
+            FletcherChecksum: A new object with the same internal state.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    def digest(self) -> int:
+        """
+        Return the checksum of the data fed so far as an integer.
+
+        A trailing partial word is padded with zero bytes; the internal state
+        is left untouched, so more data can still be added.
+
+        Returns:
+            int: The checksum, the second sum in the upper half and the first in the lower.
+        """
+        final = self
+        if self._pending:
+            final = self.copy()
+            final._pending = b""
+            final._process_words(memoryview(self._pending.ljust(self.word_size, b"\x00")))
+
+        return (final._sum2 << (self.width // 2)) | final._sum1
+
+    def hexdigest(self) -> str:
+        """
+        Return the checksum of the data fed so far as a hexadecimal string.
+
+        Returns:
+            str: The checksum, zero-padded to width / 4 digits.
+        """
+        return f"{self.digest():0{self.width // 4}x}"
@@ -1,5 +1,5 @@
 import unittest
-from fletcher import Fletcher
+from fletcher import Fletcher, FletcherChecksum, np
 
 
 class TestFletcherChecksum(unittest.TestCase):
@@ -67,5 +67,62 @@ class TestFletcherChecksum(unittest.TestCase):
         )  # Precomputed checksum for "Python is awesome!"
 
 
+class TestFletcherChecksumWidths(unittest.TestCase):
+    """
+    A test suite for the FletcherChecksum class.
+    """
+
+    VECTORS = {
+        16: (0xC8F0, 0x2057),
+        32: (0xF04FC729, 0x56502D2A),
+        64: (0xC8C6C527646362C6, 0xC8C72B276463C8C6),
+    }
+
+    def test_known_values(self):
+        """
+        Test the published values for "abcde" and "abcdef" at every width.
+        """
+        for width, (abcde, abcdef) in self.VECTORS.items():
+            self.assertEqual(FletcherChecksum(width, b"abcde").digest(), abcde)
+            self.assertEqual(FletcherChecksum(width, b"abcdef").digest(), abcdef)
+
+    def test_streaming_update(self):
+        """
+        Test that odd-sized chunks give the same checksum as a single update.
+        """
+        data = bytes(range(256)) * 40 + b"tail"
+        for width in FletcherChecksum.WIDTHS:
+            fletcher = FletcherChecksum(width, vectorize=False)
+            for start in range(0, len(data), 7):
+                fletcher.update(data[start : start + 7])
+            expected = FletcherChecksum(width, data, vectorize=False)
+            self.assertEqual(fletcher.hexdigest(), expected.hexdigest())
+
+            fletcher.update(b"more")
+            expected.update(b"more")
+            self.assertEqual(fletcher.digest(), expected.digest())
+
+    @unittest.skipIf(np is None, "NumPy is not installed.")
+    def test_numpy_path_agrees(self):
+        """
+        Test that the NumPy prefix-sum path gives the same checksums.
+        """
+        data = b"\xff" * (3 * FletcherChecksum.NUMPY_THRESHOLD + 3)
+        for width in FletcherChecksum.WIDTHS:
+            self.assertEqual(
+                FletcherChecksum(width, data, vectorize=True).digest(),
+                FletcherChecksum(width, data, vectorize=False).digest(),
+            )
+
+    def test_invalid_arguments(self):
+        """
+        Test that unsupported widths and non-bytes input are rejected.
+        """
+        with self.assertRaises(ValueError):
+            FletcherChecksum(24)
+        with self.assertRaises(TypeError):
+            FletcherChecksum(16).update("abcde")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+import os
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, List
+
+# The shared loader for modules in the other algorithm directories lives in
+# the hash-functions directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from siblings import load_module  # noqa: E402
+
+_BACKENDS: Dict[str, Callable[[], Callable[..., object]]] = {}
+
+
+def register_backend(name: str) -> Callable:
+    """
+    Register a hash backend loader under a name.
+
+    The decorated loader returns a hash constructor: a callable taking the
+    initial bytes and returning a hashlib-style object with update(), copy(),
+    digest(), block_size and digest_size. Loaders run once, on first use.
+
+    Args:
+        name (str): The backend name.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(loader: Callable[[], Callable[..., object]]) -> Callable:
+        _BACKENDS[name] = lru_cache(maxsize=None)(loader)
+        return loader
+
+    return decorator
+
+
+def get_backend(name: str) -> Callable[..., object]:
+    """
+    Return the hash constructor registered under a name.
+
+    Args:
+        name (str): The backend name, e.g. "sha256".
+
+    Returns:
+        Callable[..., object]: The hash constructor.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+    """
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown hash backend: {name}. Choose from {available_backends()}."
+        )
+    return _BACKENDS[name]()
+
+
+def available_backends() -> List[str]:
+    """
+    Return the names of the registered hash backends.
+
+    Returns:
+        List[str]: The backend names, sorted.
+    """
+    return sorted(_BACKENDS)
+
+
+@register_backend("sha256")
+def _sha256_backend() -> Callable[..., object]:
+    return load_module("sha-256", "sha256").SHA256
+
+
+@register_backend("md5")
+def _md5_backend() -> Callable[..., object]:
+    return load_module("message-digest-5", "md5").MD5
+
+
+@register_backend("md4")
+def _md4_backend() -> Callable[..., object]:
+    return load_module("message-digest-4", "md4").MD4
+
+
+@register_backend("md2")
+def _md2_backend() -> Callable[..., object]:
+    return load_module("message-digest-2", "md2").MD2
@@ -0,0 +1,270 @@
+from concurrent.futures import ThreadPoolExecutor
+from hmac import compare_digest
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from backends import get_backend
+
+# Translation tables for XOR-ing a whole key with the pad bytes in one call
+_TRANS_36 = bytes(x ^ 0x36 for x in range(256))
+_TRANS_5C = bytes(x ^ 0x5C for x in range(256))
+
+
+class HMACKey:
+    """
+    An HMAC key bound to a hash function, reusable for many messages.
+
+    The padded inner and outer keys are derived once. When the hash function
+    is a streaming hash constructor (its result has update() and copy(), like
+    hashlib.sha256), the hash states after absorbing the padded keys are
+    cached as well, so each message only costs copying those two states.
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        hash_func: Union[str, Callable[[bytes], bytes]],
+        block_size: Optional[int] = None,
+    ):
+        """
+        Initialize the HMACKey class.
+
+        Args:
+            key (bytes): The secret key for HMAC.
+            hash_func (Union[str, Callable[[bytes], bytes]]): The name of a registered hash
+                backend (see backends.py), a hash function that takes bytes and returns a
+                hash as bytes, or a streaming hash constructor that takes the initial bytes.
+            block_size (Optional[int]): The block size of the hash function. Defaults to the
+                block_size of the streaming hash object, or 64 bytes for SHA-256.
+        """
+        if isinstance(hash_func, str):
+            hash_func = get_backend(hash_func)
+        self.hash_func = hash_func
+
+        probe = hash_func(b"")
+        self.streaming = callable(getattr(probe, "update", None)) and callable(
+            getattr(probe, "copy", None)
+        )
+        if block_size is None:
+            block_size = getattr(probe, "block_size", 64) if self.streaming else 64
+        self.block_size = block_size
+        if self.streaming:
+            self.digest_size = len(probe.digest())
+        else:
+            # A plain function may map b"" to a degenerate value (the
+            # demonstration hash returns b""), so measure a full block instead
+            self.digest_size = len(hash_func(bytes(self.block_size)))
+
+        # Ensure the key is of block_size length
+        if len(key) > self.block_size:
+            key = self._hash(key)
+        self.key = key.ljust(self.block_size, b"\x00")
+
+        # XOR the key with the padding values
+        self.i_key_pad = self.key.translate(_TRANS_36)
+        self.o_key_pad = self.key.translate(_TRANS_5C)
+
+        if self.streaming:
+            self._inner = hash_func(self.i_key_pad)
+            self._outer = hash_func(self.o_key_pad)
+
+    def _hash(self, data: bytes) -> bytes:
+        """
+        Hash data with the bound hash function.
+
+        Args:
+            data (bytes): The data to hash.
+
+        Returns:
+            bytes: The hash as a byte string.
+        """
+        if self.streaming:
+            return self.hash_func(data).digest()
+        return self.hash_func(data)
+
+    def sign(self, message: bytes) -> bytes:
+        """
+        Generate the HMAC of a message under this key.
+
+        Args:
+            message (bytes): The message to authenticate.
+
+        Returns:
+            bytes: The HMAC as a byte string.
+        """
+        if self.streaming:
+            inner = self._inner.copy()
+            inner.update(message)
+            outer = self._outer.copy()
+            outer.update(inner.digest())
+            return outer.digest()
+
+        inner_hash = self.hash_func(self.i_key_pad + message)
+        return self.hash_func(self.o_key_pad + inner_hash)
+
+    def sign_many(self, messages: Iterable[bytes]) -> List[bytes]:
+        """
+        Generate the HMACs of many messages under this key.
+
+        Args:
+            messages (Iterable[bytes]): The messages to authenticate.
+
+        Returns:
+            List[bytes]: The HMACs, in the order of the messages.
+        """
+        tags = []
+        append = tags.append
+
+        if self.streaming:
+            inner_copy = self._inner.copy
+            outer_copy = self._outer.copy
+            for message in messages:
+                inner = inner_copy()
+                inner.update(message)
+                outer = outer_copy()
+                outer.update(inner.digest())
+                append(outer.digest())
+            return tags
+
+        hash_func = self.hash_func
+        i_key_pad = self.i_key_pad
+        o_key_pad = self.o_key_pad
+        for message in messages:
+            append(hash_func(o_key_pad + hash_func(i_key_pad + message)))
+        return tags
+
+    def verify(self, message: bytes, tag: bytes) -> bool:
+        """
+        Check a message against an HMAC in constant time.
+
+        Args:
+            message (bytes): The message that was authenticated.
+            tag (bytes): The HMAC to check.
+
+        Returns:
+            bool: True if the HMAC is valid for the message, False otherwise.
+        """
+        return compare_digest(self.sign(message), tag)
+
+    def _verify_chunk(self, pairs: List[Tuple[bytes, bytes]]) -> bytes:
+        """
+        Check a chunk of (message, tag) pairs and pack the results into bits.
+
+        Args:
+            pairs (List[Tuple[bytes, bytes]]): The pairs to check.
+
+        Returns:
+            bytes: Bit i (least significant bit first) is set if pair i is valid.
+        """
+        bitmap = bytearray((len(pairs) + 7) // 8)
+        expected_tags = self.sign_many(message for message, _ in pairs)
+        for i, (expected, (_, tag)) in enumerate(zip(expected_tags, pairs)):
+            if compare_digest(expected, tag):
+                bitmap[i >> 3] |= 1 << (i & 7)
+        return bytes(bitmap)
+
+    def verify_many(
+        self,
+        pairs: Iterable[Tuple[bytes, bytes]],
+        workers: Optional[int] = None,
+        chunksize: int = 1024,
+    ) -> bytes:
+        """
+        Check many (message, tag) pairs and return a pass/fail bitmap.
+
+        Pairs are checked in chunks; with more than one worker the chunks are
+        spread over a thread pool, which keeps the key in this process and
+        works with hash functions that cannot be pickled. Every tag is
+        compared in constant time.
+
+        Args:
+            pairs (Iterable[Tuple[bytes, bytes]]): The (message, tag) pairs to check.
+            workers (Optional[int]): Number of worker threads. Default is 1 (no pool).
+            chunksize (int): Number of pairs per chunk, rounded up to a multiple of 8.
+
+        Returns:
+            bytes: Bit i of the bitmap (byte i // 8, least significant bit first)
+                is set if pair i is valid.
+
+        Raises:
+            ValueError: If workers or chunksize is not positive.
+        """
+        workers = 1 if workers is None else workers
+        if workers < 1 or chunksize < 1:
+            raise ValueError("workers and chunksize must be positive.")
+
+        # Whole-byte chunks let the partial bitmaps be concatenated directly
+        chunksize = (chunksize + 7) // 8 * 8
+        pairs = iter(pairs)
+        chunks = iter(lambda: list(islice(pairs, chunksize)), [])
+
+        if workers == 1:
+            return b"".join(map(self._verify_chunk, chunks))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return b"".join(executor.map(self._verify_chunk, chunks))
+
+
+class HMAC:
+    """
+    HMAC (Hash-based Message Authentication Code) implementation in Python.
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        message: bytes,
+        hash_func: Union[str, Callable[[bytes], bytes]],
+        block_size: Optional[int] = None,
+    ):
+        """
+        Initialize the HMAC class.
+
+        Args:
+            key (bytes): The secret key for HMAC.
+            message (bytes): The message to authenticate.
+            hash_func (Union[str, Callable[[bytes], bytes]]): A hash backend name such as
+                "sha256", or a custom hash function that takes bytes and returns a hash as bytes.
+            block_size (Optional[int]): The block size of the hash function. Default is 64
+                bytes for SHA-256.
+
+        Raises:
+            ValueError: If hash_func names an unknown backend.
+            RuntimeError: If the hash function fails while the padded keys are prepared.
+        """
+        if isinstance(hash_func, str):
+            hash_func = get_backend(hash_func)
+
+        self.message = message
+        try:
+            self.hmac_key = HMACKey(key, hash_func, block_size)
+        except Exception as e:
+            raise RuntimeError(f"Error generating HMAC: {e}")
+        self.hash_func = self.hmac_key.hash_func
+        self.key = self.hmac_key.key
+        self.block_size = self.hmac_key.block_size
+
+    def generate(self) -> bytes:
+        """
+        Generate the HMAC for the given key and message.
+
+        Returns:
+            bytes: The HMAC as a byte string.
+        """
+        try:
+            return self.hmac_key.sign(self.message)
+
+        except Exception as e:
+            raise RuntimeError(f"Error generating HMAC: {e}")
+
+    def verify(self, tag: bytes) -> bool:
+        """
+        Check an HMAC for the given key and message in constant time.
+
+        Args:
+            tag (bytes): The HMAC to check.
+
+        Returns:
+            bool: True if the HMAC is valid, False otherwise.
+        """
+        return compare_digest(self.generate(), tag)
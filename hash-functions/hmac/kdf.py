@@ -0,0 +1,214 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Optional, Union
+
+from hmac_impl import HMACKey
+
+
+def _pbkdf2_block(
+    hash_func: Union[str, Callable[[bytes], bytes]],
+    password: bytes,
+    salt: bytes,
+    iterations: int,
+    index: int,
+) -> bytes:
+    """
+    Compute one PBKDF2 output block T_index; runs inside the worker processes.
+
+    Args:
+        hash_func (Union[str, Callable[[bytes], bytes]]): The hash backend name or hash function.
+        password (bytes): The password.
+        salt (bytes): The salt.
+        iterations (int): The iteration count.
+        index (int): The 1-based block index.
+
+    Returns:
+        bytes: The output block.
+    """
+    # The padded password states are derived once and reused by every iteration
+    sign = HMACKey(password, hash_func).sign
+
+    u = sign(salt + index.to_bytes(4, "big"))
+    block = int.from_bytes(u, "big")
+    for _ in range(iterations - 1):
+        u = sign(u)
+        block ^= int.from_bytes(u, "big")
+    return block.to_bytes(len(u), "big")
+
+
+def _digest_size(hash_func: Union[str, Callable[[bytes], bytes]]) -> int:
+    """
+    Return the digest size of a hash function, checking that it is usable for key derivation.
+
+    Args:
+        hash_func (Union[str, Callable[[bytes], bytes]]): The hash backend name or hash function.
+
+    Returns:
+        int: The digest size in bytes.
+
+    Raises:
+        ValueError: If the hash function returns empty digests.
+    """
+    digest_size = HMACKey(b"", hash_func).digest_size
+    if digest_size < 1:
+        raise ValueError("The hash function must return a non-empty digest.")
+    return digest_size
+
+
+class PBKDF2:
+    """
+    PBKDF2 (Password-Based Key Derivation Function 2, RFC 8018) using HMAC.
+    """
+
+    def __init__(
+        self,
+        hash_func: Union[str, Callable[[bytes], bytes]] = "sha256",
+        iterations: int = 100000,
+    ):
+        """
+        Initialize the PBKDF2 class.
+
+        Args:
+            hash_func (Union[str, Callable[[bytes], bytes]]): The hash backend name or hash
+                function used by HMAC. Must be picklable when workers are used. Default is sha256.
+            iterations (int): The iteration count. Default is 100000.
+
+        Raises:
+            ValueError: If the iteration count is not positive.
+        """
+        if iterations < 1:
+            raise ValueError("iterations must be positive.")
+
+        self.hash_func = hash_func
+        self.iterations = iterations
+
+    def derive(
+        self,
+        password: bytes,
+        salt: bytes,
+        dklen: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> bytes:
+        """
+        Derive a key from a password.
+
+        The output blocks are independent of each other, so when more than one
+        block is needed they are computed in parallel worker processes.
+
+        Args:
+            password (bytes): The password.
+            salt (bytes): The salt.
+            dklen (Optional[int]): The derived key length. Defaults to the digest size.
+            workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            bytes: The derived key.
+
+        Raises:
+            ValueError: If dklen or workers is not positive, or the hash function returns
+                empty digests.
+        """
+        digest_size = _digest_size(self.hash_func)
+        dklen = digest_size if dklen is None else dklen
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if dklen < 1 or workers < 1:
+            raise ValueError("dklen and workers must be positive.")
+
+        indices = range(1, -(-dklen // digest_size) + 1)
+        workers = min(workers, len(indices))
+        args = (self.hash_func, password, salt, self.iterations)
+
+        if workers <= 1:
+            blocks = [_pbkdf2_block(*args, index) for index in indices]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                blocks = list(
+                    executor.map(_pbkdf2_block, *map(repeat, args), indices)
+                )
+
+        return b"".join(blocks)[:dklen]
+
+
+class HKDF:
+    """
+    HKDF (HMAC-based Extract-and-Expand Key Derivation Function, RFC 5869).
+    """
+
+    def __init__(self, hash_func: Union[str, Callable[[bytes], bytes]] = "sha256"):
+        """
+        Initialize the HKDF class.
+
+        Args:
+            hash_func (Union[str, Callable[[bytes], bytes]]): The hash backend name or hash
+                function used by HMAC. Default is sha256.
+        """
+        self.hash_func = hash_func
+
+    def extract(self, ikm: bytes, salt: bytes = b"") -> bytes:
+        """
+        Extract a pseudorandom key from the input keying material.
+
+        Args:
+            ikm (bytes): The input keying material.
+            salt (bytes): The optional salt. Defaults to a string of zeros.
+
+        Returns:
+            bytes: The pseudorandom key (PRK).
+
+        Raises:
+            ValueError: If the hash function returns empty digests.
+        """
+        if not salt:
+            salt = b"\x00" * _digest_size(self.hash_func)
+        return HMACKey(salt, self.hash_func).sign(ikm)
+
+    def expand(self, prk: bytes, info: bytes = b"", length: int = 32) -> bytes:
+        """
+        Expand a pseudorandom key into output keying material.
+
+        Args:
+            prk (bytes): The pseudorandom key from extract().
+            info (bytes): Optional context and application specific information.
+            length (int): The output length in bytes. Default is 32.
+
+        Returns:
+            bytes: The output keying material (OKM).
+
+        Raises:
+            ValueError: If the length is not between 1 and 255 times the digest size,
+                or the hash function returns empty digests.
+        """
+        # The PRK is the key of every expansion step, so its pads are derived once
+        hmac_key = HMACKey(prk, self.hash_func)
+        if hmac_key.digest_size < 1:
+            raise ValueError("The hash function must return a non-empty digest.")
+        if not 1 <= length <= 255 * hmac_key.digest_size:
+            raise ValueError("length must be between 1 and 255 times the digest size.")
+
+        okm = b""
+        block = b""
+        counter = 1
+        while len(okm) < length:
+            block = hmac_key.sign(block + info + bytes([counter]))
+            okm += block
+            counter += 1
+        return okm[:length]
+
+    def derive(
+        self, ikm: bytes, salt: bytes = b"", info: bytes = b"", length: int = 32
+    ) -> bytes:
+        """
+        Derive output keying material with extract() followed by expand().
+
+        Args:
+            ikm (bytes): The input keying material.
+            salt (bytes): The optional salt.
+            info (bytes): Optional context and application specific information.
+            length (int): The output length in bytes. Default is 32.
+
+        Returns:
+            bytes: The output keying material (OKM).
+        """
+        return self.expand(self.extract(ikm, salt), info, length)
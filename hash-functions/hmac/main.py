@@ -1,4 +1,4 @@
-from hmac import HMAC
+from hmac_impl import HMAC
 from utils import setup_argparser, custom_hash_function
 
 
@@ -15,7 +15,8 @@ def main():
         message = args.message.encode("utf-8")
 
         # Create HMAC instance
-        hmac_generator = HMAC(key, message, custom_hash_function)
+        hash_func = custom_hash_function if args.hash == "custom" else args.hash
+        hmac_generator = HMAC(key, message, hash_func)
 
         # Generate and print HMAC
         hmac = hmac_generator.generate()
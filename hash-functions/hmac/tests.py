@@ -1,5 +1,8 @@
+import hashlib
 import unittest
-from hmac import HMAC
+from backends import available_backends, get_backend
+from hmac_impl import HMAC, HMACKey
+from kdf import HKDF, PBKDF2
 from utils import custom_hash_function
 
 
@@ -121,6 +124,217 @@ class TestHMAC(unittest.TestCase):
             hmac_generator = HMAC(key, message, invalid_hash_function)
             hmac_generator.generate()
 
+    def test_failing_hash_function(self):
+        """
+        Test that a hash function failing while the key is prepared raises a
+        RuntimeError from the constructor, like errors raised by generate().
+        """
+
+        def failing_hash_function(data: bytes) -> bytes:
+            raise ValueError("unsupported input")
+
+        with self.assertRaises(RuntimeError):
+            HMAC(b"secret_key", b"test_message", failing_hash_function)
+        with self.assertRaises(ValueError):
+            HMAC(b"secret_key", b"test_message", "sha3")
+
+
+class TestHMACKey(unittest.TestCase):
+    """
+    Test cases for the reusable HMACKey.
+    """
+
+    def test_rfc4231_vectors(self):
+        """
+        Test HMAC-SHA256 against RFC 4231 test cases 1, 2 and 6.
+        """
+        cases = [
+            (b"\x0b" * 20, b"Hi There",
+             "b0344c61d8db38535ca8afceaf0bf12b881dc200c9833da726e9376c2e32cff7"),
+            (b"Jefe", b"what do ya want for nothing?",
+             "5bdcc146bf60754e6a042426089575c75a003f089d2739839dec58b964ec3843"),
+            (b"\xaa" * 131, b"Test Using Larger Than Block-Size Key - Hash Key First",
+             "60e431591ee0b67f0d8a26aacbf5b77f8e0bc6213728c5140546040f0ee37f54"),
+        ]
+        for key, message, expected in cases:
+            hmac_key = HMACKey(key, hashlib.sha256)
+            self.assertTrue(hmac_key.streaming)
+            self.assertEqual(hmac_key.sign(message).hex(), expected)
+            self.assertEqual(HMAC(key, message, hashlib.sha256).generate().hex(), expected)
+
+    def test_sign_many_matches_sign(self):
+        """
+        Test that sign_many() matches sign() for streaming and plain hash functions.
+        """
+        messages = [b"", b"a", b"request %d" % 42, b"x" * 200]
+        for hash_func in (hashlib.sha256, custom_hash_function):
+            hmac_key = HMACKey(b"secret_key", hash_func)
+            self.assertEqual(
+                hmac_key.sign_many(messages), [hmac_key.sign(m) for m in messages]
+            )
+
+    def test_plain_function_matches_hmac(self):
+        """
+        Test that a key bound to a plain hash function matches HMAC.generate().
+        """
+        hmac_key = HMACKey(b"secret_key", custom_hash_function)
+        self.assertFalse(hmac_key.streaming)
+        self.assertEqual(
+            hmac_key.sign(b"hello_world"),
+            HMAC(b"secret_key", b"hello_world", custom_hash_function).generate(),
+        )
+
+    def test_verify(self):
+        """
+        Test single-message verification for valid and tampered tags.
+        """
+        hmac_key = HMACKey(b"Jefe", hashlib.sha256)
+        tag = hmac_key.sign(b"what do ya want for nothing?")
+        self.assertTrue(hmac_key.verify(b"what do ya want for nothing?", tag))
+        self.assertFalse(hmac_key.verify(b"what do ya want for nothing!", tag))
+        self.assertFalse(hmac_key.verify(b"what do ya want for nothing?", tag[:-1]))
+        self.assertTrue(HMAC(b"Jefe", b"what do ya want for nothing?", hashlib.sha256).verify(tag))
+
+    def test_verify_many_bitmap(self):
+        """
+        Test that verify_many() packs results least significant bit first.
+        """
+        hmac_key = HMACKey(b"secret_key", hashlib.sha256)
+        messages = [b"request %d" % i for i in range(21)]
+        pairs = [(m, hmac_key.sign(m)) for m in messages]
+        pairs[3] = (messages[3], b"\x00" * 32)
+        pairs[20] = (messages[19], pairs[20][1])
+
+        expected = bytes([0b11110111, 0b11111111, 0b00001111])
+        self.assertEqual(hmac_key.verify_many(pairs), expected)
+        self.assertEqual(hmac_key.verify_many(pairs, workers=3, chunksize=5), expected)
+
+
+class TestHashBackends(unittest.TestCase):
+    """
+    Test cases for the registry of in-repository hash backends.
+    """
+
+    def test_backend_digests(self):
+        """
+        Test every backend against the known digest of 'abc'.
+        """
+        expected = {
+            "sha256": "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad",
+            "md5": "900150983cd24fb0d6963f7d28e17f72",
+            "md4": "a448017aaf21d8525fc10ae87aa6729d",
+            "md2": "da853b0d3f88d99b30283a69e6ded6bb",
+        }
+        self.assertEqual(available_backends(), sorted(expected))
+        for name, digest in expected.items():
+            state = get_backend(name)(b"a")
+            state.update(b"bc")
+            self.assertEqual(state.digest().hex(), digest)
+            self.assertEqual(len(state.digest()), state.digest_size)
+
+    def test_hmac_over_backends(self):
+        """
+        Test HMAC with in-repository hashes against known HMAC-SHA256 and HMAC-MD5 values.
+        """
+        message = b"The quick brown fox jumps over the lazy dog"
+        self.assertEqual(
+            HMAC(b"key", message, "sha256").generate().hex(),
+            "f7bc83f430538424b13298e6aa6fb143ef4d59a14946175997479dbc2d1a3cd8",
+        )
+        self.assertEqual(
+            HMACKey(b"key", "md5").sign(message).hex(),
+            "80070713463e7749b90c2dc24911e275",
+        )
+        self.assertEqual(HMACKey(b"key", "md2").block_size, 16)
+
+    def test_unknown_backend(self):
+        """
+        Test that an unknown backend name raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            get_backend("sha3")
+
+
+class TestKeyDerivation(unittest.TestCase):
+    """
+    Test cases for PBKDF2 and HKDF built on HMACKey.
+    """
+
+    def test_pbkdf2_matches_hashlib(self):
+        """
+        Test PBKDF2 against hashlib.pbkdf2_hmac, serially and with parallel blocks.
+        """
+        expected = hashlib.pbkdf2_hmac("sha256", b"password", b"salt", 500, 80)
+        pbkdf2 = PBKDF2(hashlib.sha256, iterations=500)
+        self.assertEqual(pbkdf2.derive(b"password", b"salt", 80, workers=1), expected)
+        self.assertEqual(pbkdf2.derive(b"password", b"salt", 80, workers=3), expected)
+
+    def test_pbkdf2_in_repo_sha256(self):
+        """
+        Test PBKDF2 over the in-repository SHA-256 backend.
+        """
+        expected = hashlib.pbkdf2_hmac("sha256", b"password", b"salt", 20)
+        pbkdf2 = PBKDF2("sha256", iterations=20)
+        self.assertEqual(pbkdf2.derive(b"password", b"salt", workers=1), expected)
+
+    def test_pbkdf2_invalid_iterations(self):
+        """
+        Test that a non-positive iteration count raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            PBKDF2("sha256", iterations=0)
+
+    def test_pbkdf2_invalid_workers(self):
+        """
+        Test that a non-positive worker count raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            PBKDF2("sha256", iterations=1).derive(b"password", b"salt", workers=0)
+
+    def test_hkdf_rfc5869_vector(self):
+        """
+        Test HKDF-SHA256 against RFC 5869 test case 1.
+        """
+        hkdf = HKDF("sha256")
+        ikm = b"\x0b" * 22
+        salt = bytes(range(13))
+        info = bytes(range(0xF0, 0xFA))
+        self.assertEqual(
+            hkdf.extract(ikm, salt).hex(),
+            "077709362c2e32df0ddc3f0dc47bba6390b6c73bb50f9c3122ec844ad7c2b3e5",
+        )
+        self.assertEqual(
+            hkdf.derive(ikm, salt, info, 42).hex(),
+            "3cb25f25faacd57a90434f64d0362f2a2d2d0a90cf1a5a4c"
+            "5db02d56ecc4c5bf34007208d5b887185865",
+        )
+        with self.assertRaises(ValueError):
+            hkdf.expand(b"prk", length=255 * 32 + 1)
+
+    def test_plain_hash_function(self):
+        """
+        Test key derivation over a plain hash function whose output for b"" is empty.
+        """
+
+        def truncated_sha256(data: bytes) -> bytes:
+            return hashlib.sha256(data).digest()[: len(data)]
+
+        self.assertEqual(HMACKey(b"key", truncated_sha256).digest_size, 32)
+        self.assertEqual(HMACKey(b"key", custom_hash_function).digest_size, 64)
+        key = PBKDF2(truncated_sha256, iterations=5).derive(b"password", b"salt", workers=1)
+        self.assertEqual(len(key), 32)
+        self.assertEqual(len(HKDF(truncated_sha256).derive(b"ikm", length=64)), 64)
+
+        def empty_hash(data: bytes) -> bytes:
+            return b""
+
+        with self.assertRaises(ValueError):
+            PBKDF2(empty_hash).derive(b"password", b"salt", workers=1)
+        with self.assertRaises(ValueError):
+            HKDF(empty_hash).extract(b"ikm")
+        with self.assertRaises(ValueError):
+            HKDF(empty_hash).expand(b"prk")
+
 
 if __name__ == "__main__":
     unittest.main()
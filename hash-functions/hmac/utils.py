@@ -1,5 +1,7 @@
 import argparse
 
+from backends import available_backends
+
 
 def setup_argparser() -> argparse.ArgumentParser:
     """
@@ -9,12 +11,19 @@ def setup_argparser() -> argparse.ArgumentParser:
         argparse.ArgumentParser: Argument parser
     """
     parser = argparse.ArgumentParser(
-        description="Generate HMAC using a custom hash function."
+        description="Generate HMAC using one of the hash functions in this repository."
     )
     parser.add_argument("--key", type=str, required=True, help="Secret key for HMAC.")
     parser.add_argument(
         "--message", type=str, required=True, help="Message to authenticate."
     )
+    parser.add_argument(
+        "--hash",
+        type=str,
+        choices=available_backends() + ["custom"],
+        default="sha256",
+        help="Hash function to use. 'custom' is the demonstration hash. Default is sha256.",
+    )
     return parser
 
 
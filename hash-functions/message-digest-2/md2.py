@@ -1,4 +1,4 @@
-from typing import List
+from typing import Union
 
 
 class MD2:
@@ -25,90 +25,173 @@ class MD2:
         242, 239, 183, 14, 102, 88, 208, 228, 166, 119, 114, 248, 235, 117, 75, 10,
         49, 68, 80, 180, 143, 237, 31, 26, 219, 153, 141, 51, 159, 17, 131, 20
     ]
-    def __init__(self) -> None:
-        """
-        Initialize the MD2 object.
-
-        Attributes:
-            state (List[int]): 48-byte buffer.
-            checksum (List[int]): 16-byte checksum.
-            buffer (List[int]): Input buffer.
-        """
-        self.state: List[int] = [0] * 48
-        self.checksum: List[int] = [0] * 16
-        self.buffer: List[int] = []
+    name: str = "md2"
+    block_size: int = 16
+    digest_size: int = 16
 
-    def _pad_message(self, message: bytes) -> bytes:
+    def __init__(self, data: bytes = b"") -> None:
         """
-        Pad the message according to the MD2 specification.
+        Initialize the MD2 object.
 
         Args:
-            message (bytes): The input message to pad.
+            data (bytes): Optional initial data to feed into the hash.
 
-        Returns:
-            bytes: The padded message
+        Attributes:
+            state (bytearray): 48-byte buffer.
+            checksum (bytearray): 16-byte checksum.
+            buffer (bytearray): Partial input block carried over between update() calls.
         """
-        padding_length = 16 - (len(message) % 16)
-        padding = bytes([padding_length] * padding_length)
-        return message + padding
+        self.state = bytearray(48)
+        self.checksum = bytearray(16)
+        self.buffer = bytearray()
+        if data:
+            self.update(data)
 
-    def _update_checksum(self, block: List[int]) -> None:
+    def _update_checksum(self, block: bytes) -> None:
         """
         Update the checksum based on the current block.
 
         Args:
-            block (List[int]): The current 16-byte block.
+            block (bytes): The current 16-byte block.
         """
-        x = self.checksum[-1]
+        S = self.S
+        checksum = self.checksum
+        x = checksum[15]
         for i in range(16):
-            x = self.S[block[i] ^ x] ^ self.checksum[i]
-            self.checksum[i] = x
+            x = S[block[i] ^ x] ^ checksum[i]
+            checksum[i] = x
 
-    def _process_block(self, block: List[int]) -> None:
+    def _process_block(self, block: bytes) -> None:
         """
         Process a single 16-byte block.
 
         Args:
-            block (List[int]): The 16-byte block to process.
+            block (bytes): The 16-byte block to process.
         """
+        S = self.S
+        state = self.state
+
         # Update the state
-        for i in range(16):
-            self.state[i + 16] = block[i]
-            self.state[i + 32] = self.state[i + 16] ^ self.state[i]
+        state[16:32] = block
+        state[32:48] = (
+            int.from_bytes(block, "little") ^ int.from_bytes(state[:16], "little")
+        ).to_bytes(16, "little")
 
         t = 0
         for i in range(18):
             for j in range(48):
-                self.state[j] ^= self.S[t]
-                t = self.state[j]
+                t = state[j] ^ S[t]
+                state[j] = t
 
-            t = (t + i) % 256
+            t = (t + i) & 0xFF
 
-    def hash(self, message: bytes) -> str:
+    def _process_blocks(self, data: Union[bytes, memoryview], end: int) -> None:
         """
-        Compute the MD2 hash of the input message.
+        Process the 16-byte blocks in data[0:end], updating state and checksum.
+
+        Args:
+            data (Union[bytes, memoryview]): The data holding whole blocks.
+            end (int): The end offset, a multiple of 16.
+        """
+        process_block = self._process_block
+        update_checksum = self._update_checksum
+
+        for offset in range(0, end, 16):
+            block = bytes(data[offset : offset + 16])
+            process_block(block)
+            update_checksum(block)
+
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Feed more data into the hash.
+
+        Full 16-byte blocks are processed as soon as they arrive; at most one
+        partial block is buffered between calls, so large inputs can be hashed
+        chunk by chunk.
 
         Args:
-            message (bytes): The input message to hash.
+            data (Union[bytes, bytearray, memoryview]): The data to append.
+
+        Raises:
+            TypeError: If the data is not a bytes-like object.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Input message must be of type bytes, bytearray or memoryview.")
+
+        data = memoryview(data).cast("B")
+
+        # Complete a previously buffered partial block first
+        if self.buffer:
+            fill = 16 - len(self.buffer)
+            self.buffer += data[:fill]
+            data = data[fill:]
+            if len(self.buffer) < 16:
+                return
+            self._process_blocks(self.buffer, 16)
+            self.buffer = bytearray()
+
+        # Process all full blocks straight from the input
+        end = len(data) - len(data) % 16
+        self._process_blocks(data, end)
+
+        self.buffer = bytearray(data[end:])
+
+    def copy(self) -> "MD2":
+        """
+        Return a copy of the current hash state.
 
         Returns:
-            str: The MD2 hash as a hexadecimal string.
+            MD2: A new object with the same internal state.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.state = bytearray(self.state)
+        clone.checksum = bytearray(self.checksum)
+        clone.buffer = bytearray(self.buffer)
+        return clone
+
+    def digest(self) -> bytes:
+        """
+        Return the digest of the data fed so far.
+
+        The internal state is left untouched, so more data can still be added.
+
+        Returns:
+            bytes: The 16-byte MD2 digest.
         """
-        if not isinstance(message, bytes):
-            raise TypeError("Input message must be of type bytes.")
+        final = self.copy()
 
-        # Step 1: Pad the message
-        padded_message = self._pad_message(message)
+        # Pad the buffered tail, then append the checksum as a final block
+        padding_length = 16 - len(final.buffer)
+        final.update(bytes([padding_length] * padding_length))
+        final._process_block(bytes(final.checksum))
 
-        # Step 2: Process each 16-byte block
-        for i in range(0, len(padded_message), 16):
-            block = list(padded_message[i : i + 16])
-            self._process_block(block)
-            self._update_checksum(block)
+        return bytes(final.state[:16])
 
-        # Step 3: Append the checksum as a final block
-        self._process_block(self.checksum)
+    def hexdigest(self) -> str:
+        """
+        Return the digest of the data fed so far as a hexadecimal string.
 
-        # Step 4: The hash is the first 16 bytes of the state
-        hash_bytes = bytes(self.state[:16])
-        return hash_bytes.hex()
+        Returns:
+            str: The MD2 hash as a 32-character hexadecimal string.
+        """
+        return self.digest().hex()
+
+    def hash(self, message: Union[bytes, bytearray, memoryview]) -> str:
+        """
+        Compute the MD2 hash of the input message.
+
+        The message is hashed on a fresh state, so the same instance can be
+        reused and any data previously passed to update() is unaffected.
+
+        Args:
+            message (Union[bytes, bytearray, memoryview]): The input message to hash.
+
+        Returns:
+            str: The MD2 hash as a hexadecimal string.
+
+        Raises:
+            TypeError: If the message is not a bytes-like object.
+        """
+        md2 = self.__class__()
+        md2.update(message)
+        return md2.hexdigest()
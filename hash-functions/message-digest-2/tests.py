@@ -64,11 +64,12 @@ class TestMD2(unittest.TestCase):
         Test that the padding function works correctly.
         The input length is not a multiple of 16, so padding should be added.
         """
-        md2 = MD2()
         input_message = b"123456789012345"  # 15 bytes
-        padded_message = md2._pad_message(input_message)
-        self.assertEqual(len(padded_message), 16)  # Padded to 16 bytes
-        self.assertEqual(padded_message[-1], 1)  # Last byte should be 1
+        # Padded to 16 bytes; the last byte should be 1
+        md2 = MD2()
+        md2._process_blocks(input_message + b"\x01", 16)
+        md2._process_block(bytes(md2.checksum))
+        self.assertEqual(MD2(input_message).digest(), bytes(md2.state[:16]))
 
     def test_checksum_update(self):
         """
@@ -89,7 +90,30 @@ class TestMD2(unittest.TestCase):
         block = [0x61] * 16  # Block of 16 'a' characters
         md2._process_block(block)
         # The state should be updated after processing the block
-        self.assertNotEqual(md2.state, [0] * 48)
+        self.assertNotEqual(md2.state, bytearray(48))
+
+    def test_streaming_update(self):
+        """
+        Test that bytes fed in chunks across block boundaries give the same hash.
+        """
+        data = bytes(range(256)) * 2
+        md2 = MD2()
+        for start in range(0, len(data), 7):
+            md2.update(data[start : start + 7])
+        self.assertEqual(md2.hexdigest(), MD2().hash(data))
+        self.assertEqual(MD2(b"abc").hexdigest(), "da853b0d3f88d99b30283a69e6ded6bb")
+
+    def test_copy_and_hash_reuse(self):
+        """
+        Test that copies continue independently and hash() leaves the state untouched.
+        """
+        md2 = MD2(b"The quick brown fox ")
+        fork = md2.copy()
+        self.assertEqual(md2.hash(b""), "8350e5a3e24c153df2275c9f80692773")
+        md2.update(b"jumps over the lazy dog")
+        fork.update(b"jumps")
+        self.assertEqual(md2.hexdigest(), "03d85a0d629d2c442e987525319fc471")
+        self.assertEqual(fork.hexdigest(), MD2().hash(b"The quick brown fox jumps"))
 
 
 if __name__ == "__main__":
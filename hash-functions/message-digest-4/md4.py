@@ -1,4 +1,81 @@
+import os
 import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Message word indices of the four-step groups of rounds 2 and 3
+_ROUND_2 = [(i, i + 4, i + 8, i + 12) for i in range(4)]
+_ROUND_3 = [(0, 8, 4, 12), (2, 10, 6, 14), (1, 9, 5, 13), (3, 11, 7, 15)]
+_BLOCK_WORDS = struct.Struct("<16I")
+
+
+def _process_blocks(
+    state: Tuple[int, int, int, int],
+    data: Union[bytes, memoryview],
+    end: int,
+    unpack_from=_BLOCK_WORDS.unpack_from,
+) -> Tuple[int, int, int, int]:
+    """
+    Process the 64-byte blocks in data[0:end] with the state held in locals.
+
+    The round functions are inlined and every round is unrolled by four
+    steps, so the shift amounts are literals and the registers never have to
+    be rotated.
+
+    Args:
+        state (Tuple[int, int, int, int]): The (A, B, C, D) hash state.
+        data (Union[bytes, memoryview]): The data holding whole blocks.
+        end (int): The end offset, a multiple of 64.
+
+    Returns:
+        Tuple[int, int, int, int]: The updated (A, B, C, D) hash state.
+    """
+    A, B, C, D = state
+    for offset in range(0, end, 64):
+        x = unpack_from(data, offset)
+        a, b, c, d = A, B, C, D
+
+        # Round 1: F(x, y, z) = (x & y) | (~x & z)
+        for k in range(0, 16, 4):
+            a = (a + (d ^ (b & (c ^ d))) + x[k]) & 0xFFFFFFFF
+            a = ((a << 3) | (a >> 29)) & 0xFFFFFFFF
+            d = (d + (c ^ (a & (b ^ c))) + x[k + 1]) & 0xFFFFFFFF
+            d = ((d << 7) | (d >> 25)) & 0xFFFFFFFF
+            c = (c + (b ^ (d & (a ^ b))) + x[k + 2]) & 0xFFFFFFFF
+            c = ((c << 11) | (c >> 21)) & 0xFFFFFFFF
+            b = (b + (a ^ (c & (d ^ a))) + x[k + 3]) & 0xFFFFFFFF
+            b = ((b << 19) | (b >> 13)) & 0xFFFFFFFF
+
+        # Round 2: G(x, y, z) = (x & y) | (x & z) | (y & z)
+        for k0, k1, k2, k3 in _ROUND_2:
+            a = (a + ((b & c) | (d & (b | c))) + x[k0] + 0x5A827999) & 0xFFFFFFFF
+            a = ((a << 3) | (a >> 29)) & 0xFFFFFFFF
+            d = (d + ((a & b) | (c & (a | b))) + x[k1] + 0x5A827999) & 0xFFFFFFFF
+            d = ((d << 5) | (d >> 27)) & 0xFFFFFFFF
+            c = (c + ((d & a) | (b & (d | a))) + x[k2] + 0x5A827999) & 0xFFFFFFFF
+            c = ((c << 9) | (c >> 23)) & 0xFFFFFFFF
+            b = (b + ((c & d) | (a & (c | d))) + x[k3] + 0x5A827999) & 0xFFFFFFFF
+            b = ((b << 13) | (b >> 19)) & 0xFFFFFFFF
+
+        # Round 3: H(x, y, z) = x ^ y ^ z
+        for k0, k1, k2, k3 in _ROUND_3:
+            a = (a + (b ^ c ^ d) + x[k0] + 0x6ED9EBA1) & 0xFFFFFFFF
+            a = ((a << 3) | (a >> 29)) & 0xFFFFFFFF
+            d = (d + (a ^ b ^ c) + x[k1] + 0x6ED9EBA1) & 0xFFFFFFFF
+            d = ((d << 9) | (d >> 23)) & 0xFFFFFFFF
+            c = (c + (d ^ a ^ b) + x[k2] + 0x6ED9EBA1) & 0xFFFFFFFF
+            c = ((c << 11) | (c >> 21)) & 0xFFFFFFFF
+            b = (b + (c ^ d ^ a) + x[k3] + 0x6ED9EBA1) & 0xFFFFFFFF
+            b = ((b << 15) | (b >> 17)) & 0xFFFFFFFF
+
+        A = (A + a) & 0xFFFFFFFF
+        B = (B + b) & 0xFFFFFFFF
+        C = (C + c) & 0xFFFFFFFF
+        D = (D + d) & 0xFFFFFFFF
+
+    return A, B, C, D
 
 
 class MD4:
@@ -7,126 +84,279 @@ class MD4:
 
     Attributes:
         A, B, C, D (int): Initial buffer values for MD4.
-        shift (list): List of shift amounts for each round.
     """
 
-    def __init__(self):
+    name: str = "md4"
+    block_size: int = 64
+    digest_size: int = 16
+
+    def __init__(self, data: bytes = b""):
         """
-        Initialize the MD4 class with initial buffer values and shift amounts.
+        Initialize the MD4 class with initial buffer values.
+
+        Args:
+            data (bytes): Optional initial data to feed into the hash.
         """
         self.A = 0x67452301
         self.B = 0xEFCDAB89
         self.C = 0x98BADCFE
         self.D = 0x10325476
-        self.shift = [3, 7, 11, 19, 3, 5, 9, 13, 3, 9, 11, 15]
 
-    @staticmethod
-    def left_rotate(value: int, shift: int) -> int:
+        # Partial block carried over between update() calls
+        self._buffer: bytes = b""
+        self._length: int = 0
+        if data:
+            self.update(data)
+
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
         """
-        Perform a left rotation (circular shift) on a 32-bit integer.
+        Feed more data into the hash.
+
+        Full 64-byte blocks are processed as soon as they arrive; at most one
+        partial block is buffered between calls.
 
         Args:
-            value (int): The value to rotate.
-            shift (int): The number of bits to rotate.
+            data (Union[bytes, bytearray, memoryview]): The data to append.
 
-        Returns:
-            int: The rotated value.
+        Raises:
+            TypeError: If the data is not a bytes-like object.
         """
-        return ((value << shift) & 0xFFFFFFFF) | (value >> (32 - shift))
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Input must be of type bytes, bytearray or memoryview.")
 
-    def _f(self, x: int, y: int, z: int) -> int:
-        """
-        MD4 F function: (x & y) | (~x & z).
-        """
-        return (x & y) | (~x & z)
+        data = memoryview(data).cast("B")
+        self._length += len(data)
+        state = (self.A, self.B, self.C, self.D)
+
+        # Complete a previously buffered partial block first
+        if self._buffer:
+            fill = 64 - len(self._buffer)
+            self._buffer += bytes(data[:fill])
+            data = data[fill:]
+            if len(self._buffer) < 64:
+                return
+            state = _process_blocks(state, self._buffer, 64)
+            self._buffer = b""
 
-    def _g(self, x: int, y: int, z: int) -> int:
+        # Process all full blocks straight from the input
+        end = len(data) - len(data) % 64
+        self.A, self.B, self.C, self.D = _process_blocks(state, data, end)
+
+        self._buffer = bytes(data[end:])
+
+    def copy(self) -> "MD4":
         """
-        MD4 G function: (x & y) | (x & z) | (y & z).
+        Return a copy of the current hash state.
+
+        Returns:
+            MD4: A new object with the same internal state.
         """
-        return (x & y) | (x & z) | (y & z)
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        return clone
 
-    def _h(self, x: int, y: int, z: int) -> int:
+    def digest(self) -> bytes:
         """
-        MD4 H function: x ^ y ^ z.
+        Return the digest of the data fed so far.
+
+        The internal state is left untouched, so more data can still be added.
+
+        Returns:
+            bytes: The 16-byte MD4 digest.
         """
-        return x ^ y ^ z
+        # Pad the buffered tail with the '1' bit, zeros and the length in bits
+        tail = (
+            self._buffer
+            + b"\x80"
+            + b"\x00" * ((55 - len(self._buffer)) % 64)
+            + struct.pack("<Q", (self._length * 8) & 0xFFFFFFFFFFFFFFFF)
+        )
+        state = _process_blocks((self.A, self.B, self.C, self.D), tail, len(tail))
+        return struct.pack("<4I", *state)
 
-    def _process_block(self, block: bytes) -> None:
+    def hexdigest(self) -> str:
         """
-        Process a 64-byte block of data.
+        Return the digest of the data fed so far as a hexadecimal string.
 
-        Args:
-            block (bytes): The 64-byte block to process.
-        """
-        # Unpack the block into 16 32-bit words
-        X = list(struct.unpack("<16I", block))
-
-        # Save the current state
-        AA, BB, CC, DD = self.A, self.B, self.C, self.D
-
-        # Round I
-        for i in range(16):
-            k = i
-            s = self.shift[i % 4]
-            self.A = self.left_rotate(
-                (self.A + self._f(self.B, self.C, self.D) + X[k]) & 0xFFFFFFFF, s
-            )
-
-            # Rotate the buffers
-            self.A, self.B, self.C, self.D = self.D, self.A, self.B, self.C
-
-        # Round 2
-        for i in range(16):
-            k = (i % 4) * 4 + (i // 4)
-            s = self.shift[4 + (i % 4)]
-            self.A = self.left_rotate(
-                (self.A + self._g(self.B, self.C, self.D) + X[k] + 0x5A827999)
-                & 0xFFFFFFFF,
-                s,
-            )
-
-            # Rotate the buffers
-            self.A, self.B, self.C, self.D = self.D, self.A, self.B, self.C
-
-        # Round 3
-        for i in range(16):
-            k = [0, 8, 4, 12, 2, 10, 6, 14, 1, 9, 5, 13, 3, 11, 7, 15][i]
-            s = self.shift[8 + (i % 4)]
-            self.A = self.left_rotate(
-                (self.A + self._h(self.B, self.C, self.D) + X[k] + 0x6ED9EBA1)
-                & 0xFFFFFFFF,
-                s,
-            )
-
-            # Rotate the buffers
-            self.A, self.B, self.C, self.D = self.D, self.A, self.B, self.C
-
-        # Update the state
-        self.A = (self.A + AA) & 0xFFFFFFFF
-        self.B = (self.B + BB) & 0xFFFFFFFF
-        self.C = (self.C + CC) & 0xFFFFFFFF
-        self.D = (self.D + DD) & 0xFFFFFFFF
+        Returns:
+            str: The MD4 hash as a 32-character hexadecimal string.
+        """
+        return self.digest().hex()
 
     def hash(self, message: bytes) -> bytes:
         """
         Compute the MD4 hash of a message.
 
+        The message is hashed on a fresh state, so the same instance can be
+        reused and any data previously passed to update() is unaffected.
+
         Args:
             message (bytes): The message to hash.
 
         Returns:
             bytes: The 16-byte MD4 hash of the message.
+
+        Raises:
+            TypeError: If the message is not a bytes-like object.
+        """
+        hasher = self.__class__()
+        hasher.update(message)
+        return hasher.digest()
+
+    @staticmethod
+    def nt_hash(password: str) -> bytes:
         """
-        # Pad the message
-        original_length = len(message)
-        message += b"\x80"
-        message += b"\x00" * ((56 - (original_length + 1) % 64) % 64)
-        message += struct.pack("<Q", original_length * 8)
+        Compute the NT hash of a password: the MD4 hash of its UTF-16LE encoding.
+
+        Args:
+            password (str): The password.
 
-        # Process each 64-byte block
-        for i in range(0, len(message), 64):
-            self._process_block(message[i : i + 64])
+        Returns:
+            bytes: The 16-byte NT hash.
+        """
+        return MD4(password.encode("utf-16-le")).digest()
+
+    @staticmethod
+    def hash_many(
+        messages: Iterable[bytes], workers: Optional[int] = None, chunksize: int = 1024
+    ) -> Iterator[bytes]:
+        """
+        Compute the MD4 hashes of many independent messages.
 
-        # Pack the final state into a 16-byte hash
-        return struct.pack("<4I", self.A, self.B, self.C, self.D)
+        Messages are grouped into chunks that are hashed in a process pool, so
+        the IPC cost is paid per chunk rather than per message. Only a bounded
+        number of chunks is in flight at any time and results are yielded in
+        input order, so memory does not grow with the batch.
+
+        Args:
+            messages (Iterable[bytes]): The messages to hash.
+            workers (Optional[int]): Number of worker processes. Defaults to the
+                CPU count; 1 hashes in the calling process without a pool.
+            chunksize (int): Number of messages sent to a worker at once.
+
+        Returns:
+            Iterator[bytes]: The 16-byte hashes, in the order of the input.
+
+        Raises:
+            ValueError: If workers or chunksize is not positive.
+        """
+        return _map_batches(_hash_batch, messages, workers, chunksize)
+
+    @staticmethod
+    def nt_hash_many(
+        passwords: Iterable[str], workers: Optional[int] = None, chunksize: int = 1024
+    ) -> Iterator[bytes]:
+        """
+        Compute the NT hashes of many passwords, e.g. a credential audit list.
+
+        Works like hash_many(), with the UTF-16LE encoding done in the workers.
+
+        Args:
+            passwords (Iterable[str]): The passwords to hash.
+            workers (Optional[int]): Number of worker processes. Defaults to the
+                CPU count; 1 hashes in the calling process without a pool.
+            chunksize (int): Number of passwords sent to a worker at once.
+
+        Returns:
+            Iterator[bytes]: The 16-byte NT hashes, in the order of the input.
+
+        Raises:
+            ValueError: If workers or chunksize is not positive.
+        """
+        return _map_batches(_nt_hash_batch, passwords, workers, chunksize)
+
+
+def _hash_batch(messages: List[bytes]) -> List[bytes]:
+    """
+    Hash a chunk of messages; runs inside the worker processes of hash_many().
+
+    Args:
+        messages (List[bytes]): The messages to hash.
+
+    Returns:
+        List[bytes]: The 16-byte hashes of the messages.
+    """
+    return [MD4(message).digest() for message in messages]
+
+
+def _nt_hash_batch(passwords: List[str]) -> List[bytes]:
+    """
+    NT-hash a chunk of passwords; runs inside the worker processes of nt_hash_many().
+
+    Args:
+        passwords (List[str]): The passwords to hash.
+
+    Returns:
+        List[bytes]: The 16-byte NT hashes of the passwords.
+    """
+    return [MD4(password.encode("utf-16-le")).digest() for password in passwords]
+
+
+def _map_batches(
+    batch_func: Callable[[list], List[bytes]],
+    items: Iterable,
+    workers: Optional[int],
+    chunksize: int,
+) -> Iterator[bytes]:
+    """
+    Run a chunk worker over the inputs of MD4.hash_many() or MD4.nt_hash_many().
+
+    The arguments are checked here, before the generator starts, so bad
+    values raise at call time rather than on the first next().
+
+    Args:
+        batch_func (Callable[[list], List[bytes]]): _hash_batch or _nt_hash_batch.
+        items (Iterable): The messages or passwords.
+        workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+        chunksize (int): Number of inputs per chunk.
+
+    Returns:
+        Iterator[bytes]: The 16-byte hashes, in the order of the input.
+
+    Raises:
+        ValueError: If workers or chunksize is not positive.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunksize < 1:
+        raise ValueError("workers and chunksize must be positive.")
+
+    items = iter(items)
+    chunks = iter(lambda: list(islice(items, chunksize)), [])
+    if workers == 1:
+        return (digest for chunk in chunks for digest in batch_func(chunk))
+    return _map_windows(batch_func, chunks, workers)
+
+
+def _map_windows(
+    batch_func: Callable[[list], List[bytes]], chunks: Iterator[list], workers: int
+) -> Iterator[bytes]:
+    """
+    Hash chunks in a process pool, keeping about two chunks per worker queued.
+
+    A new chunk is submitted each time the oldest one is collected, so the
+    workers never wait for a whole batch of chunks to drain, and memory stays
+    bounded however long the input is.
+
+    Args:
+        batch_func (Callable[[list], List[bytes]]): _hash_batch or _nt_hash_batch.
+        chunks (Iterator[list]): The chunks of inputs.
+        workers (int): Number of worker processes.
+
+    Yields:
+        bytes: The 16-byte hashes, in the order of the input.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque(
+            executor.submit(batch_func, chunk) for chunk in islice(chunks, 2 * workers)
+        )
+        try:
+            while in_flight:
+                digests = in_flight.popleft().result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    in_flight.append(executor.submit(batch_func, chunk))
+                yield from digests
+        finally:
+            for future in in_flight:
+                future.cancel()
@@ -79,6 +79,57 @@ class TestMD4(unittest.TestCase):
         ):
             md4.hash("invalid input")  # Passing a string instead of bytes
 
+    def test_streaming_update(self):
+        """
+        Test that bytes fed in uneven chunks give the same hash as one call.
+        """
+        data = bytes(range(256)) * 3
+        md4 = MD4()
+        for start in range(0, len(data), 45):
+            md4.update(data[start : start + 45])
+        self.assertEqual(md4.digest(), MD4().hash(data))
+        self.assertEqual(MD4(b"a" * 1024).hexdigest(), "0eab1d76a65a97bf3657150b586e4155")
+
+    def test_copy_and_hash_reuse(self):
+        """
+        Test that copies continue independently and hash() leaves the state untouched.
+        """
+        md4 = MD4(b"The quick brown fox ")
+        fork = md4.copy()
+        self.assertEqual(md4.hash(b"a").hex(), "bde52cb31de33e46245e05fbdbd6fb24")
+        md4.update(b"jumps over the lazy dog")
+        fork.update(b"jumps")
+        self.assertEqual(md4.hexdigest(), "1bee69a46ba811185c194762abaeae90")
+        self.assertEqual(fork.digest(), MD4().hash(b"The quick brown fox jumps"))
+
+    def test_nt_hash(self):
+        """
+        Test the NT hash (MD4 of the UTF-16LE password) against known values.
+        """
+        self.assertEqual(MD4.nt_hash("password").hex(), "8846f7eaee8fb117ad06bdd830b7586c")
+        self.assertEqual(MD4.nt_hash("").hex(), "31d6cfe0d16ae931b73c59d7e0c089c0")
+
+    def test_hash_many_preserves_order(self):
+        """
+        Test that the batch methods yield the hashes in input order.
+        """
+        messages = [b"message %d" % i for i in range(50)]
+        expected = [MD4().hash(message) for message in messages]
+        self.assertEqual(list(MD4.hash_many(messages, workers=1)), expected)
+        self.assertEqual(
+            list(MD4.hash_many(iter(messages), workers=2, chunksize=7)), expected
+        )
+
+        passwords = ["password", "hunter2", ""] * 5
+        expected = [MD4.nt_hash(password) for password in passwords]
+        self.assertEqual(
+            list(MD4.nt_hash_many(passwords, workers=2, chunksize=4)), expected
+        )
+        with self.assertRaises(ValueError):
+            MD4.hash_many([b"a"], chunksize=0)
+        with self.assertRaises(ValueError):
+            MD4.hash_many([b"a"], workers=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,123 @@
-from typing import List
+import math
+import struct
+from typing import List, Tuple, Union
+
+# Shift amounts for each of the 64 steps
+SHIFT_AMOUNTS: List[int] = [
+    7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
+    5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20,
+    4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
+    6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21
+]
+
+# Sine function constants, computed once at import time
+T: List[int] = [int(abs(math.sin(i + 1)) * 2**32) & 0xFFFFFFFF for i in range(64)]
+
+# Message word index used by each of the 64 steps
+MESSAGE_INDEX: List[int] = (
+    [i for i in range(16)]
+    + [(5 * i + 1) % 16 for i in range(16, 32)]
+    + [(3 * i + 5) % 16 for i in range(32, 48)]
+    + [(7 * i) % 16 for i in range(48, 64)]
+)
+
+
+def _round_schedule(round_index: int) -> List[Tuple[int, ...]]:
+    """
+    Group the word indices and constants of one round into four-step tuples.
+
+    Args:
+        round_index (int): The round, from 0 to 3.
+
+    Returns:
+        List[Tuple[int, ...]]: Four (k0, k1, k2, k3, t0, t1, t2, t3) tuples.
+    """
+    start = 16 * round_index
+    return [
+        tuple(MESSAGE_INDEX[start + i : start + i + 4]) + tuple(T[start + i : start + i + 4])
+        for i in range(0, 16, 4)
+    ]
+
+
+_ROUND_1 = _round_schedule(0)
+_ROUND_2 = _round_schedule(1)
+_ROUND_3 = _round_schedule(2)
+_ROUND_4 = _round_schedule(3)
+_CHUNK_WORDS = struct.Struct("<16I")
+
+
+def _process_chunks_fast(
+    state: Tuple[int, int, int, int],
+    data: Union[bytes, memoryview],
+    end: int,
+    unpack_from=_CHUNK_WORDS.unpack_from,
+) -> Tuple[int, int, int, int]:
+    """
+    Process the 512-bit chunks in data[0:end] with the precomputed schedules.
+
+    Each round has its own loop with the round function inlined, unrolled by
+    four steps so the shift amounts are literals and the registers never have
+    to be rotated.
+
+    Args:
+        state (Tuple[int, int, int, int]): The (A, B, C, D) hash state.
+        data (Union[bytes, memoryview]): The data holding whole chunks.
+        end (int): The end offset, a multiple of 64.
+
+    Returns:
+        Tuple[int, int, int, int]: The updated (A, B, C, D) hash state.
+    """
+    A, B, C, D = state
+    for offset in range(0, end, 64):
+        x = unpack_from(data, offset)
+        a, b, c, d = A, B, C, D
+
+        for k0, k1, k2, k3, t0, t1, t2, t3 in _ROUND_1:
+            a = (a + (d ^ (b & (c ^ d))) + x[k0] + t0) & 0xFFFFFFFF
+            a = (b + ((a << 7) | (a >> 25))) & 0xFFFFFFFF
+            d = (d + (c ^ (a & (b ^ c))) + x[k1] + t1) & 0xFFFFFFFF
+            d = (a + ((d << 12) | (d >> 20))) & 0xFFFFFFFF
+            c = (c + (b ^ (d & (a ^ b))) + x[k2] + t2) & 0xFFFFFFFF
+            c = (d + ((c << 17) | (c >> 15))) & 0xFFFFFFFF
+            b = (b + (a ^ (c & (d ^ a))) + x[k3] + t3) & 0xFFFFFFFF
+            b = (c + ((b << 22) | (b >> 10))) & 0xFFFFFFFF
+
+        for k0, k1, k2, k3, t0, t1, t2, t3 in _ROUND_2:
+            a = (a + (c ^ (d & (b ^ c))) + x[k0] + t0) & 0xFFFFFFFF
+            a = (b + ((a << 5) | (a >> 27))) & 0xFFFFFFFF
+            d = (d + (b ^ (c & (a ^ b))) + x[k1] + t1) & 0xFFFFFFFF
+            d = (a + ((d << 9) | (d >> 23))) & 0xFFFFFFFF
+            c = (c + (a ^ (b & (d ^ a))) + x[k2] + t2) & 0xFFFFFFFF
+            c = (d + ((c << 14) | (c >> 18))) & 0xFFFFFFFF
+            b = (b + (d ^ (a & (c ^ d))) + x[k3] + t3) & 0xFFFFFFFF
+            b = (c + ((b << 20) | (b >> 12))) & 0xFFFFFFFF
+
+        for k0, k1, k2, k3, t0, t1, t2, t3 in _ROUND_3:
+            a = (a + (b ^ c ^ d) + x[k0] + t0) & 0xFFFFFFFF
+            a = (b + ((a << 4) | (a >> 28))) & 0xFFFFFFFF
+            d = (d + (a ^ b ^ c) + x[k1] + t1) & 0xFFFFFFFF
+            d = (a + ((d << 11) | (d >> 21))) & 0xFFFFFFFF
+            c = (c + (d ^ a ^ b) + x[k2] + t2) & 0xFFFFFFFF
+            c = (d + ((c << 16) | (c >> 16))) & 0xFFFFFFFF
+            b = (b + (c ^ d ^ a) + x[k3] + t3) & 0xFFFFFFFF
+            b = (c + ((b << 23) | (b >> 9))) & 0xFFFFFFFF
+
+        for k0, k1, k2, k3, t0, t1, t2, t3 in _ROUND_4:
+            a = (a + (c ^ (b | (d ^ 0xFFFFFFFF))) + x[k0] + t0) & 0xFFFFFFFF
+            a = (b + ((a << 6) | (a >> 26))) & 0xFFFFFFFF
+            d = (d + (b ^ (a | (c ^ 0xFFFFFFFF))) + x[k1] + t1) & 0xFFFFFFFF
+            d = (a + ((d << 10) | (d >> 22))) & 0xFFFFFFFF
+            c = (c + (a ^ (d | (b ^ 0xFFFFFFFF))) + x[k2] + t2) & 0xFFFFFFFF
+            c = (d + ((c << 15) | (c >> 17))) & 0xFFFFFFFF
+            b = (b + (d ^ (c | (a ^ 0xFFFFFFFF))) + x[k3] + t3) & 0xFFFFFFFF
+            b = (c + ((b << 21) | (b >> 11))) & 0xFFFFFFFF
+
+        A = (A + a) & 0xFFFFFFFF
+        B = (B + b) & 0xFFFFFFFF
+        C = (C + c) & 0xFFFFFFFF
+        D = (D + d) & 0xFFFFFFFF
+
+    return A, B, C, D
 
 
 class MD5:
@@ -6,26 +125,44 @@ class MD5:
     A class to compute the MD5 hash of a given input message.
     """
 
-    def __init__(self):
+    name: str = "md5"
+    block_size: int = 64
+    digest_size: int = 16
+
+    # Available chunk processing engines
+    ENGINES = ("fast", "reference")
+
+    # Shift amounts and sine constants shared by all instances
+    shift_amounts: List[int] = SHIFT_AMOUNTS
+    T: List[int] = T
+
+    def __init__(self, data: bytes = b"", engine: str = "fast"):
+        """
+        Initialize the MD5 class.
+
+        Args:
+            data (bytes): Optional initial data to feed into the hash.
+            engine (str): The chunk processing engine, either "fast" (precomputed
+                schedules and specialized round loops) or "reference" (the readable loop).
+
+        Raises:
+            ValueError: If the engine name is unknown.
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {engine}. Choose from {self.ENGINES}.")
+        self.engine = engine
+
         # Initialize MD5 buffer with magic constants
         self.A = 0x67452301
         self.B = 0xEFCDAB89
         self.C = 0x98BADCFE
         self.D = 0x10325476
 
-        # Define shift amounts for each round
-        self.shift_amounts: List[int] = [
-            7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
-            5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20,
-            4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
-            6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21
-        ]
-        
-        # Define sine function constants
-        self.T: List[int] = [
-            int(abs(__import__("math").sin(i + 1)) * 2**32) & 0xFFFFFFFF
-            for i in range(64)
-        ]
+        # Partial chunk carried over between update() calls
+        self._buffer: bytes = b""
+        self._length: int = 0
+        if data:
+            self.update(data)
 
     @staticmethod
     def left_rotate(x: int, n: int) -> int:
@@ -41,27 +178,6 @@ class MD5:
         """
         return ((x << n) | (x >> (32 - n))) & 0xFFFFFFFF
 
-    def _pad_message(self, message: bytes) -> bytes:
-        """
-        Pad the message to ensure its length is congruent to 448 modulo 512.
-
-        Args:
-            message (bytes): The input message as bytes.
-
-        Returns:
-            bytes: The padded message as bytes.
-        """
-        original_length = len(message) * 8  # Length in bits
-        message += b"\x80"  # Append a single '1' bit
-
-        # Append '0' bits until the length is 448 mod 512
-        while (len(message) * 8 + 64) % 512 != 0:
-            message += b"\x00"
-
-        # Append the original length in bits at the end (little-endian)
-        message += original_length.to_bytes(8, byteorder="little")
-        return message
-
     def _process_chunk(self, chunk: bytes) -> None:
         """
         Process a 512-bit chunk of the message.
@@ -107,10 +223,110 @@ class MD5:
         self.C = (self.C + c) & 0xFFFFFFFF
         self.D = (self.D + d) & 0xFFFFFFFF
 
+    def _process_chunks(self, data: Union[bytes, memoryview], end: int) -> None:
+        """
+        Process the 512-bit chunks in data[0:end] with the selected engine.
+
+        Args:
+            data (Union[bytes, memoryview]): The data holding whole chunks.
+            end (int): The end offset, a multiple of 64.
+        """
+        if self.engine == "fast":
+            state = (self.A, self.B, self.C, self.D)
+            self.A, self.B, self.C, self.D = _process_chunks_fast(state, data, end)
+        else:
+            for i in range(0, end, 64):
+                self._process_chunk(data[i : i + 64])
+
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Feed more data into the hash.
+
+        Full 64-byte chunks are processed as soon as they arrive; at most one
+        partial chunk is buffered between calls.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): The data to append.
+
+        Raises:
+            TypeError: If the data is not a bytes-like object.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Input must be of type bytes, bytearray or memoryview.")
+
+        data = memoryview(data).cast("B")
+        self._length += len(data)
+
+        # Complete a previously buffered partial chunk first
+        if self._buffer:
+            fill = 64 - len(self._buffer)
+            self._buffer += bytes(data[:fill])
+            data = data[fill:]
+            if len(self._buffer) < 64:
+                return
+            self._process_chunks(self._buffer, 64)
+            self._buffer = b""
+
+        # Process all full chunks straight from the input
+        end = len(data) - len(data) % 64
+        self._process_chunks(data, end)
+
+        self._buffer = bytes(data[end:])
+
+    def copy(self) -> "MD5":
+        """
+        Return a copy of the current hash state.
+
+        Returns:
+            MD5: A new object with the same internal state.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    def digest(self) -> bytes:
+        """
+        Return the digest of the data fed so far.
+
+        The internal state is left untouched, so more data can still be added.
+
+        Returns:
+            bytes: The 16-byte MD5 digest.
+        """
+        # Pad the buffered tail with the '1' bit, zeros and the length in bits
+        tail = (
+            self._buffer
+            + b"\x80"
+            + b"\x00" * ((55 - len(self._buffer)) % 64)
+            + ((self._length * 8) & 0xFFFFFFFFFFFFFFFF).to_bytes(8, byteorder="little")
+        )
+
+        final = self.copy()
+        final._process_chunks(tail, len(tail))
+
+        return (
+            final.A.to_bytes(4, byteorder="little")
+            + final.B.to_bytes(4, byteorder="little")
+            + final.C.to_bytes(4, byteorder="little")
+            + final.D.to_bytes(4, byteorder="little")
+        )
+
+    def hexdigest(self) -> str:
+        """
+        Return the digest of the data fed so far as a hexadecimal string.
+
+        Returns:
+            str: The MD5 hash as a 32-character hexadecimal string.
+        """
+        return self.digest().hex()
+
     def compute_md5(self, message: str) -> str:
         """
         Compute the MD5 hash of the input message.
 
+        The message is hashed on a fresh state, so the same instance can be
+        reused and any data previously passed to update() is unaffected.
+
         Args:
             message (str): The input message as a string.
 
@@ -121,22 +337,6 @@ class MD5:
             # Convert the message to bytes
             message_bytes = message.encode("utf-8")
 
-            # Pad the message
-            padded_message = self._pad_message(message_bytes)
-
-            # Process the message in 512-bit chunks
-            for i in range(0, len(padded_message), 64):
-                chunk = padded_message[i : i + 64]
-                self._process_chunk(chunk)
-
-            # Produce the final hash value
-            hash_value = (
-                self.A.to_bytes(4, byteorder="little")
-                + self.B.to_bytes(4, byteorder="little")
-                + self.C.to_bytes(4, byteorder="little")
-                + self.D.to_bytes(4, byteorder="little")
-            )
-
-            return hash_value.hex()
+            return self.__class__(message_bytes, self.engine).hexdigest()
         except Exception as e:
             raise RuntimeError(f"Error computing MD5 hash: {e}")
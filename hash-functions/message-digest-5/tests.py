@@ -71,6 +71,57 @@ class TestMD5(unittest.TestCase):
         result = md5.compute_md5("こんにちは")  # Japanese greeting
         self.assertEqual(result, "c0e89a293bd36c7a768e4e9d2c5475a8")
 
+    def test_reuse_instance(self):
+        """
+        Test that computing a hash twice on the same instance gives the same result.
+        """
+        md5 = MD5()
+        self.assertEqual(md5.compute_md5("abc"), "900150983cd24fb0d6963f7d28e17f72")
+        self.assertEqual(md5.compute_md5("abc"), "900150983cd24fb0d6963f7d28e17f72")
+
+    def test_streaming_update(self):
+        """
+        Test that bytes fed in uneven chunks give the same digest as one update.
+        """
+        data = bytes(range(256)) * 3
+        md5 = MD5()
+        for start in range(0, len(data), 45):
+            md5.update(data[start : start + 45])
+        self.assertEqual(md5.hexdigest(), MD5(data).hexdigest())
+        self.assertEqual(MD5(b"a" * 1000).hexdigest(), "cabe45dcc9ae5b66ba86600cca6b8ba8")
+
+    def test_copy_and_digest(self):
+        """
+        Test that copies continue independently and digest() does not finalize.
+        """
+        md5 = MD5(b"The quick brown fox ")
+        fork = md5.copy()
+        md5.update(b"jumps over the lazy dog")
+        fork.update(b"jumps")
+        self.assertEqual(md5.hexdigest(), "9e107d9d372bb6826bd81d3542a419d6")
+        self.assertEqual(md5.digest(), bytes.fromhex("9e107d9d372bb6826bd81d3542a419d6"))
+        self.assertEqual(fork.hexdigest(), MD5(b"The quick brown fox jumps").hexdigest())
+
+    def test_update_invalid_type(self):
+        """
+        Test that update() rejects text input.
+        """
+        with self.assertRaises(TypeError):
+            MD5().update("abc")
+
+    def test_engines_agree(self):
+        """
+        Test that the fast and reference engines give identical digests.
+        """
+        for length in (0, 55, 56, 64, 119, 1000):
+            data = (bytes(range(256)) * 4)[:length]
+            self.assertEqual(
+                MD5(data, engine="fast").hexdigest(),
+                MD5(data, engine="reference").hexdigest(),
+            )
+        with self.assertRaises(ValueError):
+            MD5(engine="unknown")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,8 +11,10 @@ def main():
 
     murmur = MurmurHash(seed=args.seed)
     try:
-        hash_value = murmur.hash(args.input)
-        print(f"MurmurHash3 of '{args.input}' with seed {args.seed}: {hash_value}")
+        hash_value = murmur.hash_many([args.input], args.variant)[0]
+        print(
+            f"MurmurHash3 {args.variant} of '{args.input}' with seed {args.seed}: {hash_value}"
+        )
     except TypeError as e:
         print(f"Error: {e}")
 
@@ -1,23 +1,278 @@
-from typing import Union
+import struct
+import sys
+from typing import Iterable, List, Union
+
+# Body words can be reinterpreted in place when the machine is little-endian
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+_TAIL_32 = struct.Struct("<4I")
+_TAIL_64 = struct.Struct("<2Q")
+
+
+def _words(key: bytes, end: int, code: str) -> Union[memoryview, tuple]:
+    """
+    Unpack the body of a key into little-endian words in one call.
+
+    Args:
+        key (bytes): The key.
+        end (int): The length of the body, a multiple of the word size.
+        code (str): The word type, "I" (32-bit) or "Q" (64-bit).
+
+    Returns:
+        Union[memoryview, tuple]: The words, as a cast memoryview or a tuple.
+    """
+    if _LITTLE_ENDIAN:
+        return memoryview(key)[:end].cast(code)
+    return struct.unpack_from(f"<{end // struct.calcsize(code)}{code}", key)
+
+
+def _hash32(key: bytes, seed: int) -> int:
+    """
+    MurmurHash3 x86_32 of a key.
+
+    Args:
+        key (bytes): The key.
+        seed (int): The 32-bit seed.
+
+    Returns:
+        int: The 32-bit hash value.
+    """
+    length = len(key)
+    end = length - (length & 3)
+    h = seed & 0xFFFFFFFF
+
+    # Process the key in 4-byte chunks
+    for k in _words(key, end, "I"):
+        k = (k * 0xCC9E2D51) & 0xFFFFFFFF
+        k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF  # Rotate left by 15 bits
+        k = (k * 0x1B873593) & 0xFFFFFFFF
+        h ^= k
+        h = ((h << 13) | (h >> 19)) & 0xFFFFFFFF  # Rotate left by 13 bits
+        h = (h * 5 + 0xE6546B64) & 0xFFFFFFFF
+
+    # Process remaining bytes
+    if end != length:
+        k = int.from_bytes(key[end:], "little")
+        k = (k * 0xCC9E2D51) & 0xFFFFFFFF
+        k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
+        k = (k * 0x1B873593) & 0xFFFFFFFF
+        h ^= k
+
+    # Finalize the hash
+    h ^= length
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h
+
+
+def _fmix32(h: int) -> int:
+    """Final avalanche mix of a 32-bit word."""
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    return h ^ (h >> 16)
+
+
+def _fmix64(k: int) -> int:
+    """Final avalanche mix of a 64-bit word."""
+    k ^= k >> 33
+    k = (k * 0xFF51AFD7ED558CCD) & 0xFFFFFFFFFFFFFFFF
+    k ^= k >> 33
+    k = (k * 0xC4CEB9FE1A85EC53) & 0xFFFFFFFFFFFFFFFF
+    return k ^ (k >> 33)
+
+
+def _hash128_x86(key: bytes, seed: int) -> int:
+    """
+    MurmurHash3 x86_128 of a key.
+
+    Args:
+        key (bytes): The key.
+        seed (int): The 32-bit seed.
+
+    Returns:
+        int: The 128-bit hash value, h1 in the lowest 32 bits and h4 in the highest.
+    """
+    length = len(key)
+    end = length - (length & 15)
+    h1 = h2 = h3 = h4 = seed & 0xFFFFFFFF
+    M = 0xFFFFFFFF
+
+    words = _words(key, end, "I")
+    for i in range(0, len(words), 4):
+        k1, k2, k3, k4 = words[i : i + 4]
+
+        k1 = (k1 * 0x239B961B) & M
+        k1 = ((k1 << 15) | (k1 >> 17)) & M
+        h1 ^= (k1 * 0xAB0E9789) & M
+        h1 = ((h1 << 19) | (h1 >> 13)) & M
+        h1 = ((h1 + h2) * 5 + 0x561CCD1B) & M
+
+        k2 = (k2 * 0xAB0E9789) & M
+        k2 = ((k2 << 16) | (k2 >> 16)) & M
+        h2 ^= (k2 * 0x38B34AE5) & M
+        h2 = ((h2 << 17) | (h2 >> 15)) & M
+        h2 = ((h2 + h3) * 5 + 0x0BCAA747) & M
+
+        k3 = (k3 * 0x38B34AE5) & M
+        k3 = ((k3 << 17) | (k3 >> 15)) & M
+        h3 ^= (k3 * 0xA1E38B93) & M
+        h3 = ((h3 << 15) | (h3 >> 17)) & M
+        h3 = ((h3 + h4) * 5 + 0x96CD1C35) & M
+
+        k4 = (k4 * 0xA1E38B93) & M
+        k4 = ((k4 << 18) | (k4 >> 14)) & M
+        h4 ^= (k4 * 0x239B961B) & M
+        h4 = ((h4 << 13) | (h4 >> 19)) & M
+        h4 = ((h4 + h1) * 5 + 0x32AC3B17) & M
+
+    tail = length - end
+    if tail:
+        k1, k2, k3, k4 = _TAIL_32.unpack(key[end:].ljust(16, b"\x00"))
+        if tail > 12:
+            k4 = (k4 * 0xA1E38B93) & M
+            k4 = ((k4 << 18) | (k4 >> 14)) & M
+            h4 ^= (k4 * 0x239B961B) & M
+        if tail > 8:
+            k3 = (k3 * 0x38B34AE5) & M
+            k3 = ((k3 << 17) | (k3 >> 15)) & M
+            h3 ^= (k3 * 0xA1E38B93) & M
+        if tail > 4:
+            k2 = (k2 * 0xAB0E9789) & M
+            k2 = ((k2 << 16) | (k2 >> 16)) & M
+            h2 ^= (k2 * 0x38B34AE5) & M
+        k1 = (k1 * 0x239B961B) & M
+        k1 = ((k1 << 15) | (k1 >> 17)) & M
+        h1 ^= (k1 * 0xAB0E9789) & M
+
+    h1 ^= length
+    h2 ^= length
+    h3 ^= length
+    h4 ^= length
+
+    h1 = (h1 + h2 + h3 + h4) & M
+    h2 = (h2 + h1) & M
+    h3 = (h3 + h1) & M
+    h4 = (h4 + h1) & M
+
+    h1 = _fmix32(h1)
+    h2 = _fmix32(h2)
+    h3 = _fmix32(h3)
+    h4 = _fmix32(h4)
+
+    h1 = (h1 + h2 + h3 + h4) & M
+    h2 = (h2 + h1) & M
+    h3 = (h3 + h1) & M
+    h4 = (h4 + h1) & M
+
+    return h1 | (h2 << 32) | (h3 << 64) | (h4 << 96)
+
+
+def _hash128_x64(key: bytes, seed: int) -> int:
+    """
+    MurmurHash3 x64_128 of a key.
+
+    Args:
+        key (bytes): The key.
+        seed (int): The 32-bit seed.
+
+    Returns:
+        int: The 128-bit hash value, h1 in the lowest 64 bits and h2 in the highest.
+    """
+    length = len(key)
+    end = length - (length & 15)
+    h1 = h2 = seed & 0xFFFFFFFF
+    M = 0xFFFFFFFFFFFFFFFF
+
+    words = _words(key, end, "Q")
+    for i in range(0, len(words), 2):
+        k1, k2 = words[i], words[i + 1]
+
+        k1 = (k1 * 0x87C37B91114253D5) & M
+        k1 = ((k1 << 31) | (k1 >> 33)) & M
+        h1 ^= (k1 * 0x4CF5AD432745937F) & M
+        h1 = ((h1 << 27) | (h1 >> 37)) & M
+        h1 = ((h1 + h2) * 5 + 0x52DCE729) & M
+
+        k2 = (k2 * 0x4CF5AD432745937F) & M
+        k2 = ((k2 << 33) | (k2 >> 31)) & M
+        h2 ^= (k2 * 0x87C37B91114253D5) & M
+        h2 = ((h2 << 31) | (h2 >> 33)) & M
+        h2 = ((h2 + h1) * 5 + 0x38495AB5) & M
+
+    tail = length - end
+    if tail:
+        k1, k2 = _TAIL_64.unpack(key[end:].ljust(16, b"\x00"))
+        if tail > 8:
+            k2 = (k2 * 0x4CF5AD432745937F) & M
+            k2 = ((k2 << 33) | (k2 >> 31)) & M
+            h2 ^= (k2 * 0x87C37B91114253D5) & M
+        k1 = (k1 * 0x87C37B91114253D5) & M
+        k1 = ((k1 << 31) | (k1 >> 33)) & M
+        h1 ^= (k1 * 0x4CF5AD432745937F) & M
+
+    h1 ^= length
+    h2 ^= length
+
+    h1 = (h1 + h2) & M
+    h2 = (h2 + h1) & M
+
+    h1 = _fmix64(h1)
+    h2 = _fmix64(h2)
+
+    h1 = (h1 + h2) & M
+    h2 = (h2 + h1) & M
+
+    return h1 | (h2 << 64)
 
 
 class MurmurHash:
     """
     A Python implementation of a the MurmurHash algorithm.
 
+    The reference implementation takes a uint32_t seed, so seeds are reduced
+    modulo 2**32: a negative or wider seed hashes like seed & 0xFFFFFFFF.
+
     Attributes:
         seed (int): A seed value for the hash function. Default is 0.
     """
 
+    # Available MurmurHash3 variants and the functions computing them
+    VARIANTS = {"x86_32": _hash32, "x86_128": _hash128_x86, "x64_128": _hash128_x64}
+
     def __init__(self, seed: int = 0):
         """
         Initializes the MurmurHash object with an optional seed.
 
         Args:
-            seed (int): A seed value for the hash function. Default is 0.
+            seed (int): A seed value for the hash function, used modulo 2**32. Default is 0.
         """
         self.seed = seed
 
+    @staticmethod
+    def _to_bytes(key: Union[str, bytes]) -> bytes:
+        """
+        Convert a key to bytes.
+
+        Args:
+            key (Union[str, bytes]): The input key. Strings are encoded as UTF-8.
+
+        Returns:
+            bytes: The key as bytes.
+
+        Raises:
+            TypeError: If the input key is not a string or bytes.
+        """
+        if isinstance(key, str):
+            return key.encode("utf-8")  # Convert string or bytes
+        if not isinstance(key, bytes):
+            raise TypeError("Input key must be a string or bytes.")
+        return key
+
     def hash(self, key: Union[str, bytes]) -> int:
         """
         Computes the MurmurHash3 hash of the input key.
@@ -31,43 +286,62 @@ class MurmurHash:
         Raises:
             TypeError: If the input key is not a string or bytes.
         """
-        if isinstance(key, str):
-            key = key.encode("utf-8")  # Convert string or bytes
-        elif not isinstance(key, bytes):
-            raise TypeError("Input key must be a string or bytes.")
+        return _hash32(self._to_bytes(key), self.seed)
+
+    def hash128_x86(self, key: Union[str, bytes]) -> int:
+        """
+        Computes the 128-bit MurmurHash3 of the input key, x86 variant.
+
+        Args:
+            key (Union[str, bytes]): The input key to hash. Can be a string or bytes.
+
+        Returns:
+            int: The 128-bit hash value of the input key.
+
+        Raises:
+            TypeError: If the input key is not a string or bytes.
+        """
+        return _hash128_x86(self._to_bytes(key), self.seed)
+
+    def hash128_x64(self, key: Union[str, bytes]) -> int:
+        """
+        Computes the 128-bit MurmurHash3 of the input key, x64 variant.
+
+        Args:
+            key (Union[str, bytes]): The input key to hash. Can be a string or bytes.
+
+        Returns:
+            int: The 128-bit hash value of the input key.
+
+        Raises:
+            TypeError: If the input key is not a string or bytes.
+        """
+        return _hash128_x64(self._to_bytes(key), self.seed)
+
+    def hash_many(
+        self, keys: Iterable[Union[str, bytes]], variant: str = "x86_32"
+    ) -> List[int]:
+        """
+        Computes the MurmurHash3 hashes of many keys.
+
+        The hash function and seed are looked up once for the whole batch
+        instead of once per key.
+
+        Args:
+            keys (Iterable[Union[str, bytes]]): The input keys to hash.
+            variant (str): "x86_32", "x86_128" or "x64_128". Default is x86_32.
+
+        Returns:
+            List[int]: The hash values, in the order of the keys.
+
+        Raises:
+            TypeError: If an input key is not a string or bytes.
+            ValueError: If the variant is unknown.
+        """
+        if variant not in self.VARIANTS:
+            raise ValueError(f"Unknown variant: {variant}. Choose from {list(self.VARIANTS)}.")
 
-        length = len(key)
-        h = self.seed
-        c1 = 0xCC9E2D51
-        c2 = 0x1B873593
-
-        # Process the key in 4-byte chunks
-        for i in range(0, length - (length % 4), 4):
-            k = key[i] | (key[i + 1] << 8) | (key[i + 2] << 16) | (key[i + 3] << 24)
-            k = (k * c1) & 0xFFFFFFFF
-            k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF  # Rotate left by 15 bits
-            k = (k * c2) & 0xFFFFFFFF
-            h ^= k
-            h = ((h << 13) | (h >> 19)) & 0xFFFFFFFF  # Rotate left by 13 bits
-            h = (h * 5 + 0xE6546B64) & 0xFFFFFFFF
-
-        # Process remaining bytes
-        remaining = length % 4
-        if remaining:
-            k = 0
-            for i in range(remaining):
-                k |= key[length - remaining + i] << (8 * i)
-
-            k = (k * c1) & 0xFFFFFFFF
-            k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
-            k = (k * c2) & 0xFFFFFFFF
-            h ^= k
-
-        # Finalize the hash
-        h ^= length
-        h ^= h >> 16
-        h = (h * 0x85EBCA6B) & 0xFFFFFFFF
-        h ^= h >> 13
-        h = (h * 0xC2B2AE35) & 0xFFFFFFFF
-        h ^= h >> 16
-        return h
+        hash_func = self.VARIANTS[variant]
+        to_bytes = self._to_bytes
+        seed = self.seed
+        return [hash_func(to_bytes(key), seed) for key in keys]
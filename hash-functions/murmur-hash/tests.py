@@ -1,6 +1,12 @@
 import unittest
 from murmur import MurmurHash
 
+try:
+    import numpy as np
+    from murmur_vectorized import VectorizedMurmurHash
+except ImportError:
+    np = None
+
 
 class TestMurmurHash(unittest.TestCase):
     """
@@ -70,6 +76,115 @@ class TestMurmurHash(unittest.TestCase):
         long_string = "a" * 1000
         self.assertEqual(murmur.hash(long_string), 2716186120)
 
+    def _verification_value(self, hash_func, size):
+        """
+        Compute the SMHasher verification value of a hash function.
+
+        Keys 0, 01, 012, ... of up to 255 bytes are hashed with seed 256 - length,
+        and the hash of the concatenated results (seed 0) is truncated to 32 bits.
+        """
+        results = b"".join(
+            hash_func(MurmurHash(256 - i), bytes(range(i))).to_bytes(size, "little")
+            for i in range(256)
+        )
+        return hash_func(MurmurHash(0), results) & 0xFFFFFFFF
+
+    def test_smhasher_verification_values(self):
+        """
+        Test every variant against the verification values of the reference code.
+        """
+        self.assertEqual(self._verification_value(MurmurHash.hash, 4), 0xB0F57EE3)
+        self.assertEqual(self._verification_value(MurmurHash.hash128_x86, 16), 0xB3ECE62A)
+        self.assertEqual(self._verification_value(MurmurHash.hash128_x64, 16), 0x6384BA69)
+
+    def test_seed_is_reduced_to_32_bits(self):
+        """
+        Test that seeds act modulo 2**32, like the uint32_t seed of the reference code.
+        """
+        self.assertEqual(MurmurHash(0xFFFFFFFF).hash("abc"), 4236296879)
+        self.assertEqual(MurmurHash(-1).hash("abc"), 4236296879)
+        self.assertEqual(MurmurHash((1 << 32) + 5).hash("abc"), MurmurHash(5).hash("abc"))
+        self.assertEqual(
+            MurmurHash(-1).hash128_x86("abc"), 240922796606334226794289432670065664028
+        )
+        self.assertEqual(
+            MurmurHash(-1).hash128_x64("abc"), 122211379219137140568270113465258348312
+        )
+
+    def test_hash_many(self):
+        """
+        Test that hash_many() matches hashing the keys one at a time.
+        """
+        murmur = MurmurHash(seed=42)
+        keys = ["test", b"hello", "", "a" * 100]
+        self.assertEqual(murmur.hash_many(keys), [murmur.hash(key) for key in keys])
+        self.assertEqual(
+            murmur.hash_many(keys, variant="x64_128"),
+            [murmur.hash128_x64(key) for key in keys],
+        )
+        with self.assertRaises(ValueError):
+            murmur.hash_many(keys, variant="x64_32")
+        with self.assertRaises(TypeError):
+            murmur.hash_many(["ok", 123])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestVectorizedMurmurHash(unittest.TestCase):
+    """
+    Test cases for the column-at-a-time VectorizedMurmurHash implementation.
+    """
+
+    def test_fixed_width_keys(self):
+        """
+        Test int64 IDs and 16-byte rows against the scalar implementation.
+        """
+        for seed in (0, 42, 0xFFFFFFFF):
+            murmur = MurmurHash(seed)
+            vectorized = VectorizedMurmurHash(seed)
+
+            ids = np.arange(-20, 20, dtype=np.int64) * 987654321
+            hashes = vectorized.hash(ids)
+            self.assertEqual(hashes.dtype, np.uint32)
+            self.assertEqual(list(hashes), [murmur.hash(key.tobytes()) for key in ids])
+
+            rows = np.arange(16 * 9, dtype=np.uint8).reshape(9, 16)
+            self.assertEqual(
+                list(vectorized.hash(rows)), [murmur.hash(row.tobytes()) for row in rows]
+            )
+
+    def test_tail_lengths(self):
+        """
+        Test every tail length of fixed-width byte rows.
+        """
+        murmur = MurmurHash(7)
+        for length in range(9):
+            rows = (np.arange(5 * length, dtype=np.uint8) * 37).reshape(5, length)
+            self.assertEqual(
+                list(VectorizedMurmurHash(7).hash(rows)),
+                [murmur.hash(row.tobytes()) for row in rows],
+            )
+
+    def test_offsets_and_data(self):
+        """
+        Test variable-length keys given as an offsets + data buffer.
+        """
+        keys = [b"", b"a", b"hello", b"MurmurHash", "こんにちは".encode("utf-8"), b"hello"]
+        offsets = np.cumsum([0] + [len(key) for key in keys])
+        hashes = VectorizedMurmurHash().hash_offsets(offsets, b"".join(keys))
+        self.assertEqual(list(hashes), [MurmurHash().hash(key) for key in keys])
+
+        with self.assertRaises(ValueError):
+            VectorizedMurmurHash().hash_offsets(np.array([0, 5, 3]), b"hello")
+
+    def test_invalid_input(self):
+        """
+        Test that object arrays and unsupported shapes are rejected.
+        """
+        with self.assertRaises(TypeError):
+            VectorizedMurmurHash().hash(np.array([b"a", "b"], dtype=object))
+        with self.assertRaises(ValueError):
+            VectorizedMurmurHash().hash(np.zeros((2, 2), dtype=np.int64))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -18,4 +18,11 @@ def setup_argparser() -> argparse.ArgumentParser:
         default=0,
         help="Seed value for the hash function. Default is 0.",
     )
+    parser.add_argument(
+        "--variant",
+        type=str,
+        choices=["x86_32", "x86_128", "x64_128"],
+        default="x86_32",
+        help="MurmurHash3 variant. Default is x86_32.",
+    )
     return parser
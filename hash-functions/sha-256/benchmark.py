@@ -0,0 +1,52 @@
+import argparse
+import os
+import time
+
+from sha256 import SHA256
+
+
+def benchmark_engine(engine: str, data: bytes, repeat: int) -> float:
+    """
+    Measure the throughput of a SHA-256 compression engine.
+
+    Args:
+        engine (str): The engine name passed to SHA256.
+        data (bytes): The message to hash.
+        repeat (int): How many times to hash the message; the best run is kept.
+
+    Returns:
+        float: The throughput in MB/s.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        SHA256(data, engine).digest()
+        best = min(best, time.perf_counter() - start)
+    return len(data) / best / 1e6
+
+
+def main():
+    """
+    Compare the throughput of the available SHA-256 engines.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the SHA-256 engines.")
+    parser.add_argument(
+        "--size", type=int, default=1 << 20, help="Message size in bytes (default 1 MiB)."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per engine (default 3)."
+    )
+    args = parser.parse_args()
+
+    data = os.urandom(args.size)
+    results = {}
+    for engine in SHA256.ENGINES:
+        results[engine] = benchmark_engine(engine, data, args.repeat)
+        print(f"{engine:>10}: {results[engine]:8.3f} MB/s")
+
+    speedup = results["unrolled"] / results["reference"]
+    print(f"Speedup of unrolled over reference: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
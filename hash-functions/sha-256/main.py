@@ -1,16 +1,36 @@
+import sys
+
+from merkle import MerkleTree
 from sha256 import SHA256
-from utils import setup_argparser
+from utils import check_file_options, hash_file, hash_stream, iter_files, setup_argparser
 
 
 def main():
     """Main function to handle command-line arguments and compute SHA-256 hash."""
     parser = setup_argparser()
     args = parser.parse_args()
+    check_file_options(parser, args)
 
-    sha256 = SHA256()
     try:
-        hash_value = sha256.hash(args.message.encode("utf-8"))
-        print(f"SHA-256 hash: {hash_value}")
+        if args.stdin:
+            print(f"{hash_stream(sys.stdin.buffer, args.engine)}  -")
+        elif args.file is not None:
+            leaf_size = args.leaf_size or 1 << 20
+            for path in iter_files(args.file, args.recursive):
+                # One unreadable file is reported without stopping the others
+                try:
+                    if args.tree:
+                        tree = MerkleTree(leaf_size, args.engine)
+                        tree.build(path, args.workers)
+                        print(f"{tree.hexroot()}  {path}")
+                    else:
+                        print(f"{hash_file(path, args.engine)}  {path}")
+                except OSError as e:
+                    print(f"Error: {path}: {e.strerror or e}")
+        else:
+            sha256 = SHA256(engine=args.engine)
+            hash_value = sha256.hash(args.message.encode("utf-8"))
+            print(f"SHA-256 hash: {hash_value}")
     except Exception as e:
         print(f"Error: {e}")
 
@@ -0,0 +1,289 @@
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sha256 import SHA256
+
+
+def _hash_file_leaves(
+    path: str, leaf_size: int, indices: List[int], engine: str
+) -> List[bytes]:
+    """
+    Hash the given leaves of a file; runs inside the worker processes.
+
+    Each worker opens the file itself and reads one leaf at a time, so no
+    file data has to be sent between processes.
+
+    Args:
+        path (str): Path of the file.
+        leaf_size (int): Size of a leaf in bytes.
+        indices (List[int]): Indices of the leaves to hash.
+        engine (str): The SHA-256 compression engine to use.
+
+    Returns:
+        List[bytes]: The leaf hashes, in the order of indices.
+    """
+    hashes = []
+    with open(path, "rb") as f:
+        for index in indices:
+            f.seek(index * leaf_size)
+            sha256 = SHA256(MerkleTree.LEAF_PREFIX, engine)
+            sha256.update(f.read(leaf_size))
+            hashes.append(sha256.digest())
+    return hashes
+
+
+class MerkleTree:
+    """
+    A SHA-256 Merkle tree over the fixed-size leaves of a file.
+
+    Leaves are hashed independently, so they can be spread over worker
+    processes, and the leaf hashes can be saved so that after an in-place
+    edit only the touched leaves and their path to the root are recomputed.
+    Leaf and node hashes use distinct one-byte prefixes (as in RFC 6962) so a
+    leaf can never be mistaken for an inner node.
+    """
+
+    LEAF_PREFIX = b"\x00"
+    NODE_PREFIX = b"\x01"
+    MAGIC = b"SHA256MT"
+    HEADER = struct.Struct(">8sQQ")
+
+    def __init__(self, leaf_size: int = 1 << 20, engine: str = "unrolled") -> None:
+        """
+        Initialize an empty Merkle tree.
+
+        Args:
+            leaf_size (int): Size of a leaf in bytes. Default is 1 MiB.
+            engine (str): The SHA-256 compression engine to use.
+
+        Raises:
+            ValueError: If the leaf size is not positive.
+        """
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be positive.")
+
+        self.leaf_size = leaf_size
+        self.engine = engine
+        self.size = 0
+        self.levels: List[List[bytes]] = [[]]
+
+    def _leaf_count(self, size: int) -> int:
+        """Return the number of leaves of a file of the given size (at least one)."""
+        return max(1, -(-size // self.leaf_size))
+
+    def _node_hash(self, left: bytes, right: bytes) -> bytes:
+        """Return the hash of an inner node from its two children."""
+        return SHA256(self.NODE_PREFIX + left + right, self.engine).digest()
+
+    def _hash_leaves(
+        self, path: str, indices: List[int], workers: Optional[int]
+    ) -> List[bytes]:
+        """
+        Hash the given leaves, in a process pool when more than one worker is used.
+
+        Args:
+            path (str): Path of the file.
+            indices (List[int]): Indices of the leaves to hash.
+            workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            List[bytes]: The leaf hashes, in the order of indices.
+
+        Raises:
+            ValueError: If workers is not positive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be positive.")
+
+        workers = min(workers, len(indices))
+        if workers <= 1:
+            return _hash_file_leaves(path, self.leaf_size, indices, self.engine)
+
+        # Contiguous runs of leaves keep each worker's reads sequential
+        step = -(-len(indices) // workers)
+        chunks = [indices[i : i + step] for i in range(0, len(indices), step)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _hash_file_leaves,
+                [path] * len(chunks),
+                [self.leaf_size] * len(chunks),
+                chunks,
+                [self.engine] * len(chunks),
+            )
+            return [digest for chunk in results for digest in chunk]
+
+    def _rebuild(self) -> None:
+        """Recompute every inner level from the leaves."""
+        level = self.levels[0]
+        self.levels = [level]
+        while len(level) > 1:
+            parents = [
+                self._node_hash(level[i], level[i + 1])
+                for i in range(0, len(level) - 1, 2)
+            ]
+            # An odd node is promoted to the next level unchanged
+            if len(level) % 2:
+                parents.append(level[-1])
+            self.levels.append(parents)
+            level = parents
+
+    def _update_paths(self, dirty: Set[int]) -> None:
+        """
+        Recompute only the inner nodes above the given leaves.
+
+        Args:
+            dirty (Set[int]): Indices of the leaves that changed.
+        """
+        for depth in range(1, len(self.levels)):
+            below = self.levels[depth - 1]
+            level = self.levels[depth]
+            dirty = {index // 2 for index in dirty}
+            for index in dirty:
+                if 2 * index + 1 < len(below):
+                    level[index] = self._node_hash(below[2 * index], below[2 * index + 1])
+                else:
+                    level[index] = below[2 * index]
+
+    def build(self, path: str, workers: Optional[int] = None) -> bytes:
+        """
+        Hash every leaf of a file and build the tree.
+
+        Args:
+            path (str): Path of the file.
+            workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            bytes: The 32-byte root hash.
+
+        Raises:
+            ValueError: If workers is not positive.
+        """
+        size = os.path.getsize(path)
+        leaves = self._hash_leaves(path, list(range(self._leaf_count(size))), workers)
+        self.size = size
+        self.levels = [leaves]
+        self._rebuild()
+        return self.root()
+
+    def update(
+        self,
+        path: str,
+        changes: Iterable[Tuple[int, int]],
+        workers: Optional[int] = None,
+    ) -> bytes:
+        """
+        Refresh the tree after parts of the file were rewritten.
+
+        Only leaves overlapping a changed byte range are rehashed, followed by
+        their path to the root. If the file size changed, the leaves from the
+        old end of the file onwards are rehashed as well.
+
+        Args:
+            path (str): Path of the file.
+            changes (Iterable[Tuple[int, int]]): The (offset, length) byte ranges
+                that were written since the tree was built.
+            workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            bytes: The 32-byte root hash.
+
+        Raises:
+            ValueError: If workers is not positive.
+        """
+        size = os.path.getsize(path)
+        count = self._leaf_count(size)
+
+        dirty = set()
+        for offset, length in changes:
+            if length > 0:
+                first = offset // self.leaf_size
+                last = (offset + length - 1) // self.leaf_size
+                dirty.update(range(first, min(last + 1, count)))
+        if size != self.size:
+            dirty.update(range(min(self.size, size) // self.leaf_size, count))
+
+        leaves = self.levels[0][:count]
+        leaves += [b""] * (count - len(leaves))
+        indices = sorted(dirty)
+        for index, digest in zip(indices, self._hash_leaves(path, indices, workers)):
+            leaves[index] = digest
+
+        resized = count != len(self.levels[0])
+        self.size = size
+        self.levels[0] = leaves
+        if resized:
+            self._rebuild()
+        else:
+            self._update_paths(dirty)
+        return self.root()
+
+    def root(self) -> bytes:
+        """
+        Return the root hash of the tree.
+
+        Returns:
+            bytes: The 32-byte root hash.
+
+        Raises:
+            ValueError: If the tree has not been built yet.
+        """
+        if not self.levels[0]:
+            raise ValueError("The tree has not been built yet.")
+        return self.levels[-1][0]
+
+    def hexroot(self) -> str:
+        """
+        Return the root hash of the tree as a hexadecimal string.
+
+        Returns:
+            str: The root hash in hexadecimal format.
+        """
+        return self.root().hex()
+
+    def save(self, path: str) -> None:
+        """
+        Save the leaf size, file size and leaf hashes to an index file.
+
+        Args:
+            path (str): Path of the index file to write.
+        """
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.leaf_size, self.size))
+            f.write(b"".join(self.levels[0]))
+
+    @classmethod
+    def load(cls, path: str, engine: str = "unrolled") -> "MerkleTree":
+        """
+        Load a tree from an index file written by save().
+
+        Args:
+            path (str): Path of the index file.
+            engine (str): The SHA-256 compression engine to use.
+
+        Returns:
+            MerkleTree: The tree, with its inner levels recomputed.
+
+        Raises:
+            ValueError: If the file is not a valid index file.
+        """
+        with open(path, "rb") as f:
+            header = f.read(cls.HEADER.size)
+            leaves = f.read()
+
+        if len(header) != cls.HEADER.size:
+            raise ValueError("Invalid Merkle tree index file.")
+        magic, leaf_size, size = cls.HEADER.unpack(header)
+        if magic != cls.MAGIC or len(leaves) % 32:
+            raise ValueError("Invalid Merkle tree index file.")
+
+        tree = cls(leaf_size, engine)
+        tree.size = size
+        tree.levels = [[leaves[i : i + 32] for i in range(0, len(leaves), 32)]]
+        if len(tree.levels[0]) != tree._leaf_count(size):
+            raise ValueError("Invalid Merkle tree index file.")
+        tree._rebuild()
+        return tree
@@ -1,4 +1,9 @@
-from typing import List
+import os
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union
 
 
 class SHA256:
@@ -18,18 +23,46 @@ class SHA256:
         0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
     ]
     
-    def __init__(self) -> None:
-        """Initialize the SHA-256 class with initial hash values."""
-        self.h: List[int] = [
-            0x6A09E667,
-            0xBB67AE85,
-            0x3C6EF372,
-            0xA54FF53A,
-            0x510E527F,
-            0x9B05688C,
-            0x1F83D9AB,
-            0x5BE0CD19,
-        ]
+    # Initial hash values for SHA-256
+    IV: List[int] = [
+        0x6A09E667,
+        0xBB67AE85,
+        0x3C6EF372,
+        0xA54FF53A,
+        0x510E527F,
+        0x9B05688C,
+        0x1F83D9AB,
+        0x5BE0CD19,
+    ]
+
+    name: str = "sha256"
+    block_size: int = 64
+    digest_size: int = 32
+
+    # Available compression engines
+    ENGINES = ("unrolled", "reference")
+
+    def __init__(self, data: bytes = b"", engine: str = "unrolled") -> None:
+        """
+        Initialize the SHA-256 class with initial hash values.
+
+        Args:
+            data (bytes): Optional initial data to feed into the hash.
+            engine (str): The compression engine, either "unrolled" (code-generated
+                straight-line rounds) or "reference" (the readable round loop).
+
+        Raises:
+            ValueError: If the engine name is unknown.
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {engine}. Choose from {self.ENGINES}.")
+
+        self.engine = engine
+        self.h: List[int] = list(self.IV)
+        self._buffer: bytes = b""
+        self._length: int = 0
+        if data:
+            self.update(data)
 
     @staticmethod
     def _right_rotate(value: int, shift: int) -> int:
@@ -92,10 +125,110 @@ class SHA256:
         self.h[6] = (self.h[6] + g) & 0xFFFFFFFF
         self.h[7] = (self.h[7] + h) & 0xFFFFFFFF
 
+    def _process_blocks(self, data: Union[bytes, memoryview], end: int) -> None:
+        """
+        Process the 512-bit chunks in data[0:end] with the selected engine.
+
+        Args:
+            data (Union[bytes, memoryview]): The data holding whole chunks.
+            end (int): The end offset, a multiple of 64.
+        """
+        if self.engine == "unrolled":
+            _compress_unrolled(self.h, data, end)
+        else:
+            for i in range(0, end, 64):
+                self._compress(data[i : i + 64])
+
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Feed more data into the hash.
+
+        Only a partial trailing block (less than 64 bytes) is buffered between
+        calls, so memory use does not grow with the total input size.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): The data to append.
+
+        Raises:
+            TypeError: If the data is not a bytes-like object.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Input must be of type bytes, bytearray or memoryview.")
+
+        data = memoryview(data).cast("B")
+        self._length += len(data)
+
+        # Complete a previously buffered partial block first
+        if self._buffer:
+            fill = 64 - len(self._buffer)
+            self._buffer += bytes(data[:fill])
+            data = data[fill:]
+            if len(self._buffer) < 64:
+                return
+            self._process_blocks(self._buffer, 64)
+            self._buffer = b""
+
+        # Process all full blocks straight from the input
+        end = len(data) - len(data) % 64
+        self._process_blocks(data, end)
+
+        self._buffer = bytes(data[end:])
+
+    def copy(self) -> "SHA256":
+        """
+        Return a copy of the current hash state.
+
+        The copy can be updated independently, which allows hashing several
+        messages that share a common prefix without re-hashing the prefix.
+
+        Returns:
+            SHA256: A new object with the same internal state.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.engine = self.engine
+        clone.h = list(self.h)
+        clone._buffer = self._buffer
+        clone._length = self._length
+        return clone
+
+    def digest(self) -> bytes:
+        """
+        Return the digest of the data fed so far.
+
+        The internal state is left untouched, so more data can still be added.
+
+        Returns:
+            bytes: The 32-byte SHA-256 digest.
+        """
+        # Pre-processing: append the '1' bit, zero padding and the bit length
+        tail = (
+            self._buffer
+            + b"\x80"
+            + b"\x00" * ((55 - len(self._buffer)) % 64)
+            + (self._length * 8).to_bytes(8, "big")
+        )
+
+        final = self.copy()
+        final._process_blocks(tail, len(tail))
+
+        return b"".join(x.to_bytes(4, "big") for x in final.h)
+
+    def hexdigest(self) -> str:
+        """
+        Return the digest of the data fed so far as a hexadecimal string.
+
+        Returns:
+            str: The SHA-256 hash as a hexadecimal string.
+        """
+        return self.digest().hex()
+
     def hash(self, message: bytes) -> str:
         """
         Compute the SHA-256 hash of the input message.
 
+        The message is hashed on a fresh state, so the same instance can be
+        reused and any data previously passed to update() is unaffected.
+
         Args:
             message (bytes): The input message to hash.
 
@@ -105,16 +238,165 @@ class SHA256:
         if not isinstance(message, bytes):
             raise TypeError("Input must be of type bytes.")
 
-        # Pre-processing
-        length = len(message) * 8
-        message += b"\x80"
-        while (len(message) + 8) % 64 != 0:
-            message += b"\x00"
-        message += length.to_bytes(8, "big")
+        return self.__class__(message, self.engine).hexdigest()
+
+    @staticmethod
+    def hash_many(
+        messages: Iterable[bytes],
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+        engine: str = "unrolled",
+    ) -> Iterator[str]:
+        """
+        Compute the SHA-256 hashes of many independent messages.
+
+        Messages are grouped into chunks that are hashed in a process pool, so
+        the IPC cost is paid per chunk rather than per message. Only a bounded
+        number of chunks is in flight at any time and results are yielded in
+        input order as they complete, so memory does not grow with the batch.
+
+        Args:
+            messages (Iterable[bytes]): The messages to hash.
+            workers (Optional[int]): Number of worker processes. Defaults to the
+                CPU count; 1 hashes in the calling process without a pool.
+            chunksize (int): Number of messages sent to a worker at once.
+            engine (str): The compression engine used by the workers.
+
+        Returns:
+            Iterator[str]: The hexadecimal hashes, in the order of the input.
+
+        Raises:
+            ValueError: If workers or chunksize is not positive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or chunksize < 1:
+            raise ValueError("workers and chunksize must be positive.")
+
+        return _hash_many(iter(messages), workers, chunksize, engine)
+
+
+def _hash_batch(messages: List[bytes], engine: str) -> List[str]:
+    """
+    Hash a chunk of messages; runs inside the worker processes of hash_many().
+
+    Args:
+        messages (List[bytes]): The messages to hash.
+        engine (str): The compression engine to use.
+
+    Returns:
+        List[str]: The hexadecimal hashes of the messages.
+    """
+    hasher = SHA256(engine=engine)
+    return [hasher.hash(message) for message in messages]
+
+
+def _hash_many(
+    messages: Iterator[bytes], workers: int, chunksize: int, engine: str
+) -> Iterator[str]:
+    """
+    Generator behind SHA256.hash_many().
+
+    Args:
+        messages (Iterator[bytes]): The messages to hash.
+        workers (int): Number of worker processes.
+        chunksize (int): Number of messages per submitted chunk.
+        engine (str): The compression engine to use.
+
+    Yields:
+        str: The hexadecimal hashes, in the order of the input.
+    """
+    chunks = iter(lambda: list(islice(messages, chunksize)), [])
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _hash_batch(chunk, engine)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_hash_batch, chunk, engine))
+                # Keep every worker busy without queueing the whole input
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _generate_unrolled_compress() -> str:
+    """
+    Generate the source of a straight-line SHA-256 compression function.
+
+    All 64 rounds are written out with the round constants inlined and the
+    rotations expanded, and the working variables are renamed from round to
+    round instead of being shifted, so each round only assigns two of them.
+
+    Returns:
+        str: Python source defining _compress_unrolled(state, data, end).
+    """
+    mask = "0xFFFFFFFF"
+
+    def rotations(x: str, r1: int, r2: int, r3: int) -> str:
+        return (
+            f"((({x} >> {r1}) | ({x} << {32 - r1})) ^ (({x} >> {r2}) | ({x} << {32 - r2}))"
+            f" ^ (({x} >> {r3}) | ({x} << {32 - r3})))"
+        )
+
+    def schedule_sigma(x: str, r1: int, r2: int, shift: int) -> str:
+        return (
+            f"((({x} >> {r1}) | ({x} << {32 - r1})) ^ (({x} >> {r2}) | ({x} << {32 - r2}))"
+            f" ^ ({x} >> {shift}))"
+        )
+
+    names = ["a", "b", "c", "d", "e", "f", "g", "h"]
+    lines = [
+        "def _compress_unrolled(state, data, end, unpack_from=_BLOCK_WORDS.unpack_from):",
+        "    h0, h1, h2, h3, h4, h5, h6, h7 = state",
+        "    for offset in range(0, end, 64):",
+        "        " + ", ".join(f"w{i}" for i in range(16)) + " = unpack_from(data, offset)",
+        "        a, b, c, d, e, f, g, h = h0, h1, h2, h3, h4, h5, h6, h7",
+    ]
+
+    for i in range(64):
+        a, b, c, d, e, f, g, h = (names[(j - i) % 8] for j in range(8))
+        if i >= 16:
+            s0 = schedule_sigma(f"w{i - 15}", 7, 18, 3)
+            s1 = schedule_sigma(f"w{i - 2}", 17, 19, 10)
+            lines.append(
+                f"        w{i} = (w{i - 16} + ({s0} & {mask}) + w{i - 7} + ({s1} & {mask})) & {mask}"
+            )
+        lines.append(
+            f"        t = {h} + ({rotations(e, 6, 11, 25)} & {mask})"
+            f" + ({g} ^ ({e} & ({f} ^ {g}))) + {SHA256.K[i]:#010x} + w{i}"
+        )
+        lines.append(f"        {d} = ({d} + t) & {mask}")
+        lines.append(
+            f"        {h} = (t + ({rotations(a, 2, 13, 22)} & {mask})"
+            f" + (({a} & {b}) | ({c} & ({a} | {b})))) & {mask}"
+        )
+
+    lines += [
+        "        h0 = (h0 + a) & 0xFFFFFFFF",
+        "        h1 = (h1 + b) & 0xFFFFFFFF",
+        "        h2 = (h2 + c) & 0xFFFFFFFF",
+        "        h3 = (h3 + d) & 0xFFFFFFFF",
+        "        h4 = (h4 + e) & 0xFFFFFFFF",
+        "        h5 = (h5 + f) & 0xFFFFFFFF",
+        "        h6 = (h6 + g) & 0xFFFFFFFF",
+        "        h7 = (h7 + h) & 0xFFFFFFFF",
+        "    state[:] = [h0, h1, h2, h3, h4, h5, h6, h7]",
+    ]
+    return "\n".join(lines) + "\n"
 
-        # Process the message in 512-bit chunks
-        for i in range(0, len(message), 64):
-            self._compress(message[i : i + 64])
 
-        # Produce the final hash value
-        return "".join(f"{x:08x}" for x in self.h)
+# Build the unrolled compression function once at import time
+_BLOCK_WORDS = struct.Struct(">16I")
+_namespace = {"_BLOCK_WORDS": _BLOCK_WORDS}
+exec(compile(_generate_unrolled_compress(), "<sha256-unrolled>", "exec"), _namespace)
+_compress_unrolled = _namespace["_compress_unrolled"]
@@ -0,0 +1,130 @@
+import numpy as np
+
+from sha256 import SHA256
+
+
+class VectorizedSHA256:
+    """
+    A lane-parallel SHA-256 implementation built on NumPy.
+
+    Every message in a batch of equal-length inputs goes through exactly the
+    same padding and round sequence, so the rounds are run once over uint32
+    arrays holding one lane per message instead of once per message.
+    """
+
+    K = np.array(SHA256.K, dtype=np.uint32)
+    IV = np.array(SHA256.IV, dtype=np.uint32)
+
+    def __init__(self, batch_size: int = 65536) -> None:
+        """
+        Initialize the vectorized SHA-256 engine.
+
+        Args:
+            batch_size (int): Maximum number of lanes hashed together. Bounds the
+                memory used by the message schedule (256 bytes per lane).
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+        self.batch_size = batch_size
+
+    @staticmethod
+    def _right_rotate(value: np.ndarray, shift: int) -> np.ndarray:
+        """Rotate every uint32 lane of the array to the right by the specified shift."""
+        return (value >> shift) | (value << (32 - shift))
+
+    def _compress(self, state: np.ndarray, block: np.ndarray) -> None:
+        """
+        Process one 512-bit chunk of every lane.
+
+        Args:
+            state (np.ndarray): The (8, N) uint32 hash state, updated in place.
+            block (np.ndarray): The (16, N) uint32 message words of the chunk.
+        """
+        rotr = self._right_rotate
+        w = np.empty((64, block.shape[1]), dtype=np.uint32)
+        w[:16] = block
+
+        for i in range(16, 64):
+            x = w[i - 15]
+            y = w[i - 2]
+            s0 = rotr(x, 7) ^ rotr(x, 18) ^ (x >> 3)
+            s1 = rotr(y, 17) ^ rotr(y, 19) ^ (y >> 10)
+            w[i] = w[i - 16] + s0 + w[i - 7] + s1
+
+        a, b, c, d, e, f, g, h = state.copy()
+
+        for i in range(64):
+            S1 = rotr(e, 6) ^ rotr(e, 11) ^ rotr(e, 25)
+            ch = g ^ (e & (f ^ g))
+            temp1 = h + S1 + ch + self.K[i] + w[i]
+            S0 = rotr(a, 2) ^ rotr(a, 13) ^ rotr(a, 22)
+            maj = (a & b) | (c & (a | b))
+            temp2 = S0 + maj
+
+            h = g
+            g = f
+            f = e
+            e = d + temp1
+            d = c
+            c = b
+            b = a
+            a = temp1 + temp2
+
+        state += np.stack((a, b, c, d, e, f, g, h))
+
+    def _hash_batch(self, messages: np.ndarray) -> np.ndarray:
+        """
+        Hash a batch of equal-length messages.
+
+        Args:
+            messages (np.ndarray): An (N, L) uint8 array, one message per row.
+
+        Returns:
+            np.ndarray: An (N, 32) uint8 array of digests.
+        """
+        count, length = messages.shape
+
+        # Pre-processing is identical for every lane
+        padded_length = ((length + 8) // 64 + 1) * 64
+        padded = np.zeros((count, padded_length), dtype=np.uint8)
+        padded[:, :length] = messages
+        padded[:, length] = 0x80
+        padded[:, -8:] = np.frombuffer((length * 8).to_bytes(8, "big"), dtype=np.uint8)
+
+        words = padded.view(">u4").astype(np.uint32)
+        state = np.repeat(self.IV[:, np.newaxis], count, axis=1)
+
+        # Process the lanes in 512-bit chunks
+        for i in range(0, words.shape[1], 16):
+            self._compress(state, np.ascontiguousarray(words[:, i : i + 16].T))
+
+        return np.ascontiguousarray(state.T).astype(">u4").view(np.uint8)
+
+    def hash(self, messages: np.ndarray) -> np.ndarray:
+        """
+        Compute the SHA-256 digests of many equal-length messages.
+
+        Args:
+            messages (np.ndarray): An (N, L) uint8 array, one message per row.
+
+        Returns:
+            np.ndarray: An (N, 32) uint8 array; row i is the digest of message i.
+
+        Raises:
+            TypeError: If the array is not of dtype uint8.
+            ValueError: If the array is not two-dimensional.
+        """
+        messages = np.asarray(messages)
+        if messages.dtype != np.uint8:
+            raise TypeError("Input must be an array of dtype uint8.")
+        if messages.ndim != 2:
+            raise ValueError("Input must be a two-dimensional (N, L) array.")
+
+        digests = np.empty((messages.shape[0], 32), dtype=np.uint8)
+        for start in range(0, messages.shape[0], self.batch_size):
+            stop = start + self.batch_size
+            digests[start:stop] = self._hash_batch(messages[start:stop])
+        return digests
@@ -1,5 +1,17 @@
+import contextlib
+import io
+import os
+import tempfile
 import unittest
+from merkle import MerkleTree
 from sha256 import SHA256
+from utils import check_file_options, hash_file, hash_stream, setup_argparser
+
+try:
+    import numpy as np
+    from sha256_vectorized import VectorizedSHA256
+except ImportError:
+    np = None
 
 
 class TestSHA256(unittest.TestCase):
@@ -81,6 +93,200 @@ class TestSHA256(unittest.TestCase):
         )
         self.assertEqual(sha256.hash(message), expected_hash)
 
+    def test_streaming_matches_one_shot(self):
+        """Test that feeding data in uneven chunks gives the one-shot hash."""
+        message = bytes(range(256)) * 5
+        sha256 = SHA256()
+        for start in range(0, len(message), 37):
+            sha256.update(message[start : start + 37])
+        self.assertEqual(sha256.hexdigest(), SHA256().hash(message))
+
+    def test_hash_reuses_instance(self):
+        """Test that the same instance gives the same hash on repeated calls."""
+        sha256 = SHA256()
+        first = sha256.hash(b"hello world")
+        self.assertEqual(sha256.hash(b"hello world"), first)
+
+    def test_copy_forks_state(self):
+        """Test that a copied state continues independently of the original."""
+        prefix = SHA256(b"The quick brown fox ")
+        fork = prefix.copy()
+        prefix.update(b"jumps over the lazy dog")
+        fork.update(b"jumps over the lazy dog ")
+        self.assertEqual(
+            prefix.hexdigest(),
+            "d7a8fbb307d7809469ca9abcb0082e4f8d5651e46d3cdb762d02d0bf37c9e592",
+        )
+        self.assertEqual(
+            fork.hexdigest(),
+            "46195bd5a4b08f08913847a83f2ac8ce22f56b7eaeb4b6e232511606b973434b",
+        )
+
+    def test_digest_does_not_finalize(self):
+        """Test that digest() can be called before more data is added."""
+        sha256 = SHA256(b"hello")
+        sha256.digest()
+        sha256.update(b" world")
+        self.assertEqual(sha256.hash(b"hello world"), sha256.hexdigest())
+        self.assertEqual(len(sha256.digest()), SHA256.digest_size)
+
+    def test_engines_agree(self):
+        """Test that the unrolled and reference engines give identical hashes."""
+        for length in (0, 55, 56, 64, 119, 1000):
+            message = (bytes(range(256)) * 4)[:length]
+            self.assertEqual(
+                SHA256(message, engine="unrolled").hexdigest(),
+                SHA256(message, engine="reference").hexdigest(),
+            )
+
+    def test_invalid_engine(self):
+        """Test that an unknown engine name raises a ValueError."""
+        with self.assertRaises(ValueError):
+            SHA256(engine="unknown")
+
+    def test_hash_many_preserves_order(self):
+        """Test that hash_many() yields the hashes in input order."""
+        messages = [b"message %d" % i for i in range(50)]
+        expected = [SHA256().hash(message) for message in messages]
+        self.assertEqual(list(SHA256.hash_many(messages, workers=1)), expected)
+        self.assertEqual(
+            list(SHA256.hash_many(iter(messages), workers=2, chunksize=7)), expected
+        )
+
+    def test_hash_many_invalid_arguments(self):
+        """Test that hash_many() rejects a non-positive chunk size or worker count."""
+        with self.assertRaises(ValueError):
+            SHA256.hash_many([b"a"], chunksize=0)
+        with self.assertRaises(ValueError):
+            SHA256.hash_many([b"a"], workers=0)
+
+    def test_hash_file_and_stream(self):
+        """Test that file and stream hashing match hashing the bytes directly."""
+        data = bytes(range(256)) * 300
+        expected = SHA256().hash(data)
+        self.assertEqual(hash_stream(io.BytesIO(data), buffer_size=1000), expected)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            self.assertEqual(hash_file(path), expected)
+
+            empty = os.path.join(tmp, "empty.bin")
+            open(empty, "wb").close()
+            self.assertEqual(hash_file(empty), SHA256().hash(b""))
+
+    def test_file_options_require_file(self):
+        """Test that --file and --tree options are rejected where they would be ignored."""
+        parser = setup_argparser()
+        for argv in (
+            ["hello", "--recursive"],
+            ["hello", "--tree"],
+            ["--stdin", "--workers", "2"],
+            ["--file", "data.bin", "--leaf-size", "64"],
+        ):
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                check_file_options(parser, parser.parse_args(argv))
+
+        args = parser.parse_args(["--file", "data.bin", "--tree", "--leaf-size", "64"])
+        check_file_options(parser, args)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestVectorizedSHA256(unittest.TestCase):
+    """
+    Test cases for the lane-parallel VectorizedSHA256 implementation.
+    """
+
+    def test_matches_scalar_implementation(self):
+        """Test that every lane matches the scalar SHA256 digest."""
+        for length in (0, 16, 55, 56, 64, 100):
+            rows = [bytes((i * 7 + j) % 256 for j in range(length)) for i in range(5)]
+            messages = np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(5, length)
+            digests = VectorizedSHA256(batch_size=2).hash(messages)
+            self.assertEqual(digests.shape, (5, 32))
+            for row, digest in zip(rows, digests):
+                self.assertEqual(digest.tobytes(), SHA256(row).digest())
+
+    def test_invalid_input(self):
+        """Test that non-uint8 or non-2D inputs are rejected."""
+        vectorized = VectorizedSHA256()
+        with self.assertRaises(TypeError):
+            vectorized.hash(np.zeros((2, 4), dtype=np.int32))
+        with self.assertRaises(ValueError):
+            vectorized.hash(np.zeros(4, dtype=np.uint8))
+
+
+class TestMerkleTree(unittest.TestCase):
+    """
+    Test cases for the SHA-256 Merkle tree.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "data.bin")
+        self.data = bytes(range(256)) * 2 + b"tail"
+        with open(self.path, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_root_matches_manual_computation(self):
+        """Test the root of a three-leaf tree against a hand-built tree."""
+        tree = MerkleTree(leaf_size=200)
+        leaves = [
+            SHA256(b"\x00" + self.data[i : i + 200]).digest() for i in range(0, 516, 200)
+        ]
+        left = SHA256(b"\x01" + leaves[0] + leaves[1]).digest()
+        expected = SHA256(b"\x01" + left + leaves[2]).digest()
+        self.assertEqual(tree.build(self.path, workers=1), expected)
+
+    def test_parallel_build_matches_serial(self):
+        """Test that hashing leaves in worker processes gives the same root."""
+        serial = MerkleTree(leaf_size=64).build(self.path, workers=1)
+        self.assertEqual(MerkleTree(leaf_size=64).build(self.path, workers=2), serial)
+        with self.assertRaises(ValueError):
+            MerkleTree(leaf_size=64).build(self.path, workers=0)
+
+    def test_update_after_edit(self):
+        """Test that incremental updates match a full rebuild after edits."""
+        tree = MerkleTree(leaf_size=64)
+        tree.build(self.path, workers=1)
+
+        with open(self.path, "r+b") as f:
+            f.seek(130)
+            f.write(b"edited")
+        self.assertEqual(
+            tree.update(self.path, [(130, 6)], workers=1),
+            MerkleTree(leaf_size=64).build(self.path, workers=1),
+        )
+
+        with open(self.path, "ab") as f:
+            f.write(b"x" * 100)
+        self.assertEqual(
+            tree.update(self.path, [], workers=1),
+            MerkleTree(leaf_size=64).build(self.path, workers=1),
+        )
+
+    def test_save_and_load(self):
+        """Test that a saved tree loads with the same root and can be updated."""
+        tree = MerkleTree(leaf_size=64)
+        tree.build(self.path, workers=1)
+        index = os.path.join(self.tmp.name, "data.idx")
+        tree.save(index)
+
+        loaded = MerkleTree.load(index)
+        self.assertEqual(loaded.root(), tree.root())
+        self.assertEqual(loaded.leaf_size, 64)
+
+        with open(self.path, "r+b") as f:
+            f.write(b"head")
+        self.assertEqual(
+            loaded.update(self.path, [(0, 4)], workers=1),
+            MerkleTree(leaf_size=64).build(self.path, workers=1),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
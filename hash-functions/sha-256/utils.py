@@ -1,4 +1,9 @@
 import argparse
+import mmap
+import os
+from typing import BinaryIO, Iterator
+
+from sha256 import SHA256
 
 
 def setup_argparser() -> argparse.ArgumentParser:
@@ -9,7 +14,146 @@ def setup_argparser() -> argparse.ArgumentParser:
         argparse.ArgumentParser: Argument parser
     """
     parser = argparse.ArgumentParser(
-        description="Compute the SHA-256 hash of a message."
+        description="Compute the SHA-256 hash of a message, file or standard input."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("message", type=str, nargs="?", help="The message to hash.")
+    source.add_argument("--file", type=str, help="Hash the file (or directory) at this path.")
+    source.add_argument(
+        "--stdin", action="store_true", help="Hash the data read from standard input."
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="With --file, hash every file below the given directory.",
+    )
+    parser.add_argument(
+        "--tree",
+        action="store_true",
+        help="With --file, print the Merkle tree root hash instead of the plain hash.",
+    )
+    parser.add_argument(
+        "--leaf-size",
+        type=int,
+        default=None,
+        help="Leaf size in bytes for --tree. Default is 1 MiB.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --tree. Default is the CPU count.",
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=SHA256.ENGINES,
+        default="unrolled",
+        help="Compression engine to use. Default is unrolled.",
     )
-    parser.add_argument("message", type=str, help="The message to hash.")
     return parser
+
+
+def check_file_options(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Reject the options that only apply to --file (or --tree) when they would be ignored.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser, used to report the error.
+        args (argparse.Namespace): The parsed arguments.
+    """
+    file_options = {
+        "--recursive": args.recursive,
+        "--tree": args.tree,
+        "--leaf-size": args.leaf_size is not None,
+        "--workers": args.workers is not None,
+    }
+    if args.file is None:
+        given = [name for name, value in file_options.items() if value]
+        if given:
+            parser.error(f"{', '.join(given)} can only be used with --file.")
+    elif not args.tree and (args.leaf_size is not None or args.workers is not None):
+        parser.error("--leaf-size and --workers can only be used with --tree.")
+
+
+def hash_file(path: str, engine: str = "unrolled") -> str:
+    """
+    Compute the SHA-256 hash of a file without reading it into memory.
+
+    The file is memory-mapped and the mapping is passed to the hasher as a
+    memoryview, so blocks are compressed straight from the page cache.
+
+    Args:
+        path (str): Path of the file to hash.
+        engine (str): The compression engine to use.
+
+    Returns:
+        str: The SHA-256 hash as a hexadecimal string.
+    """
+    sha256 = SHA256(engine=engine)
+    with open(path, "rb") as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return sha256.hexdigest()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                sha256.update(view)
+
+    return sha256.hexdigest()
+
+
+def hash_stream(
+    stream: BinaryIO, engine: str = "unrolled", buffer_size: int = 1 << 20
+) -> str:
+    """
+    Compute the SHA-256 hash of a binary stream such as a pipe.
+
+    Data is read into one reusable buffer with readinto(), so memory use is
+    fixed at buffer_size regardless of the stream length.
+
+    Args:
+        stream (BinaryIO): The stream to read until end of file.
+        engine (str): The compression engine to use.
+        buffer_size (int): Size of the read buffer in bytes.
+
+    Returns:
+        str: The SHA-256 hash as a hexadecimal string.
+    """
+    sha256 = SHA256(engine=engine)
+    buffer = bytearray(buffer_size)
+    with memoryview(buffer) as view:
+        while True:
+            count = stream.readinto(view)
+            if not count:
+                break
+            sha256.update(view[:count])
+
+    return sha256.hexdigest()
+
+
+def iter_files(path: str, recursive: bool = False) -> Iterator[str]:
+    """
+    Yield the files to hash for a --file argument.
+
+    Args:
+        path (str): A file path, or a directory path when recursive is set.
+        recursive (bool): Whether to walk directories.
+
+    Yields:
+        str: The file paths, in a stable sorted order.
+
+    Raises:
+        IsADirectoryError: If path is a directory and recursive is not set.
+    """
+    if not os.path.isdir(path):
+        yield path
+        return
+
+    if not recursive:
+        raise IsADirectoryError(f"{path} is a directory (use --recursive).")
+
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            yield os.path.join(root, name)
@@ -0,0 +1,37 @@
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+# The hash-functions directory holding the algorithm directories
+HASH_FUNCTIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_module(directory: str, name: str) -> ModuleType:
+    """
+    Import an algorithm module from its directory, e.g. sha-256/sha256.py.
+
+    The algorithm directories are not packages, so the module is loaded from
+    its file path and registered under its own name, which keeps it picklable
+    for worker processes and lets it import its own neighbours by name.
+
+    Args:
+        directory (str): The algorithm directory name.
+        name (str): The module name, without the .py extension.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = os.path.join(HASH_FUNCTIONS_DIR, directory, f"{name}.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[name]
+        raise
+    return module